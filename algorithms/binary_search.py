@@ -0,0 +1,93 @@
+"""
+    - find index of target in a sorted array
+    - compare target with the middle element and keep searching only the half
+      which can hold it, by moving index bounds, the array is never sliced or copied
+    - finds the leftmost index when target occurs more than once
+    - batch search sorts the targets first, so every search starts where the
+      previous one ended and only searches the part of the array after it
+    - time complexity:
+        -- worst case: O(logn)
+        -- average case: O(logn)
+        -- batch of m targets: O(mlogm + mlogn)
+"""
+
+
+def lower_bound(nums: list[int], target: int, start: int = 0, stop: int | None = None) -> int:
+    """Index of the first element of nums[start:stop] not less than target.
+
+    Args:
+        nums (list[int]): Sorted array.
+        target (int): Element to find.
+        start (int, optional): First index searched. Defaults to 0.
+        stop (int | None, optional): Index after the last index searched.
+        Defaults to None, end of nums.
+
+    Returns:
+        int: Insertion point which keeps nums sorted, stop if every element is less.
+    """
+    low: int = start
+    high: int = len(nums) if stop is None else stop
+    while low < high:
+        middle: int = (low + high) // 2
+        if nums[middle] < target:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def binary_search(nums: list[int], target: int) -> int:
+    """Binary search.
+
+    Args:
+        nums (list[int]): Sorted array.
+        target (int): Element to find.
+
+    Returns:
+        int: Leftmost index of target, -1 if not found.
+    """
+    index: int = lower_bound(nums, target)
+    if index < len(nums) and nums[index] == target:
+        return index
+    return -1
+
+
+def batch_lower_bound(nums: list[int], targets: list[int]) -> list[int]:
+    """Insertion points of many targets.
+
+    Args:
+        nums (list[int]): Sorted array.
+        targets (list[int]): Elements to find, in any order.
+
+    Returns:
+        list[int]: Insertion point of every target, in the order of targets.
+    """
+    positions: list[int] = [0] * len(targets)
+    start: int = 0
+    for target_index in sorted(range(len(targets)), key=targets.__getitem__):
+        start = lower_bound(nums, targets[target_index], start)
+        positions[target_index] = start
+    return positions
+
+
+def batch_binary_search(nums: list[int], targets: list[int]) -> list[int]:
+    """Binary search of many targets.
+
+    Args:
+        nums (list[int]): Sorted array.
+        targets (list[int]): Elements to find, in any order.
+
+    Returns:
+        list[int]: Leftmost index of every target, -1 if not found, in the order of targets.
+    """
+    size: int = len(nums)
+    return [
+        index if index < size and nums[index] == target else -1
+        for index, target in zip(batch_lower_bound(nums, targets), targets)
+    ]
+
+
+if __name__ == "__main__":
+    nums = [1, 2, 2, 3, 5, 6, 6, 7, 8, 8, 8, 9]
+    print(binary_search(nums, 8))
+    print(batch_binary_search(nums, [9, 4, 2, 1]))
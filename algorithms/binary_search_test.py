@@ -0,0 +1,69 @@
+"""
+binary_search unit tests
+
+- lower_bound
+    - return the same insertion point as bisect_left, within start and stop too
+
+- binary_search
+    - return leftmost index of target, -1 if not found
+
+- batch_lower_bound / batch_binary_search
+    - return one result per target in the order of targets, same as single searches
+
+"""
+import random
+from bisect import bisect_left
+
+from binary_search import batch_binary_search, batch_lower_bound, binary_search, lower_bound
+
+
+def sorted_values(rng: random.Random, size: int) -> list[int]:
+    """sorted random values with duplicates
+    """
+    return sorted(rng.randrange(size // 2 + 1) for _ in range(size))
+
+
+# lower_bound()
+
+def test_lower_bound() -> None:
+    """return the same insertion point as bisect_left, within start and stop too
+    """
+    rng: random.Random = random.Random(24)
+    for size in (0, 1, 2, 3, 10, 101):
+        nums: list[int] = sorted_values(rng, size)
+        for target in range(-1, size // 2 + 2):
+            assert lower_bound(nums, target) == bisect_left(nums, target)
+            start: int = rng.randrange(size + 1)
+            stop: int = rng.randrange(start, size + 1)
+            assert lower_bound(nums, target, start, stop) == bisect_left(nums, target, start, stop)
+
+
+# binary_search()
+
+def test_binary_search() -> None:
+    """return leftmost index of target, -1 if not found
+    """
+    nums: list[int] = [1, 2, 2, 3, 5, 6, 6, 7, 8, 8, 8, 9]
+    assert binary_search(nums, 8) == 8
+    assert binary_search(nums, 2) == 1
+    assert binary_search(nums, 1) == 0
+    assert binary_search(nums, 9) == 11
+    assert binary_search(nums, 4) == -1
+    assert binary_search(nums, 0) == -1
+    assert binary_search(nums, 10) == -1
+    assert binary_search([], 1) == -1
+
+
+# batch_lower_bound() / batch_binary_search()
+
+def test_batch_search() -> None:
+    """return one result per target in the order of targets, same as single searches
+    """
+    rng: random.Random = random.Random(25)
+    for size in (0, 1, 7, 200):
+        nums: list[int] = sorted_values(rng, size)
+        targets: list[int] = [rng.randrange(-2, size // 2 + 3) for _ in range(50)]
+        assert batch_lower_bound(nums, targets) == [bisect_left(nums, target) for target in targets]
+        assert batch_binary_search(nums, targets) == [binary_search(nums, target)
+                                                      for target in targets]
+    assert batch_lower_bound([1, 2], []) == []
@@ -0,0 +1,14 @@
+"""
+pytest configuration of the algorithms folder
+
+- modules of this folder import each other by bare name, e.g.
+  `from introsort import introsort`, the same way they are run as scripts,
+  so the folder itself is put on sys.path before its tests are collected
+
+"""
+import sys
+from pathlib import Path
+
+ALGORITHMS_DIR: str = str(Path(__file__).resolve().parent)
+if ALGORITHMS_DIR not in sys.path:
+    sys.path.insert(0, ALGORITHMS_DIR)
@@ -0,0 +1,66 @@
+"""
+    - convert unsorted array to sorted array
+    - build a max heap in the array, then move the largest element to the end
+      and restore the heap on the remaining elements, n times
+    - sorts in place with O(1) extra memory, not stable
+    - time complexity:
+        -- worst case: O(nlogn)
+        -- average case: O(nlogn)
+"""
+
+def _sift_down(array: list[int], start: int, root: int, stop: int) -> None:
+    """Move element at root down the max heap stored in array[start:stop].
+
+    Args:
+        array (list[int]): Array holding the heap.
+        start (int): Index of the heap root.
+        root (int): Index of the element to move.
+        stop (int): Index after the last heap element.
+    """
+    element: int = array[root]
+    child: int = 2 * root - start + 1
+    while child < stop:
+        if child + 1 < stop and array[child] < array[child + 1]:
+            child += 1
+        if not element < array[child]:
+            break
+        array[root] = array[child]
+        root = child
+        child = 2 * root - start + 1
+    array[root] = element
+
+
+def heap_sort_range(array: list[int], start: int = 0, stop: int | None = None) -> None:
+    """Heap sort array[start:stop] in place, ascending.
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int, optional): First index of the range. Defaults to 0.
+        stop (int | None, optional): Index after the range. Defaults to None, end of array.
+    """
+    if stop is None:
+        stop = len(array)
+    for root in reversed(range(start, start + (stop - start) // 2)):
+        _sift_down(array, start, root, stop)
+    for end in range(stop - 1, start, -1):
+        array[start], array[end] = array[end], array[start]
+        _sift_down(array, start, start, end)
+
+
+def heap_sort(array: list[int]) -> list[int]:
+    """Heap sort.
+
+    Args:
+        array (list[int]): Unsorted array.
+
+    Returns:
+        list[int]: Sorted array.
+    """
+    sorted_array: list[int] = array[:]
+    heap_sort_range(sorted_array)
+    return sorted_array
+
+
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    print(heap_sort(array))
@@ -0,0 +1,78 @@
+"""
+heap_sort unit tests
+
+- heap_sort
+    - sort like sorted() for sorted, reverse-sorted, all-duplicate, organ-pipe,
+      random and empty inputs
+    - return a new list, input is not changed
+
+- heap_sort_range
+    - sort only array[start:stop] in place, also for a non-zero start
+    - leave the array unchanged for empty and single element ranges
+
+"""
+import random
+
+import pytest
+
+from heap_sort import heap_sort, heap_sort_range
+
+
+def shapes(size: int) -> dict[str, list[int]]:
+    """inputs of given size which often break heap and quick sorts
+    """
+    rng: random.Random = random.Random(size)
+    return {
+        "sorted": list(range(size)),
+        "reverse": list(range(size, 0, -1)),
+        "duplicates": [7] * size,
+        "organ_pipe": list(range(size // 2)) + list(range(size - size // 2, 0, -1)),
+        "random": [rng.randrange(-size, size + 1) for _ in range(size)],
+    }
+
+
+# heap_sort()
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 16, 257])
+def test_heap_sort(size: int) -> None:
+    """sort like sorted() for sorted, reverse-sorted, all-duplicate, organ-pipe,
+    random and empty inputs
+    """
+    for name, values in shapes(size).items():
+        assert heap_sort(values) == sorted(values), name
+
+def test_input_not_changed() -> None:
+    """return a new list, input is not changed
+    """
+    values: list[int] = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    original: list[int] = values[:]
+    result: list[int] = heap_sort(values)
+    assert result is not values
+    assert values == original
+
+
+# heap_sort_range()
+
+@pytest.mark.parametrize("start, stop", [(0, 40), (1, 40), (5, 23), (13, 14), (3, None)])
+def test_heap_sort_range(start: int, stop: int | None) -> None:
+    """sort only array[start:stop] in place, also for a non-zero start
+    """
+    for name, values in shapes(40).items():
+        array: list[int] = values[:]
+        end: int = len(array) if stop is None else stop
+        assert heap_sort_range(array, start, stop) is None
+        assert array[:start] == values[:start], name
+        assert array[start:end] == sorted(values[start:end]), name
+        assert array[end:] == values[end:], name
+
+def test_heap_sort_range_empty() -> None:
+    """leave the array unchanged for empty and single element ranges
+    """
+    array: list[int] = [3, 2, 1]
+    heap_sort_range(array, 2, 2)
+    heap_sort_range(array, 1, 2)
+    heap_sort_range(array, 3)
+    assert array == [3, 2, 1]
+    empty: list[int] = []
+    heap_sort_range(empty)
+    assert empty == []
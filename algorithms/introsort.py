@@ -0,0 +1,203 @@
+"""
+    - convert unsorted array to sorted array, in place
+    - quick sort without recursion: ranges still to sort are kept on an explicit stack,
+      the larger side of every partition is pushed and the smaller side is sorted next,
+      so the stack holds at most log2(n) ranges
+    - pivot is the median of first, middle and last element, or for large ranges
+      the median of three such medians (ninther), by default, the first or last
+      element of the range can be picked instead
+    - 3-way partition: elements less than, equal to and greater than the pivot,
+      equal elements are never looked at again, so duplicates cost nothing extra
+    - ranges of at most 16 elements are finished with insertion sort
+    - input which is already in ascending or descending order is detected in one pass
+      and finished without partitioning
+    - a range partitioned more than 2*log2(n) times is finished with heap sort,
+      which keeps the worst case at O(nlogn)
+    - not stable
+    - time complexity:
+        -- worst case: O(nlogn)
+        -- average case: O(nlogn)
+"""
+from collections.abc import Callable
+
+from heap_sort import heap_sort_range
+
+INSERTION_CUTOFF: int = 16
+NINTHER_THRESHOLD: int = 128
+
+
+def insertion_sort_range(array: list[int], start: int, stop: int) -> None:
+    """Insertion sort array[start:stop] in place.
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int): First index of the range.
+        stop (int): Index after the range.
+    """
+    for index in range(start + 1, stop):
+        element: int = array[index]
+        position: int = index - 1
+        while position >= start and element < array[position]:
+            array[position + 1] = array[position]
+            position -= 1
+        array[position + 1] = element
+
+
+def _median_of_three(first: int, second: int, third: int) -> int:
+    """Median of three elements.
+
+    Args:
+        first (int): First element.
+        second (int): Second element.
+        third (int): Third element.
+
+    Returns:
+        int: Median element.
+    """
+    if first < second:
+        if second < third:
+            return second
+        return third if first < third else first
+    if first < third:
+        return first
+    return third if second < third else second
+
+
+def choose_pivot(array: list[int], start: int, stop: int) -> int:
+    """Median of three, or ninther for large ranges, of array[start:stop].
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int): First index of the range.
+        stop (int): Index after the range.
+
+    Returns:
+        int: Pivot element.
+    """
+    last: int = stop - 1
+    middle: int = (start + last) // 2
+    if stop - start < NINTHER_THRESHOLD:
+        return _median_of_three(array[start], array[middle], array[last])
+    step: int = (stop - start) // 8
+    return _median_of_three(
+        _median_of_three(array[start], array[start + step], array[start + 2 * step]),
+        _median_of_three(array[middle - step], array[middle], array[middle + step]),
+        _median_of_three(array[last - 2 * step], array[last - step], array[last]),
+    )
+
+
+PIVOTS: dict[str, Callable[[list[int], int, int], int]] = {
+    "median3": choose_pivot,
+    "first": lambda array, start, stop: array[start],
+    "last": lambda array, start, stop: array[stop - 1],
+}
+
+
+def partition_3way(array: list[int], start: int, stop: int, pivot: int) -> tuple[int, int]:
+    """Partition array[start:stop] in place around pivot.
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int): First index of the range.
+        stop (int): Index after the range.
+        pivot (int): Pivot element.
+
+    Returns:
+        tuple[int, int]: Indexes less and greater, array[start:less] < pivot,
+        array[less:greater] == pivot and array[greater:stop] > pivot.
+    """
+    less: int = start
+    index: int = start
+    greater: int = stop
+    while index < greater:
+        element: int = array[index]
+        if element < pivot:
+            array[index] = array[less]
+            array[less] = element
+            less += 1
+            index += 1
+        elif pivot < element:
+            greater -= 1
+            array[index] = array[greater]
+            array[greater] = element
+        else:
+            index += 1
+    return less, greater
+
+
+def _presorted(array: list[int], start: int, stop: int) -> bool:
+    """Finish array[start:stop] if it is already ascending or descending.
+
+    Stops at the first element which breaks the order, so other input costs little.
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int): First index of the range.
+        stop (int): Index after the range.
+
+    Returns:
+        bool: True if the range is sorted now.
+    """
+    index: int = start + 1
+    while index < stop and not array[index] < array[index - 1]:
+        index += 1
+    if index == stop:
+        return True
+    if index > start + 1:
+        return False
+    while index < stop and not array[index - 1] < array[index]:
+        index += 1
+    if index < stop:
+        return False
+    low: int = start
+    high: int = stop - 1
+    while low < high:
+        array[low], array[high] = array[high], array[low]
+        low += 1
+        high -= 1
+    return True
+
+
+def introsort(array: list[int], start: int = 0, stop: int | None = None,
+              pivot: str = "median3") -> None:
+    """Sort array[start:stop] in place, ascending.
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int, optional): First index of the range. Defaults to 0.
+        stop (int | None, optional): Index after the range. Defaults to None, end of array.
+        pivot (str, optional): Pivot choice, "median3", "first" or "last".
+        Defaults to "median3".
+
+    Raises:
+        ValueError: If pivot is not a known pivot choice.
+    """
+    if pivot not in PIVOTS:
+        raise ValueError(f"unknown pivot {pivot!r}, expected one of {', '.join(PIVOTS)}")
+    pick_pivot: Callable[[list[int], int, int], int] = PIVOTS[pivot]
+    if stop is None:
+        stop = len(array)
+    if stop - start < 2 or _presorted(array, start, stop):
+        return
+    ranges: list[tuple[int, int, int]] = [(start, stop, 2 * (stop - start).bit_length())]
+    while ranges:
+        low, high, depth = ranges.pop()
+        while high - low > INSERTION_CUTOFF and depth > 0:
+            depth -= 1
+            less, greater = partition_3way(array, low, high, pick_pivot(array, low, high))
+            if less - low < high - greater:
+                ranges.append((greater, high, depth))
+                high = less
+            else:
+                ranges.append((low, less, depth))
+                low = greater
+        if high - low > INSERTION_CUTOFF:
+            heap_sort_range(array, low, high)
+        else:
+            insertion_sort_range(array, low, high)
+
+
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    introsort(array)
+    print(array)
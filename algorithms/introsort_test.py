@@ -0,0 +1,122 @@
+"""
+introsort unit tests
+
+- introsort
+    - sort sorted, reverse sorted, all duplicate, organ pipe, random and empty
+      input like sorted(), for every pivot choice
+    - sort only array[start:stop], leave the rest unchanged
+    - finish with heap sort when partitions get too deep
+    - raise ValueError for an unknown pivot choice
+
+- partition_3way
+    - split range into less than, equal to and greater than pivot
+
+- _presorted
+    - finish ascending and descending ranges, leave other ranges unchanged
+
+"""
+import random
+
+import pytest
+
+import introsort as introsort_module
+from introsort import PIVOTS, _presorted, introsort, partition_3way
+
+
+def shapes(size: int) -> dict[str, list[int]]:
+    """inputs which are hard for one pivot choice or another
+    """
+    rng: random.Random = random.Random(size)
+    half: int = size // 2
+    return {
+        "sorted": list(range(size)),
+        "reverse sorted": list(range(size, 0, -1)),
+        "all duplicate": [7] * size,
+        "organ pipe": list(range(half)) + list(range(size - half, 0, -1)),
+        "random": [rng.randrange(size // 4 + 1) for _ in range(size)],
+        "empty": [],
+    }
+
+
+# introsort()
+
+@pytest.mark.parametrize("pivot", list(PIVOTS))
+@pytest.mark.parametrize("size", [1, 2, 17, 300, 2000])
+def test_introsort_shapes(pivot: str, size: int) -> None:
+    """sort sorted, reverse sorted, all duplicate, organ pipe, random and empty input like sorted()
+    """
+    for name, values in shapes(size).items():
+        array: list[int] = values[:]
+        introsort(array, pivot=pivot)
+        assert array == sorted(values), name
+
+def test_introsort_range() -> None:
+    """sort only array[start:stop], leave the rest unchanged
+    """
+    rng: random.Random = random.Random(21)
+    for pivot in PIVOTS:
+        values: list[int] = [rng.randrange(50) for _ in range(500)]
+        array: list[int] = values[:]
+        introsort(array, 100, 400, pivot=pivot)
+        assert array[:100] == values[:100]
+        assert array[100:400] == sorted(values[100:400])
+        assert array[400:] == values[400:]
+
+def test_introsort_heap_sort_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """finish with heap sort when partitions get too deep
+    """
+    ranges: list[tuple[int, int]] = []
+    heap_sort_range = introsort_module.heap_sort_range
+
+    def counting_heap_sort_range(array: list[int], start: int, stop: int) -> None:
+        ranges.append((start, stop))
+        heap_sort_range(array, start, stop)
+
+    monkeypatch.setattr(introsort_module, "heap_sort_range", counting_heap_sort_range)
+    values: list[int] = list(range(2000))
+    values[0], values[-1] = values[-1], values[0]
+    array: list[int] = values[:]
+    introsort(array, pivot="first")
+    assert array == sorted(values)
+    assert ranges
+    assert all(0 <= start < stop <= len(values) for start, stop in ranges)
+
+def test_introsort_unknown_pivot() -> None:
+    """raise ValueError for an unknown pivot choice
+    """
+    array: list[int] = [3, 1, 2]
+    with pytest.raises(ValueError):
+        introsort(array, pivot="random")
+    assert array == [3, 1, 2]
+
+
+# partition_3way()
+
+def test_partition_3way() -> None:
+    """split range into less than, equal to and greater than pivot
+    """
+    values: list[int] = [9, 5, 1, 5, 7, 3, 5, 0, 8]
+    array: list[int] = values[:]
+    less, greater = partition_3way(array, 1, 8, 5)
+    assert array[0] == 9 and array[8] == 8
+    assert sorted(array[1:8]) == sorted(values[1:8])
+    assert all(element < 5 for element in array[1:less])
+    assert array[less:greater] == [5, 5, 5]
+    assert all(element > 5 for element in array[greater:8])
+
+
+# _presorted()
+
+def test_presorted() -> None:
+    """finish ascending and descending ranges, leave other ranges unchanged
+    """
+    ascending: list[int] = [1, 2, 2, 3]
+    assert _presorted(ascending, 0, 4) is True
+    assert ascending == [1, 2, 2, 3]
+    descending: list[int] = [0, 4, 3, 3, 1, 0]
+    assert _presorted(descending, 1, 5) is True
+    assert descending == [0, 1, 3, 3, 4, 0]
+    mixed: list[int] = [1, 3, 2, 4]
+    assert _presorted(mixed, 0, 4) is False
+    assert mixed == [1, 3, 2, 4]
+    assert _presorted([2, 1, 3], 0, 3) is False
@@ -1,16 +1,253 @@
 """
     - convert unsorted array to sorted array
-    - divide and conquer
+    - divide and conquer, bottom up: no recursion, sorted runs are merged pairwise
+      pass after pass until one run is left
+    - natural runs: ascending runs already in the input are used as they are,
+      strictly descending runs are reversed, short runs are extended to MIN_RUN
+      elements with insertion sort
+    - one auxiliary buffer of n elements is allocated once, every pass merges from
+      one list into the other and the two swap roles
+    - stable: equal elements keep their order
     - time complexity:
-        -- worst case: O(n^2)
-            --- worst case is when pivot is always the smallest or largest element
-            --- worst case is when the array is sorted
+        -- worst case: O(nlogn)
         -- average case: O(nlogn)
+        -- best case: O(n) for input which is already sorted
+    - external sort: input larger than memory is cut into chunks, every chunk is
+      sorted and written to a temporary run file, then the run files are merged
+      with a heap (k-way merge) and the result is yielded one element at a time
 """
+import heapq
+import os
+import tempfile
+from array import array as typed_array
+from collections.abc import Iterable, Iterator
+from itertools import islice
 
-def merge_sort(array: list[int]) -> list[int]:    
-    pass
+MIN_RUN: int = 32
+# elements per sorted chunk of external_sort
+CHUNK_SIZE: int = 1 << 20
+# largest number of run files merged at once
+FAN_IN: int = 64
+# elements read from a run file at a time
+READ_SIZE: int = 1 << 13
 
-array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
-# array = [6, 3, 1, 9, 7, 2, 8]
-print(merge_sort(array))
+
+def _insertion_sort(array: list[int], start: int, sorted_stop: int, stop: int) -> None:
+    """Extend sorted array[start:sorted_stop] to sorted array[start:stop], stable.
+
+    Args:
+        array (list[int]): Array to sort.
+        start (int): First index of the range.
+        sorted_stop (int): Index after the part which is already sorted.
+        stop (int): Index after the range.
+    """
+    for index in range(sorted_stop, stop):
+        element: int = array[index]
+        position: int = index - 1
+        while position >= start and element < array[position]:
+            array[position + 1] = array[position]
+            position -= 1
+        array[position + 1] = element
+
+
+def _find_runs(array: list[int]) -> list[int]:
+    """Cut array into sorted runs of at least MIN_RUN elements, except the last one.
+
+    Args:
+        array (list[int]): Array to sort, runs are sorted in place.
+
+    Returns:
+        list[int]: Run boundaries, 0 first and len(array) last.
+    """
+    size: int = len(array)
+    bounds: list[int] = [0]
+    start: int = 0
+    while start < size:
+        stop: int = start + 1
+        if stop < size and array[stop] < array[stop - 1]:
+            # strictly descending only, reversing equal elements would break stability
+            while stop < size and array[stop] < array[stop - 1]:
+                stop += 1
+            array[start:stop] = array[start:stop][::-1]
+        else:
+            while stop < size and not array[stop] < array[stop - 1]:
+                stop += 1
+        if stop - start < MIN_RUN:
+            extended_stop: int = min(start + MIN_RUN, size)
+            _insertion_sort(array, start, stop, extended_stop)
+            stop = extended_stop
+        bounds.append(stop)
+        start = stop
+    return bounds
+
+
+def _merge(source: list[int], target: list[int], start: int, middle: int, stop: int) -> None:
+    """Merge sorted source[start:middle] and source[middle:stop] into target[start:stop].
+
+    Args:
+        source (list[int]): List holding the two runs.
+        target (list[int]): List receiving the merged run.
+        start (int): First index of the left run.
+        middle (int): First index of the right run.
+        stop (int): Index after the right run.
+    """
+    left: int = start
+    right: int = middle
+    index: int = start
+    if middle < stop and not source[middle] < source[middle - 1]:
+        # runs are already in order
+        target[start:stop] = source[start:stop]
+        return
+    while left < middle and right < stop:
+        if source[right] < source[left]:
+            target[index] = source[right]
+            right += 1
+        else:
+            target[index] = source[left]
+            left += 1
+        index += 1
+    if left < middle:
+        target[index:stop] = source[left:middle]
+    else:
+        target[index:stop] = source[right:stop]
+
+
+def merge_sort(array: list[int]) -> list[int]:
+    """Bottom up natural merge sort.
+
+    Args:
+        array (list[int]): Unsorted array.
+
+    Returns:
+        list[int]: Sorted array.
+    """
+    source: list[int] = array[:]
+    if len(source) < 2:
+        return source
+    bounds: list[int] = _find_runs(source)
+    target: list[int] = [0] * len(source)
+    while len(bounds) > 2:
+        merged_bounds: list[int] = [0]
+        for index in range(0, len(bounds) - 1, 2):
+            start: int = bounds[index]
+            middle: int = bounds[index + 1]
+            stop: int = bounds[index + 2] if index + 2 < len(bounds) else middle
+            _merge(source, target, start, middle, stop)
+            merged_bounds.append(stop)
+        source, target = target, source
+        bounds = merged_bounds
+    return source
+
+
+def _write_run(values: Iterable[int], directory: str) -> str:
+    """Write sorted values to a new run file as int64.
+
+    Args:
+        values (Iterable[int]): Sorted values.
+        directory (str): Directory for the file.
+
+    Returns:
+        str: Path of the run file.
+    """
+    descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(descriptor, "wb") as run_file:
+        while True:
+            block: typed_array = typed_array("q", islice(values, READ_SIZE))
+            if not block:
+                break
+            block.tofile(run_file)
+    return path
+
+
+def _read_run(path: str) -> Iterator[int]:
+    """Yield values of a run file, READ_SIZE at a time.
+
+    Args:
+        path (str): Path of the run file.
+
+    Yields:
+        int: Next value of the run.
+    """
+    with open(path, "rb") as run_file:
+        while True:
+            block: typed_array = typed_array("q")
+            try:
+                block.fromfile(run_file, READ_SIZE)
+            except EOFError:
+                # fromfile keeps the values read before the end of the file
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def external_sort(values: Iterable[int], chunk_size: int = CHUNK_SIZE,
+                  fan_in: int = FAN_IN, temp_dir: str | None = None) -> Iterator[int]:
+    """Sort int64 values which do not fit in memory, in ascending order.
+
+    At most chunk_size values, plus one read buffer per merged run, are in memory at once.
+    Run files are deleted when the returned iterator finishes or is closed.
+    Chunks are sorted with merge_sort, so a chunk costs about three lists of chunk_size.
+    Arguments are checked when called, values are only read once iteration starts.
+
+    Args:
+        values (Iterable[int]): Unsorted values, each must fit in int64.
+        chunk_size (int, optional): Values sorted in memory at a time. Defaults to CHUNK_SIZE.
+        fan_in (int, optional): Largest number of runs merged at once. Defaults to FAN_IN.
+        temp_dir (str | None, optional): Directory for run files. Defaults to None,
+        the system temporary directory.
+
+    Returns:
+        Iterator[int]: Values in ascending order.
+
+    Raises:
+        ValueError: If chunk_size is less than 1 or fan_in is less than 2.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+    return _external_sort(values, chunk_size, fan_in, temp_dir)
+
+
+def _external_sort(values: Iterable[int], chunk_size: int,
+                   fan_in: int, temp_dir: str | None) -> Iterator[int]:
+    """Generator behind external_sort.
+
+    Args:
+        values (Iterable[int]): Unsorted values, each must fit in int64.
+        chunk_size (int): Values sorted in memory at a time, at least 1.
+        fan_in (int): Largest number of runs merged at once, at least 2.
+        temp_dir (str | None): Directory for run files, None for the system one.
+
+    Yields:
+        int: Next value in ascending order.
+    """
+    iterator: Iterator[int] = iter(values)
+    chunk: list[int] = merge_sort(list(islice(iterator, chunk_size)))
+    if len(chunk) < chunk_size:
+        # everything fit in one chunk, no run files needed
+        yield from chunk
+        return
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs: list[str] = []
+        while chunk:
+            runs.append(_write_run(iter(chunk), directory))
+            chunk = []
+            chunk = merge_sort(list(islice(iterator, chunk_size)))
+        while len(runs) > fan_in:
+            merged_runs: list[str] = []
+            for index in range(0, len(runs), fan_in):
+                group: list[str] = runs[index:index + fan_in]
+                merged_runs.append(
+                    _write_run(heapq.merge(*[_read_run(path) for path in group]), directory))
+                for path in group:
+                    os.remove(path)
+            runs = merged_runs
+        yield from heapq.merge(*[_read_run(path) for path in runs])
+
+
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    print(merge_sort(array))
+    print(list(external_sort(array, chunk_size=4, fan_in=2)))
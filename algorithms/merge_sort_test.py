@@ -0,0 +1,131 @@
+"""
+merge_sort unit tests
+
+- merge_sort
+    - sort like sorted(), return a new list, input is not changed
+    - stable: equal elements keep their order, also inside descending runs
+    - use ascending and strictly descending runs of the input as they are
+
+- external_sort
+    - sort values cut into several run files like sorted()
+    - merge runs in groups when there are more runs than fan_in
+    - delete run files when finished or closed early
+    - raise ValueError for chunk_size less than 1 or fan_in less than 2
+
+"""
+import os
+import random
+
+import pytest
+
+import merge_sort as merge_sort_module
+from merge_sort import MIN_RUN, _find_runs, external_sort, merge_sort
+
+
+class Record:
+    """value compared by key only, to tell equal elements apart
+    """
+
+    def __init__(self, key: int, label: int) -> None:
+        self.key = key
+        self.label = label
+
+    def __lt__(self, other: "Record") -> bool:
+        return self.key < other.key
+
+
+# merge_sort()
+
+def test_merge_sort() -> None:
+    """sort like sorted(), return a new list, input is not changed
+    """
+    rng: random.Random = random.Random(22)
+    for size in (0, 1, 2, 31, 32, 33, 500, 3000):
+        values: list[int] = [rng.randrange(-50, 50) for _ in range(size)]
+        original: list[int] = values[:]
+        sorted_values: list[int] = merge_sort(values)
+        assert sorted_values == sorted(values)
+        assert sorted_values is not values
+        assert values == original
+
+def test_merge_sort_stable() -> None:
+    """stable: equal elements keep their order, also inside descending runs
+    """
+    rng: random.Random = random.Random(5)
+    records: list[Record] = [Record(rng.randrange(10), label) for label in range(2000)]
+    descending: list[Record] = [Record(key, label)
+                                for label, key in enumerate([9, 9, 8, 7, 7, 7, 5] * 20)]
+    for values in (records, descending, records[::-1] + descending):
+        result: list[Record] = merge_sort(values)
+        expected: list[Record] = sorted(values, key=lambda record: record.key)
+        assert [record.label for record in result] == [record.label for record in expected]
+
+def test_merge_sort_natural_runs() -> None:
+    """use ascending and strictly descending runs of the input as they are
+    """
+    ascending: list[int] = list(range(100))
+    descending: list[int] = list(range(50, -150, -1))
+    array: list[int] = ascending + descending
+    assert _find_runs(array) == [0, 100, 300]
+    assert array == ascending + sorted(descending)
+    assert merge_sort(list(range(1000))) == list(range(1000))
+    assert merge_sort(list(range(1000, 0, -1))) == list(range(1, 1001))
+    short: list[int] = [3, 1, 2] * 20
+    bounds: list[int] = _find_runs(short)
+    assert bounds == [0, MIN_RUN, len(short)]
+    assert short[:MIN_RUN] == sorted(([3, 1, 2] * 20)[:MIN_RUN])
+
+
+# external_sort()
+
+def test_external_sort_runs(tmp_path) -> None:
+    """sort values cut into several run files like sorted()
+    """
+    rng: random.Random = random.Random(7)
+    values: list[int] = [rng.randrange(-(1 << 40), 1 << 40) for _ in range(1000)]
+    assert list(external_sort(values, chunk_size=100, temp_dir=str(tmp_path))) == sorted(values)
+    assert list(external_sort(iter(values), chunk_size=1000)) == sorted(values)
+    assert list(external_sort(values[:10], chunk_size=3, fan_in=2)) == sorted(values[:10])
+    assert list(external_sort([], chunk_size=1)) == []
+    assert not os.listdir(tmp_path)
+
+def test_external_sort_grouped_merge(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """merge runs in groups when there are more runs than fan_in
+    """
+    written: list[str] = []
+    write_run = merge_sort_module._write_run
+
+    def counting_write_run(values, directory: str) -> str:
+        path: str = write_run(values, directory)
+        written.append(path)
+        return path
+
+    monkeypatch.setattr(merge_sort_module, "_write_run", counting_write_run)
+    rng: random.Random = random.Random(8)
+    values: list[int] = [rng.randrange(100) for _ in range(1000)]
+    result: list[int] = list(external_sort(values, chunk_size=100, fan_in=3,
+                                           temp_dir=str(tmp_path)))
+    assert result == sorted(values)
+    # 10 runs, merged into 4 and then into 2 before the final merge
+    assert len(written) == 10 + 4 + 2
+    assert not os.listdir(tmp_path)
+
+def test_external_sort_close(tmp_path) -> None:
+    """delete run files when finished or closed early
+    """
+    sorted_values = external_sort(range(500, 0, -1), chunk_size=50, temp_dir=str(tmp_path))
+    assert next(sorted_values) == 1
+    assert os.listdir(tmp_path)
+    sorted_values.close()
+    assert not os.listdir(tmp_path)
+
+def test_external_sort_arguments() -> None:
+    """raise ValueError for chunk_size less than 1 or fan_in less than 2
+    """
+    with pytest.raises(ValueError):
+        external_sort([3, 1, 2], chunk_size=0)
+    with pytest.raises(ValueError):
+        external_sort([3, 1, 2], chunk_size=-1)
+    with pytest.raises(ValueError):
+        external_sort([3, 1, 2], chunk_size=1, fan_in=1)
+    assert list(external_sort([3, 1, 2], chunk_size=1, fan_in=2)) == [1, 2, 3]
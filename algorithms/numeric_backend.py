@@ -0,0 +1,205 @@
+"""
+    - optional NumPy backend for numeric sort and search
+    - NumPy arrays, and int lists of at least NUMPY_THRESHOLD elements whose values
+      all fit in int64, are handed to vectorized NumPy kernels
+    - everything else, and everything when NumPy is not installed, goes to the
+      pure python algorithms of this folder
+    - both paths return the same values: lists in, lists out, NumPy arrays in,
+      NumPy arrays out
+    - argsort is stable on both paths, equal elements keep their order
+"""
+from introsort import introsort
+from binary_search import batch_binary_search, batch_lower_bound
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+NUMPY_THRESHOLD: int = 10_000
+INT64_MIN: int = -(1 << 63)
+INT64_MAX: int = (1 << 63) - 1
+
+
+def numpy_available() -> bool:
+    """Check if NumPy can be used.
+
+    Returns:
+        bool: True if NumPy is installed.
+    """
+    return np is not None
+
+
+def fits_int64(values: list[int]) -> bool:
+    """Check if every element is an int which fits in int64.
+
+    Args:
+        values (list[int]): Values to check.
+
+    Returns:
+        bool: True if values can be stored as int64 without changing them.
+    """
+    for value in values:
+        if type(value) is not int or not INT64_MIN <= value <= INT64_MAX:  # pylint: disable=unidiomatic-typecheck
+            return False
+    return True
+
+
+def _is_numpy_array(values: object) -> bool:
+    """Check if values is a NumPy array of numbers.
+
+    Args:
+        values (object): Values to check.
+
+    Returns:
+        bool: True for an int, unsigned or float NumPy array.
+    """
+    return np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iuf"
+
+
+def _use_numpy(values: object, threshold: int) -> bool:
+    """Check if values should go to NumPy.
+
+    Args:
+        values (object): List or NumPy array.
+        threshold (int): Smallest list handed to NumPy.
+
+    Returns:
+        bool: True for NumPy arrays and for large int64 lists when NumPy is installed.
+    """
+    if np is None:
+        return False
+    if _is_numpy_array(values):
+        return True
+    return isinstance(values, list) and len(values) >= threshold and fits_int64(values)
+
+
+def sort(values: list[int], threshold: int = NUMPY_THRESHOLD) -> list[int]:
+    """Sorted copy of values.
+
+    Args:
+        values (list[int]): Unsorted list or NumPy array.
+        threshold (int, optional): Smallest list handed to NumPy. Defaults to NUMPY_THRESHOLD.
+
+    Returns:
+        list[int]: Sorted list, or NumPy array for NumPy input.
+    """
+    if _use_numpy(values, threshold):
+        if _is_numpy_array(values):
+            return np.sort(values)
+        return np.sort(np.array(values, dtype=np.int64)).tolist()
+    sorted_values: list[int] = list(values)
+    introsort(sorted_values)
+    return sorted_values
+
+
+def argsort(values: list[int], threshold: int = NUMPY_THRESHOLD) -> list[int]:
+    """Indexes which would sort values, stable.
+
+    Args:
+        values (list[int]): Unsorted list or NumPy array.
+        threshold (int, optional): Smallest list handed to NumPy. Defaults to NUMPY_THRESHOLD.
+
+    Returns:
+        list[int]: Indexes in sorted order, or NumPy array for NumPy input.
+    """
+    if _use_numpy(values, threshold):
+        if _is_numpy_array(values):
+            return np.argsort(values, kind="stable")
+        return np.argsort(np.array(values, dtype=np.int64), kind="stable").tolist()
+    return sorted(range(len(values)), key=values.__getitem__)
+
+
+def _numpy_targets(sorted_values: object, targets: list[int], threshold: int) -> tuple | None:
+    """Convert sorted values and targets for a NumPy search.
+
+    Args:
+        sorted_values (object): Sorted list or NumPy array.
+        targets (list[int]): List or NumPy array of elements to find.
+        threshold (int): Smallest list handed to NumPy.
+
+    Returns:
+        tuple | None: NumPy arrays of values and targets, and True if the result
+        should be a NumPy array, or None if the search should stay in python.
+    """
+    if not _use_numpy(sorted_values, threshold):
+        return None
+    if not (_is_numpy_array(targets) or (isinstance(targets, list) and fits_int64(targets))):
+        return None
+    as_numpy: bool = _is_numpy_array(sorted_values) or _is_numpy_array(targets)
+    values_array = sorted_values if _is_numpy_array(sorted_values) else np.array(
+        sorted_values, dtype=np.int64)
+    targets_array = targets if _is_numpy_array(targets) else np.array(targets, dtype=np.int64)
+    return values_array, targets_array, as_numpy
+
+
+def _as_input_type(positions: list[int], sorted_values: object, targets: object) -> list[int]:
+    """Convert positions found in python to a NumPy array if an input was one.
+
+    Args:
+        positions (list[int]): Positions found by the python search.
+        sorted_values (object): Sorted list or NumPy array.
+        targets (object): List or NumPy array of elements to find.
+
+    Returns:
+        list[int]: Positions, NumPy array if sorted_values or targets is one.
+    """
+    if _is_numpy_array(sorted_values) or _is_numpy_array(targets):
+        return np.array(positions, dtype=np.intp)
+    return positions
+
+
+def searchsorted(sorted_values: list[int], targets: list[int],
+                 threshold: int = NUMPY_THRESHOLD) -> list[int]:
+    """Leftmost insertion points of targets in sorted values.
+
+    Args:
+        sorted_values (list[int]): Sorted list or NumPy array.
+        targets (list[int]): List or NumPy array of elements to find.
+        threshold (int, optional): Smallest list handed to NumPy. Defaults to NUMPY_THRESHOLD.
+
+    Returns:
+        list[int]: Insertion point of every target, NumPy array if an input was one.
+    """
+    converted: tuple | None = _numpy_targets(sorted_values, targets, threshold)
+    if converted is None:
+        return _as_input_type(
+            batch_lower_bound(list(sorted_values), list(targets)), sorted_values, targets)
+    values_array, targets_array, as_numpy = converted
+    positions = np.searchsorted(values_array, targets_array, side="left")
+    return positions if as_numpy else positions.tolist()
+
+
+def batch_search(sorted_values: list[int], targets: list[int],
+                 threshold: int = NUMPY_THRESHOLD) -> list[int]:
+    """Leftmost index of every target in sorted values, -1 if not found.
+
+    Args:
+        sorted_values (list[int]): Sorted list or NumPy array.
+        targets (list[int]): List or NumPy array of elements to find.
+        threshold (int, optional): Smallest list handed to NumPy. Defaults to NUMPY_THRESHOLD.
+
+    Returns:
+        list[int]: Index of every target or -1, NumPy array if an input was one.
+    """
+    converted: tuple | None = _numpy_targets(sorted_values, targets, threshold)
+    if converted is None:
+        return _as_input_type(
+            batch_binary_search(list(sorted_values), list(targets)), sorted_values, targets)
+    values_array, targets_array, as_numpy = converted
+    positions = np.searchsorted(values_array, targets_array, side="left")
+    if len(values_array) == 0:
+        found = np.zeros(len(targets_array), dtype=bool)
+    else:
+        found = values_array[np.minimum(positions, len(values_array) - 1)] == targets_array
+        found &= positions < len(values_array)
+    indexes = np.where(found, positions, -1)
+    return indexes if as_numpy else indexes.tolist()
+
+
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    print(numpy_available())
+    print(sort(array, threshold=0))
+    print(argsort(array, threshold=0))
+    print(batch_search(sort(array), [8, 4, 1], threshold=0))
@@ -0,0 +1,104 @@
+"""
+numeric_backend unit tests
+
+- python path, also used when NumPy is not installed
+    - sort / argsort / searchsorted / batch_search like the python algorithms
+    - argsort is stable
+    - lists below the threshold, and values which do not fit in int64, stay in python
+
+- NumPy path, skipped when NumPy is not installed
+    - same results as the python path, lists in, lists out
+    - NumPy arrays in, NumPy arrays out, also when the search falls back to python
+
+"""
+import random
+from bisect import bisect_left
+
+import pytest
+
+import numeric_backend
+from numeric_backend import argsort, batch_search, fits_int64, searchsorted, sort
+
+
+def random_values(seed: int, size: int) -> list[int]:
+    """random ints with duplicates
+    """
+    rng: random.Random = random.Random(seed)
+    return [rng.randrange(-size, size) for _ in range(size)]
+
+
+# python path
+
+def test_python_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """sort / argsort / searchsorted / batch_search like the python algorithms
+    """
+    monkeypatch.setattr(numeric_backend, "np", None)
+    assert numeric_backend.numpy_available() is False
+    values: list[int] = random_values(1, 300)
+    ordered: list[int] = sort(values, threshold=0)
+    assert ordered == sorted(values)
+    assert [values[index] for index in argsort(values, threshold=0)] == ordered
+    targets: list[int] = random_values(2, 50)
+    assert searchsorted(ordered, targets, threshold=0) == [
+        bisect_left(ordered, target) for target in targets]
+    assert batch_search(ordered, targets, threshold=0) == [
+        bisect_left(ordered, target) if target in values else -1 for target in targets]
+
+def test_argsort_stable() -> None:
+    """argsort is stable
+    """
+    values: list[int] = [3, 1, 3, 2, 1, 3]
+    assert argsort(values) == [1, 4, 3, 0, 2, 5]
+
+def test_python_fallback() -> None:
+    """lists below the threshold, and values which do not fit in int64, stay in python
+    """
+    assert fits_int64([0, 2 ** 63 - 1, -2 ** 63]) is True
+    assert fits_int64([2 ** 63]) is False
+    assert fits_int64([True]) is False
+    assert fits_int64(['a']) is False
+    big: list[int] = [2 ** 70, 1, -2 ** 70, 5]
+    assert sort(big, threshold=0) == sorted(big)
+    assert searchsorted(sorted(big), [2 ** 70, 0], threshold=0) == [3, 1]
+    assert sort([3, 1, 2]) == [1, 2, 3]
+    assert isinstance(sort([3, 1, 2]), list)
+
+
+# NumPy path
+
+def test_numpy_same_as_python() -> None:
+    """same results as the python path, lists in, lists out
+    """
+    pytest.importorskip("numpy")
+    values: list[int] = random_values(3, 2000)
+    targets: list[int] = random_values(4, 300)
+    ordered: list[int] = sort(values, threshold=0)
+    assert isinstance(ordered, list)
+    assert ordered == sort(values, threshold=len(values) + 1) == sorted(values)
+    assert argsort(values, threshold=0) == argsort(values, threshold=len(values) + 1)
+    assert searchsorted(ordered, targets, threshold=0) == searchsorted(
+        ordered, targets, threshold=len(values) + 1)
+    assert batch_search(ordered, targets, threshold=0) == batch_search(
+        ordered, targets, threshold=len(values) + 1)
+    assert batch_search([], [1, 2], threshold=0) == [-1, -1]
+
+def test_numpy_in_numpy_out() -> None:
+    """NumPy arrays in, NumPy arrays out, also when the search falls back to python
+    """
+    np = pytest.importorskip("numpy")
+    values = np.array(random_values(5, 500), dtype=np.int64)
+    ordered = sort(values)
+    assert isinstance(ordered, np.ndarray)
+    assert ordered.tolist() == sorted(values.tolist())
+    assert isinstance(argsort(values), np.ndarray)
+    assert argsort(values).tolist() == argsort(values.tolist(), threshold=len(values) + 1)
+    for targets in ([1, 2, 3], [2 ** 70, -2 ** 70, 0], np.array([4, 5])):
+        positions = searchsorted(ordered, targets)
+        assert isinstance(positions, np.ndarray)
+        assert positions.tolist() == [bisect_left(ordered.tolist(), target)
+                                      for target in list(targets)]
+        assert isinstance(batch_search(ordered, targets), np.ndarray)
+    small = searchsorted([1, 3, 5], np.array([3, 4]))
+    assert isinstance(small, np.ndarray)
+    assert small.tolist() == [1, 2]
+    assert isinstance(batch_search([1, 3, 5], np.array([3, 4])), np.ndarray)
@@ -0,0 +1,147 @@
+"""
+    - convert unsorted array to sorted array using several processes
+    - split the array into one chunk per worker, sort the chunks in a process pool
+      with introsort, then merge the sorted chunks with a heap (k-way merge)
+    - int arrays whose values fit in int64 are handed to the workers through
+      shared memory: the parent writes the values once, every worker sorts its
+      chunk in place in the shared block, nothing is pickled but the chunk bounds
+    - other arrays are pickled to the workers chunk by chunk
+    - below a size threshold, or with one worker, starting processes costs more
+      than it saves and the array is sorted in this process
+    - time complexity:
+        -- O(n/w log(n/w)) per worker for w workers, plus O(nlogw) for the merge
+"""
+import heapq
+import os
+from array import array as typed_array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from introsort import introsort
+from numeric_backend import fits_int64
+
+PARALLEL_THRESHOLD: int = 200_000
+
+
+def available_cpus() -> int:
+    """Number of cpus this process may run on.
+
+    Returns:
+        int: Cpu count, at least 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _sort_chunk(chunk: list[int]) -> list[int]:
+    """Worker: sort a pickled chunk.
+
+    Args:
+        chunk (list[int]): Unsorted chunk.
+
+    Returns:
+        list[int]: Sorted chunk.
+    """
+    introsort(chunk)
+    return chunk
+
+
+def _sort_shared_chunk(name: str, start: int, stop: int) -> None:
+    """Worker: sort elements start to stop of a shared int64 block in place.
+
+    Args:
+        name (str): Name of the shared memory block.
+        start (int): First index of the chunk.
+        stop (int): Index after the chunk.
+    """
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf.cast("q") as values:
+            # sorting a list is faster than sorting the memoryview item by item
+            chunk: list[int] = values[start:stop].tolist()
+            introsort(chunk)
+            values[start:stop] = typed_array("q", chunk)
+    finally:
+        block.close()
+
+
+def _bounds(size: int, chunks: int) -> list[int]:
+    """Split range(size) into chunks of nearly equal size.
+
+    Args:
+        size (int): Number of elements.
+        chunks (int): Number of chunks.
+
+    Returns:
+        list[int]: Chunk boundaries, 0 first and size last.
+    """
+    return [size * index // chunks for index in range(chunks + 1)]
+
+
+def _parallel_sort_int64(array: list[int], workers: int) -> list[int]:
+    """Sort int64 array with workers through shared memory.
+
+    Args:
+        array (list[int]): Unsorted int64 array.
+        workers (int): Number of worker processes.
+
+    Returns:
+        list[int]: Sorted array.
+    """
+    bounds: list[int] = _bounds(len(array), workers)
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(
+        create=True, size=len(array) * 8)
+    try:
+        with block.buf.cast("q") as values:
+            # the block may be rounded up to whole pages, only the first len(array) are used
+            values[:len(array)] = typed_array("q", array)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_sort_shared_chunk, block.name, bounds[i], bounds[i + 1])
+                    for i in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+            chunks: list[list[int]] = [
+                values[bounds[i]:bounds[i + 1]].tolist() for i in range(workers)
+            ]
+    finally:
+        block.close()
+        block.unlink()
+    return list(heapq.merge(*chunks))
+
+
+def parallel_sort(array: list[int], workers: int | None = None,
+                  threshold: int = PARALLEL_THRESHOLD) -> list[int]:
+    """Sort array using a pool of worker processes.
+
+    Args:
+        array (list[int]): Unsorted array.
+        workers (int | None, optional): Number of worker processes. Defaults to None,
+        one per available cpu.
+        threshold (int, optional): Smallest array sorted in parallel.
+        Defaults to PARALLEL_THRESHOLD.
+
+    Returns:
+        list[int]: Sorted array.
+    """
+    if workers is None:
+        workers = available_cpus()
+    workers = max(1, min(workers, len(array) // 2))
+    if workers == 1 or len(array) < threshold:
+        sorted_array: list[int] = array[:]
+        introsort(sorted_array)
+        return sorted_array
+    if fits_int64(array):
+        return _parallel_sort_int64(array, workers)
+    bounds: list[int] = _bounds(len(array), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks: list[list[int]] = list(executor.map(
+            _sort_chunk, (array[bounds[i]:bounds[i + 1]] for i in range(workers))))
+    return list(heapq.merge(*chunks))
+
+
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    print(parallel_sort(array, workers=2, threshold=0))
@@ -0,0 +1,100 @@
+"""
+parallel_sort unit tests
+
+- parallel_sort
+    - sort int64 values through shared memory like sorted()
+    - use only the start of a shared block rounded up to whole pages
+    - sort str and big int values through pickled chunks like sorted()
+    - sort small arrays, or with one worker, in this process
+    - return a new list, input is not changed
+
+"""
+import random
+from multiprocessing import shared_memory
+
+import pytest
+
+import parallel_sort as parallel_sort_module
+from parallel_sort import available_cpus, parallel_sort
+
+
+def random_values(seed: int, size: int) -> list[int]:
+    """random int64 values with duplicates
+    """
+    rng: random.Random = random.Random(seed)
+    return [rng.randrange(-(1 << 63), 1 << 63) >> rng.randrange(64) for _ in range(size)]
+
+
+# parallel_sort()
+
+def test_shared_memory_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """sort int64 values through shared memory like sorted()
+    """
+    used: list[int] = []
+    sort_int64 = parallel_sort_module._parallel_sort_int64
+
+    def recording_sort_int64(array: list[int], workers: int) -> list[int]:
+        used.append(workers)
+        return sort_int64(array, workers)
+
+    monkeypatch.setattr(parallel_sort_module, "_parallel_sort_int64", recording_sort_int64)
+    for values in (random_values(1, 5000), [7] * 100, list(range(101, 0, -1)), [2, 1]):
+        assert parallel_sort(values, workers=2, threshold=0) == sorted(values)
+    # two values leave one worker, which sorts in this process
+    assert used == [2, 2, 2]
+    assert parallel_sort([], workers=2, threshold=0) == []
+    assert parallel_sort(random_values(2, 999), workers=3, threshold=0) == sorted(
+        random_values(2, 999))
+
+def test_shared_memory_rounded_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    """use only the start of a shared block rounded up to whole pages
+    """
+
+    class PageSizedMemory(shared_memory.SharedMemory):
+        """shared memory block whose size is rounded up like on macOS and Windows"""
+
+        def __init__(self, name: str | None = None, create: bool = False,
+                     size: int = 0) -> None:
+            if create:
+                size = -(-size // 4096) * 4096
+            super().__init__(name, create, size)
+
+    monkeypatch.setattr(parallel_sort_module.shared_memory, "SharedMemory", PageSizedMemory)
+    for size in (3, 1000, 4096):
+        values: list[int] = random_values(size, size)
+        assert parallel_sort_module._parallel_sort_int64(values, 2) == sorted(values)
+
+def test_pickled_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """sort str and big int values through pickled chunks like sorted()
+    """
+    monkeypatch.setattr(parallel_sort_module, "_parallel_sort_int64", None)
+    rng: random.Random = random.Random(3)
+    words: list[str] = [''.join(rng.choice('abc') for _ in range(rng.randrange(5)))
+                        for _ in range(2000)]
+    assert parallel_sort(words, workers=2, threshold=0) == sorted(words)
+    big: list[int] = [rng.randrange(-(1 << 80), 1 << 80) for _ in range(2000)]
+    assert parallel_sort(big, workers=2, threshold=0) == sorted(big)
+
+def test_serial_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """sort small arrays, or with one worker, in this process
+    """
+
+    def no_pool(*args, **kwargs) -> None:
+        raise AssertionError("process pool used")
+
+    monkeypatch.setattr(parallel_sort_module, "ProcessPoolExecutor", no_pool)
+    values: list[int] = random_values(4, 1000)
+    assert parallel_sort(values, workers=4) == sorted(values)
+    assert parallel_sort(values, workers=1, threshold=0) == sorted(values)
+    assert parallel_sort([5], workers=4, threshold=0) == [5]
+    assert parallel_sort(['b', 'a'], workers=8, threshold=100) == ['a', 'b']
+    assert available_cpus() >= 1
+
+def test_input_not_changed() -> None:
+    """return a new list, input is not changed
+    """
+    values: list[int] = random_values(5, 300)
+    original: list[int] = values[:]
+    result: list[int] = parallel_sort(values, workers=2, threshold=0)
+    assert result is not values
+    assert values == original
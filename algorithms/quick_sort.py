@@ -1,15 +1,21 @@
 """
     - convert unsorted array to sorted array
     - pivot and partition
+    - quick_sort, quick_sort_2 and reverse_quick_sort all call sort, which sorts with
+      introsort, an in-place iterative quick sort with median-of-three pivots,
+      3-way partitioning and a heap sort fallback
     - time complexity:
-        -- worst case: O(n^2)
-            --- worst case is when pivot is always the smallest or largest element
-            --- worst case is when the array is sorted
+        -- worst case: O(nlogn)
+            --- plain quick sort is O(n^2) when pivot is always the smallest or largest
+                element, e.g. last element of a sorted array, introsort avoids it
+                by switching to heap sort
         -- average case: O(nlogn)
 """
+from sort import sort
+
 
 def quick_sort(array: list[int]) -> list[int]:
-    """Quick sort using last element as pivot.
+    """Quick sort.
 
     Args:
         array (list[int]): Unsorted array.
@@ -17,22 +23,13 @@ def quick_sort(array: list[int]) -> list[int]:
     Returns:
         list[int]: Sorted array.
     """
-    pivot: int = array[-1]
-    pivot_count: int = array.count(pivot)
-
-    left: list[int] = [element for element in array if element < pivot]
-    if left != []:
-        left = quick_sort(left)
-
-    right: list[int] = [element for element in array if element > pivot]
-    if right != []:
-        right = quick_sort(right)
-
-    return left + [pivot]*pivot_count + right
+    return sort(array)
 
 
 def quick_sort_2(array: list[int]) -> list[int]:
-    """Quick sort using first element as pivot.
+    """Quick sort, same as quick_sort.
+
+    Used to pick the first element as pivot, sort(array, pivot="first") still does.
 
     Args:
         array (list[int]): Unsorted array.
@@ -40,22 +37,11 @@ def quick_sort_2(array: list[int]) -> list[int]:
     Returns:
         list[int]: Sorted array.
     """
-    pivot: int = array[0]
-    pivot_count: int = array.count(pivot)
-
-    left: list[int] = [element for element in array if element < pivot]
-    if left != []:
-        left = quick_sort_2(left)
-
-    right: list[int] = [element for element in array if element > pivot]
-    if right != []:
-        right = quick_sort_2(right)
-
-    return left + [pivot]*pivot_count + right
+    return sort(array)
 
 
 def reverse_quick_sort(array: list[int]) -> list[int]:
-    """Quick sort in descending order using last element as pivot.
+    """Quick sort in descending order.
 
     Args:
         array (list[int]): Unsorted array.
@@ -63,19 +49,9 @@ def reverse_quick_sort(array: list[int]) -> list[int]:
     Returns:
         list[int]: Sorted array.
     """
-    pivot: int = array[-1]
-    pivot_count: int = array.count(pivot)
-
-    left: list[int] = [element for element in array if element > pivot]
-    if left != []:
-        left = reverse_quick_sort(left)
-
-    right: list[int] = [element for element in array if element < pivot]
-    if right != []:
-        right = reverse_quick_sort(right)
-
-    return left + [pivot]*pivot_count + right
+    return sort(array, reverse=True)
 
 
-array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
-print(reverse_quick_sort(array))
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    print(reverse_quick_sort(array))
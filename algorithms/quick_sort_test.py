@@ -0,0 +1,63 @@
+"""
+quick_sort unit tests
+
+- quick_sort / quick_sort_2
+    - sort sorted, reverse sorted, all duplicate, organ pipe, random and empty
+      input like sorted()
+    - return a new list, input is not changed
+
+- reverse_quick_sort
+    - sort in descending order like sorted(reverse=True)
+
+"""
+import random
+
+from quick_sort import quick_sort, quick_sort_2, reverse_quick_sort
+
+
+def shapes(size: int) -> dict[str, list[int]]:
+    """sorted, reverse sorted, all duplicate, organ pipe, random and empty input
+    """
+    rng: random.Random = random.Random(size)
+    half: int = size // 2
+    return {
+        "sorted": list(range(size)),
+        "reverse sorted": list(range(size, 0, -1)),
+        "all duplicate": [7] * size,
+        "organ pipe": list(range(half)) + list(range(size - half, 0, -1)),
+        "random": [rng.randrange(-size, size) for _ in range(size)],
+        "empty": [],
+    }
+
+
+# quick_sort() / quick_sort_2()
+
+def test_quick_sort() -> None:
+    """sort sorted, reverse sorted, all duplicate, organ pipe, random and empty input like sorted()
+    """
+    for size in (1, 2, 17, 1000):
+        for name, values in shapes(size).items():
+            assert quick_sort(values) == sorted(values), name
+            assert quick_sort_2(values) == sorted(values), name
+
+def test_quick_sort_copy() -> None:
+    """return a new list, input is not changed
+    """
+    values: list[int] = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    original: list[int] = values[:]
+    sorted_values: list[int] = quick_sort(values)
+    assert sorted_values is not values
+    assert values == original
+    assert quick_sort_2(values) is not values
+    assert reverse_quick_sort(values) is not values
+    assert values == original
+
+
+# reverse_quick_sort()
+
+def test_reverse_quick_sort() -> None:
+    """sort in descending order like sorted(reverse=True)
+    """
+    for size in (1, 2, 17, 1000):
+        for name, values in shapes(size).items():
+            assert reverse_quick_sort(values) == sorted(values, reverse=True), name
@@ -0,0 +1,73 @@
+"""
+    - sorted copy of any array, with an optional key and in either order
+    - decorate, sort, undecorate: every key is computed once, up front, and stored
+      in a (key, index, element) tuple, comparisons never call the key function again
+    - the index makes every tuple unique, so elements with equal keys are never
+      compared and come out in input order: stable, although introsort is not
+    - reverse order uses the same ascending sort: indexes are negated, so equal keys
+      sort in reversed input order, then the whole result is reversed, which puts
+      keys in descending order and equal keys back in input order
+    - int arrays without a key skip the decoration, equal ints cannot be told apart
+    - time complexity:
+        -- worst case: O(nlogn) comparisons, n key calls
+        -- average case: O(nlogn) comparisons, n key calls
+"""
+from collections.abc import Callable
+from typing import Any
+
+from introsort import introsort
+
+
+def _plain_ints(array: list[Any]) -> bool:
+    """Check if every element is an int, not a subclass of int.
+
+    Args:
+        array (list[Any]): Array to check.
+
+    Returns:
+        bool: True if the order of equal elements does not matter.
+    """
+    for element in array:
+        if type(element) is not int:  # pylint: disable=unidiomatic-typecheck
+            return False
+    return True
+
+
+def sort(array: list[Any], key: Callable[[Any], Any] | None = None,
+         reverse: bool = False, pivot: str = "median3") -> list[Any]:
+    """Stable sort.
+
+    Args:
+        array (list[Any]): Unsorted array.
+        key (Callable[[Any], Any] | None, optional): Function computing the sort key of
+        an element, called once per element. Defaults to None, elements are compared.
+        reverse (bool, optional): Sort in descending order. Defaults to False.
+        pivot (str, optional): Pivot choice of introsort, "median3", "first" or "last".
+        Defaults to "median3".
+
+    Returns:
+        list[Any]: Sorted array, array itself is not changed.
+
+    Raises:
+        ValueError: If pivot is not a known pivot choice.
+    """
+    if key is None and _plain_ints(array):
+        sorted_array: list[int] = array[:]
+        introsort(sorted_array, pivot=pivot)
+        if reverse:
+            sorted_array.reverse()
+        return sorted_array
+    keys: list[Any] = array if key is None else [key(element) for element in array]
+    step: int = -1 if reverse else 1
+    decorated: list[tuple] = list(zip(keys, range(0, step * len(array), step), array))
+    introsort(decorated, pivot=pivot)
+    if reverse:
+        decorated.reverse()
+    return [element for _, _, element in decorated]
+
+
+if __name__ == "__main__":
+    array = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    print(sort(array))
+    print(sort(array, reverse=True))
+    print(sort(array, key=lambda element: element % 3))
@@ -0,0 +1,91 @@
+"""
+sort unit tests
+
+- sort
+    - sort like sorted(), with and without key, in both orders, for every pivot
+    - call key exactly once per element
+    - stable for equal keys, also with reverse=True
+    - return a new list, input is not changed
+    - raise ValueError for an unknown pivot choice
+
+"""
+import random
+
+import pytest
+
+from introsort import PIVOTS
+from sort import sort
+
+
+class Record:
+    """element which cannot be compared, only its key can
+    """
+
+    def __init__(self, key: int, label: int) -> None:
+        self.key = key
+        self.label = label
+
+
+# sort()
+
+@pytest.mark.parametrize("pivot", list(PIVOTS))
+def test_sort_like_sorted(pivot: str) -> None:
+    """sort like sorted(), with and without key, in both orders, for every pivot
+    """
+    rng: random.Random = random.Random(25)
+    for size in (0, 1, 2, 17, 500):
+        values: list[int] = [rng.randrange(-20, 20) for _ in range(size)]
+        words: list[str] = [str(value) for value in values]
+        for reverse in (False, True):
+            assert sort(values, reverse=reverse, pivot=pivot) == sorted(values, reverse=reverse)
+            assert sort(words, reverse=reverse, pivot=pivot) == sorted(words, reverse=reverse)
+            assert sort(values, key=abs, reverse=reverse, pivot=pivot) == sorted(
+                values, key=abs, reverse=reverse)
+
+def test_key_called_once() -> None:
+    """call key exactly once per element
+    """
+    calls: list[int] = []
+
+    def key(value: int) -> int:
+        calls.append(value)
+        return value % 7
+
+    values: list[int] = list(range(300, 0, -1))
+    for reverse in (False, True):
+        calls.clear()
+        sort(values, key=key, reverse=reverse)
+        assert sorted(calls) == sorted(values)
+
+def test_stable_reverse() -> None:
+    """stable for equal keys, also with reverse=True
+    """
+    rng: random.Random = random.Random(26)
+    records: list[Record] = [Record(rng.randrange(5), label) for label in range(400)]
+    for reverse in (False, True):
+        result: list[Record] = sort(records, key=lambda record: record.key, reverse=reverse)
+        expected: list[Record] = sorted(records, key=lambda record: record.key, reverse=reverse)
+        assert [record.label for record in result] == [record.label for record in expected]
+    mixed: list[float | int] = [1, 1.0, 0, 0.0, 1, 0]
+    for reverse in (False, True):
+        assert [type(value) for value in sort(mixed, reverse=reverse)] == [
+            type(value) for value in sorted(mixed, reverse=reverse)]
+
+def test_input_not_changed() -> None:
+    """return a new list, input is not changed
+    """
+    values: list[int] = [6, 3, 1, 9, 6, 7, 2, 8, 5, 8, 2, 8]
+    original: list[int] = values[:]
+    for result in (sort(values), sort(values, reverse=True), sort(values, key=lambda v: -v)):
+        assert result is not values
+    assert values == original
+
+def test_unknown_pivot() -> None:
+    """raise ValueError for an unknown pivot choice
+    """
+    values: list[int] = [3, 1, 2]
+    with pytest.raises(ValueError):
+        sort(values, pivot="random")
+    with pytest.raises(ValueError):
+        sort(values, key=str, pivot="middle")
+    assert values == [3, 1, 2]
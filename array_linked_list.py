@@ -0,0 +1,668 @@
+"""
+Array Linked List:
+    - Linked list whose nodes live in parallel arrays instead of separate objects.
+    - Slot i holds a value in the values list and the slot of the next node in the links array.
+    - A link of -1 means there is no next node.
+    - Slots of removed nodes are chained into a free list and reused by later inserts.
+    - Has the same public methods as LinkedList, so either can be used by the same code.
+    - Methods which return a Node return a detached copy holding the value,
+      there are no node objects inside the list to hand out.
+
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from operator import itemgetter
+
+from node import Node
+
+# link value of the last node and of an empty list
+NO_SLOT: int = -1
+
+
+class ArrayLinkedList:
+    """
+    ArrayLinkedList Class
+    """
+
+    def __init__(self, head_node_value: int | str | None = None, indexed: bool = False) -> None:
+        """create linked list with given value as head node
+
+        Args:
+            head_node_value (int | str | None, optional): value for head node of the list.
+            Defaults to None.
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+        """
+        self._values: list[int | str | None] = []
+        self._links: array = array("q")
+        self._free_slot: int = NO_SLOT
+        self._head_slot: int = NO_SLOT
+        self._tail_slot: int = NO_SLOT
+        self.length: int = 0
+        self._indexed: bool = indexed
+        if head_node_value is not None:
+            self.append_node(head_node_value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str], indexed: bool = False) -> ArrayLinkedList:
+        """create linked list from given values in a single pass
+
+        Args:
+            values (Iterable[int | str]): values in list order. Generators are consumed lazily
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+
+        Returns:
+            ArrayLinkedList: new linked list holding given values
+        """
+        linked_list: ArrayLinkedList = cls(indexed=indexed)
+        linked_list.extend(values)
+        return linked_list
+
+    def enable_index(self) -> None:
+        """start keeping the value index
+
+        Values are scanned in one flat list without following node objects, so there
+        is no index to build, only the flag is kept for code written against LinkedList.
+        """
+        self._indexed = True
+
+    def disable_index(self) -> None:
+        """stop keeping the value index
+        """
+        self._indexed = False
+
+    def is_indexed(self) -> bool:
+        """check if value index is kept
+
+        Returns:
+            bool: True if value index is kept else False
+        """
+        return self._indexed
+
+    def _new_slot(self, value: int | str, next_slot: int) -> int:
+        """store value in a free slot, growing the arrays when no slot is free
+
+        Args:
+            value (int | str): value of the node
+            next_slot (int): slot of the next node
+
+        Returns:
+            int: slot holding the value
+        """
+        slot: int = self._free_slot
+        if slot == NO_SLOT:
+            self._values.append(value)
+            self._links.append(next_slot)
+            return len(self._links) - 1
+        self._free_slot = self._links[slot]
+        self._values[slot] = value
+        self._links[slot] = next_slot
+        return slot
+
+    def _release_slot(self, slot: int) -> None:
+        """push slot of a removed node on the free list
+
+        Args:
+            slot (int): slot to release
+        """
+        self._values[slot] = None
+        self._links[slot] = self._free_slot
+        self._free_slot = slot
+
+    def _node(self, slot: int) -> Node | None:
+        """detached node holding value of the given slot
+
+        Args:
+            slot (int): slot of the node
+
+        Returns:
+            Node | None: node with slot value or None for NO_SLOT
+        """
+        if slot == NO_SLOT:
+            return None
+        return Node(self._values[slot])
+
+    def _iter_slots(self) -> Iterator[int]:
+        """yield slots of the list from head to tail
+
+        Yields:
+            int: slot of next node
+        """
+        links: array = self._links
+        slot: int = self._head_slot
+        while slot != NO_SLOT:
+            yield slot
+            slot = links[slot]
+
+    def _replace_values(self, values: Iterable[int | str]) -> None:
+        """store given values in the slots of the list, in list order, links stay as they are
+
+        Args:
+            values (Iterable[int | str]): new values, one for every node
+        """
+        slot_values: list[int | str | None] = self._values
+        for slot, value in zip(self._iter_slots(), values):
+            slot_values[slot] = value
+
+    def _slot_at(self, index: int) -> int:
+        """find slot of the node at index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            int: slot of the node or NO_SLOT if index is out of range
+        """
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            return NO_SLOT
+        if index == self.length - 1:
+            return self._tail_slot
+        links: array = self._links
+        slot: int = self._head_slot
+        for _ in range(index):
+            slot = links[slot]
+        return slot
+
+    def extend(self, values: Iterable[int | str]) -> int:
+        """append given values at the end of the list, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to append
+
+        Returns:
+            int: number of appended nodes
+        """
+        links: array = self._links
+        new_slot = self._new_slot
+        tail_slot: int = self._tail_slot
+        count: int = 0
+        try:
+            for value in values:
+                slot: int = new_slot(value, NO_SLOT)
+                if tail_slot == NO_SLOT:
+                    self._head_slot = slot
+                else:
+                    links[tail_slot] = slot
+                tail_slot = slot
+                count += 1
+        finally:
+            # values linked before a failing iterator stay in the list
+            self._tail_slot = tail_slot
+            self.length += count
+        return count
+
+    def extend_left(self, values: Iterable[int | str]) -> int:
+        """add given values before the head node, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to add. First value becomes new head node
+
+        Returns:
+            int: number of added nodes
+        """
+        links: array = self._links
+        new_slot = self._new_slot
+        old_head_slot: int = self._head_slot
+        previous_slot: int = NO_SLOT
+        count: int = 0
+        try:
+            for value in values:
+                slot: int = new_slot(value, old_head_slot)
+                if previous_slot == NO_SLOT:
+                    self._head_slot = slot
+                else:
+                    links[previous_slot] = slot
+                previous_slot = slot
+                count += 1
+        finally:
+            # values linked before a failing iterator stay in the list
+            if count and old_head_slot == NO_SLOT:
+                self._tail_slot = previous_slot
+            self.length += count
+        return count
+
+    def get_head_node(self) -> Node | None:
+        """get head node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        return self._node(self._head_slot)
+
+    def get_tail_node(self) -> Node | None:
+        """get tail node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        return self._node(self._tail_slot)
+
+    def add_new_head(self, head_node_value: int | str) -> Node:
+        """adds new head node to the list
+
+        Args:
+            head_node_value (int | str): value of new head node
+
+        Returns:
+            Node: new head node
+        """
+        slot: int = self._new_slot(head_node_value, self._head_slot)
+        if self._head_slot == NO_SLOT:
+            self._tail_slot = slot
+        self._head_slot = slot
+        self.length += 1
+        return Node(head_node_value)
+
+    def append_node(self, new_node_value: int | str) -> Node:
+        """append node with given value at the end of the list
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            Node: newly appended node
+        """
+        slot: int = self._new_slot(new_node_value, NO_SLOT)
+        if self._tail_slot == NO_SLOT:
+            self._head_slot = slot
+        else:
+            self._links[self._tail_slot] = slot
+        self._tail_slot = slot
+        self.length += 1
+        return Node(new_node_value)
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """yield detached nodes of the list from head to tail
+
+        Yields:
+            Node: node holding the next value
+        """
+        for value in self:
+            yield Node(value)
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        values: list[int | str | None] = self._values
+        links: array = self._links
+        slot: int = self._head_slot
+        while slot != NO_SLOT:
+            yield values[slot]
+            slot = links[slot]
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        for node_value in self:
+            if node_value == value:
+                return True
+        return False
+
+    def __getitem__(self, index: int | slice) -> int | str | ArrayLinkedList:
+        """get value at index, or a new linked list for a slice
+
+        Args:
+            index (int | slice): index of the node or slice of the list. Negative index also works
+
+        Raises:
+            TypeError: if index is not an int or slice
+            IndexError: if index is out of range
+
+        Returns:
+            int | str | ArrayLinkedList: value at index or new linked list with sliced values
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step > 0:
+                return type(self).from_iterable(islice(self, start, stop, step))
+            indexes: range = range(start, stop, step)
+            if not indexes:
+                return type(self)()
+            first: int = indexes[-1]
+            window: list[int | str] = list(islice(self, first, indexes[0] + 1))
+            return type(self).from_iterable(window[i - first] for i in indexes)
+        if not isinstance(index, int):
+            raise TypeError("linked list indices must be integers or slices")
+        slot: int = self._slot_at(index)
+        if slot == NO_SLOT:
+            raise IndexError("linked list index out of range")
+        return self._values[slot]
+
+    def as_list(self) -> list[str | int]:
+        """return linked list in form of list
+
+        Returns:
+            list[str | int]: list of str of list of int. Depending on dtype of value
+        """
+        return list(self)
+
+    def remove_node(self, value: str | int) -> Node | None:
+        """remove node with given value from the list
+
+        Args:
+            value (str | int): value to remove
+
+        Returns:
+            Node | None: returns removed node or None if not found
+        """
+        values: list[int | str | None] = self._values
+        links: array = self._links
+        previous_slot: int = NO_SLOT
+        slot: int = self._head_slot
+        while slot != NO_SLOT:
+            if values[slot] == value:
+                next_slot: int = links[slot]
+                if previous_slot == NO_SLOT:
+                    self._head_slot = next_slot
+                else:
+                    links[previous_slot] = next_slot
+                if slot == self._tail_slot:
+                    self._tail_slot = previous_slot
+                removed_node: Node = Node(values[slot])
+                self._release_slot(slot)
+                self.length -= 1
+                return removed_node
+            previous_slot = slot
+            slot = links[slot]
+        return None
+
+    def remove_all(self, values: Iterable[int | str]) -> int:
+        """remove every node whose value is one of the given values, in one traversal
+
+        Args:
+            values (Iterable[int | str]): values to remove
+
+        Returns:
+            int: number of removed nodes
+        """
+        targets: set[int | str] = set(values)
+        if not targets:
+            return 0
+        return self._unlink_where(targets.__contains__)
+
+    def remove_if(self, predicate: Callable[[int | str], bool]) -> int:
+        """remove every node whose value matches predicate, in one traversal
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with value of every node
+
+        Returns:
+            int: number of removed nodes
+        """
+        return self._unlink_where(predicate)
+
+    def remove_duplicates(self) -> int:
+        """remove every node whose value already appeared before it, in one traversal
+
+        Returns:
+            int: number of removed nodes
+        """
+        seen: set[int | str] = set()
+
+        def is_duplicate(value: int | str) -> bool:
+            if value in seen:
+                return True
+            seen.add(value)
+            return False
+
+        return self._unlink_where(is_duplicate)
+
+    def _unlink_where(self, predicate: Callable[[int | str], bool]) -> int:
+        """unlink every node whose value matches predicate and release its slot
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with value of every node
+
+        Returns:
+            int: number of removed nodes
+        """
+        values: list[int | str | None] = self._values
+        links: array = self._links
+        removed: int = 0
+        previous_slot: int = NO_SLOT
+        slot: int = self._head_slot
+        try:
+            while slot != NO_SLOT:
+                next_slot: int = links[slot]
+                if predicate(values[slot]):
+                    if previous_slot == NO_SLOT:
+                        self._head_slot = next_slot
+                    else:
+                        links[previous_slot] = next_slot
+                    self._release_slot(slot)
+                    removed += 1
+                else:
+                    previous_slot = slot
+                slot = next_slot
+        finally:
+            # also runs when predicate raises, nodes after current slot are kept
+            if slot == NO_SLOT:
+                self._tail_slot = previous_slot
+            self.length -= removed
+        return removed
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self
+
+    def access_node_by_index(self, index: int) -> Node | None:
+        """get node from list by index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            Node | None: return node if found else None
+        """
+        return self._node(self._slot_at(index))
+
+    def update_at_index(self, index: int, new_value: int | str) -> Node | None:
+        """update value of node at index with the given new_value, reusing its slot
+
+        Args:
+            index (int): index of the node. Negative index also works
+            new_value (int | str): new value of the node
+
+        Returns:
+            Node | None: return updated node if found else None
+        """
+        slot: int = self._slot_at(index)
+        if slot == NO_SLOT:
+            return None
+        self._values[slot] = new_value
+        return Node(new_value)
+
+    def update_many(self, updates: Mapping[int, int | str] | Iterable[tuple[int, int | str]]) -> int:
+        """update values of many nodes in place with a single traversal
+
+        Indexes are sorted first, so k updates cost O(n + k log k) and allocate no nodes.
+        Out of range indexes are skipped, for repeated indexes the last value wins.
+
+        Args:
+            updates (Mapping[int, int | str] | Iterable[tuple[int, int | str]]): index to new
+            value mapping or (index, new value) pairs. Negative index also works
+
+        Returns:
+            int: number of applied updates
+        """
+        pairs: Iterable[tuple[int, int | str]] = (
+            updates.items() if isinstance(updates, Mapping) else updates
+        )
+        length: int = self.length
+        targets: list[tuple[int, int | str]] = []
+        for index, new_value in pairs:
+            if index < 0:
+                index += length
+            if 0 <= index < length:
+                targets.append((index, new_value))
+        if not targets:
+            return 0
+        # stable sort keeps repeated indexes in given order
+        targets.sort(key=itemgetter(0))
+        values: list[int | str | None] = self._values
+        links: array = self._links
+        slot: int = self._head_slot
+        position: int = 0
+        for index, new_value in targets:
+            while position < index:
+                slot = links[slot]
+                position += 1
+            values[slot] = new_value
+        return len(targets)
+
+    def swap_nodes(self, value_1: str | int, value_2: str | int) -> bool:
+        """swap nodes with given value from the list
+
+        Nodes are slots, so swapping two nodes is swapping the values of their slots.
+
+        Args:
+            value_1 (str | int): value of node 1
+            value_2 (str | int): value of node 2
+
+        Returns:
+            bool: returns True on successful swap else False
+        """
+        if value_1 == value_2:
+            return False
+        values: list[int | str | None] = self._values
+        links: array = self._links
+        slot_1: int = NO_SLOT
+        slot_2: int = NO_SLOT
+        slot: int = self._head_slot
+        while slot != NO_SLOT:
+            if slot_1 == NO_SLOT and values[slot] == value_1:
+                slot_1 = slot
+                if slot_2 != NO_SLOT:
+                    break
+            elif slot_2 == NO_SLOT and values[slot] == value_2:
+                slot_2 = slot
+                if slot_1 != NO_SLOT:
+                    break
+            slot = links[slot]
+        if NO_SLOT in (slot_1, slot_2):
+            return False
+        values[slot_1], values[slot_2] = values[slot_2], values[slot_1]
+        return True
+
+    def move_to_front(self, value: str | int) -> bool:
+        """move first node with given value to the head of the list
+
+        Args:
+            value (str | int): value of node to move
+
+        Returns:
+            bool: True if node was found else False
+        """
+        values: list[int | str | None] = self._values
+        links: array = self._links
+        previous_slot: int = NO_SLOT
+        slot: int = self._head_slot
+        while slot != NO_SLOT and values[slot] != value:
+            previous_slot = slot
+            slot = links[slot]
+        if slot == NO_SLOT:
+            return False
+        if previous_slot == NO_SLOT:
+            return True
+        links[previous_slot] = links[slot]
+        if slot == self._tail_slot:
+            self._tail_slot = previous_slot
+        links[slot] = self._head_slot
+        self._head_slot = slot
+        return True
+
+    def rotate(self, steps: int = 1) -> Node | None:
+        """rotate the list to the right, last steps nodes move to the front
+
+        Negative steps rotate to the left. Only the links at the cut point change.
+
+        Args:
+            steps (int, optional): number of steps to rotate. Defaults to 1.
+
+        Returns:
+            Node | None: new head node
+        """
+        if self.length < 2:
+            return self._node(self._head_slot)
+        steps %= self.length
+        if steps == 0:
+            return self._node(self._head_slot)
+        links: array = self._links
+        new_tail_slot: int = self._slot_at(self.length - steps - 1)
+        new_head_slot: int = links[new_tail_slot]
+        links[self._tail_slot] = self._head_slot
+        links[new_tail_slot] = NO_SLOT
+        self._head_slot = new_head_slot
+        self._tail_slot = new_tail_slot
+        return self._node(new_head_slot)
+
+    def sort(self, key: Callable[[int | str], object] | None = None, reverse: bool = False) -> None:
+        """sort the list in place, stable
+
+        Nodes are slots, so sorted values are written back into the slots in list
+        order and no link changes. Values are sorted as one python list first,
+        so the list is unchanged if key or a comparison raises.
+
+        Args:
+            key (Callable[[int | str], object] | None, optional): computes the value to
+            compare from node value. Defaults to None.
+            reverse (bool, optional): sort in descending order. Defaults to False.
+        """
+        self._replace_values(sorted(self, key=key, reverse=reverse))
+
+    def apply_permutation(self, order: Sequence[int]) -> bool:
+        """reorder values so that new index i holds the value which was at index order[i]
+
+        Args:
+            order (Sequence[int]): permutation of range(length)
+
+        Returns:
+            bool: True if values were reordered, False if order is not a permutation
+        """
+        length: int = self.length
+        if len(order) != length:
+            return False
+        seen: bytearray = bytearray(length)
+        for index in order:
+            if not 0 <= index < length or seen[index]:
+                return False
+            seen[index] = 1
+        values: list[int | str] = self.as_list()
+        self._replace_values(values[index] for index in order)
+        return True
@@ -0,0 +1,393 @@
+"""
+ArrayLinkedList class unit tests
+
+- __init__
+    - create empty list if no value is provided
+    - create list with provided value as head node
+
+- from_iterable / extend / extend_left
+    - link values in given order
+    - return number of added nodes
+    - link values into free slots without creating nodes, keep values
+      added before a failing iterator, also for extend_left
+
+- add_new_head / append_node
+    - add node at the start / end of the list
+    - return node holding the given value
+
+- remove_node
+    - return None if node with given value not found
+    - remove first node with given value, head, middle and tail
+    - reuse slots of removed nodes
+
+- access_node_by_index / __getitem__
+    - return node or value at index, negative index also works
+    - return None / raise IndexError if index out of range
+    - return new list for a slice
+
+- update_at_index
+    - update value in place
+    - return None if index out of range
+
+- swap_nodes
+    - return False if same values or value not present
+    - swap first nodes with given values
+
+- remove_all / remove_if / remove_duplicates
+    - remove matching nodes in one pass, release their slots
+    - keep checked and unchecked values consistent when predicate raises
+
+- enable_index / disable_index / is_indexed
+    - keep the index flag
+
+- same results as LinkedList for the same operations
+    - also for bulk methods and reordering, tail stays the last node
+
+"""
+
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from node import Node
+from linked_list import LinkedList
+from array_linked_list import ArrayLinkedList
+
+
+# __init__()
+
+def test_empty_list() -> None:
+    """create empty list if no value is provided
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList()
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+    assert linked_list.get_length() == 0
+    assert linked_list.as_list() == []
+
+def test_head_node_value() -> None:
+    """create list with provided value as head node
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList(123)
+    head_node = linked_list.get_head_node()
+    assert isinstance(head_node, Node)
+    assert head_node.get_value() == 123
+    assert linked_list.as_list() == [123]
+
+
+# from_iterable() / extend() / extend_left()
+
+def test_bulk_order() -> None:
+    """link values in given order
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(x for x in [3, 4])
+    linked_list.extend([5, 6])
+    linked_list.extend_left([1, 2])
+    assert linked_list.as_list() == [1, 2, 3, 4, 5, 6]
+    assert linked_list.get_tail_node().get_value() == 6
+    empty: ArrayLinkedList = ArrayLinkedList()
+    empty.extend_left(['a', 'b'])
+    empty.append_node('c')
+    assert empty.as_list() == ['a', 'b', 'c']
+
+def test_bulk_count() -> None:
+    """return number of added nodes
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList()
+    assert linked_list.extend(range(4)) == 4
+    assert linked_list.extend_left([]) == 0
+    assert linked_list.extend_left('ab') == 2
+    assert len(linked_list) == 6
+
+def test_extend_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    """link values into free slots without creating nodes, keep values
+    added before a failing iterator, also for extend_left
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(range(4))
+    linked_list.remove_node(1)
+    linked_list.remove_node(2)
+    slot_count: int = len(linked_list._links)
+
+    def no_node(*args: object) -> None:
+        raise AssertionError("extend created a node")
+
+    monkeypatch.setattr(Node, "__init__", no_node)
+    assert linked_list.extend([7, 8, 9]) == 3
+    monkeypatch.undo()
+    assert len(linked_list._links) == slot_count + 1
+    assert linked_list.as_list() == [0, 3, 7, 8, 9]
+
+    def failing(*values: int) -> Iterator[int]:
+        yield from values
+        raise ValueError("stop")
+
+    with pytest.raises(ValueError):
+        linked_list.extend(failing(10))
+    assert linked_list.as_list() == [0, 3, 7, 8, 9, 10]
+    assert linked_list.get_length() == 6
+    assert linked_list.get_tail_node().get_value() == 10
+    linked_list.append_node(11)
+    assert linked_list[-1] == 11
+
+    for start in ([], [5, 6]):
+        front: ArrayLinkedList = ArrayLinkedList.from_iterable(start)
+        with pytest.raises(ValueError):
+            front.extend_left(failing(1, 2))
+        assert front.as_list() == [1, 2] + start
+        assert front.get_length() == 2 + len(start)
+        front.append_node(9)
+        assert front.as_list() == [1, 2] + start + [9]
+        assert front.get_tail_node().get_value() == 9
+
+
+# add_new_head() / append_node()
+
+def test_add_nodes() -> None:
+    """add node at the start / end of the list
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList()
+    linked_list.append_node(2)
+    linked_list.add_new_head(1)
+    linked_list.append_node(3)
+    assert linked_list.as_list() == [1, 2, 3]
+    assert linked_list.get_head_node().get_value() == 1
+    assert linked_list.get_tail_node().get_value() == 3
+
+def test_return_added_node() -> None:
+    """return node holding the given value
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList()
+    assert linked_list.append_node('a').get_value() == 'a'
+    assert linked_list.add_new_head('b').get_value() == 'b'
+
+
+# remove_node()
+
+def test_remove_not_found() -> None:
+    """return None if node with given value not found
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable([1, 2])
+    assert linked_list.remove_node(3) is None
+    assert ArrayLinkedList().remove_node(3) is None
+
+def test_remove_node() -> None:
+    """remove first node with given value, head, middle and tail
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable([1, 2, 3, 2, 4])
+    assert linked_list.remove_node(2).get_value() == 2
+    assert linked_list.as_list() == [1, 3, 2, 4]
+    linked_list.remove_node(1)
+    linked_list.remove_node(4)
+    assert linked_list.as_list() == [3, 2]
+    assert linked_list.get_tail_node().get_value() == 2
+    linked_list.remove_node(3)
+    linked_list.remove_node(2)
+    assert linked_list.as_list() == []
+    assert linked_list.get_tail_node() is None
+
+def test_reuse_slots() -> None:
+    """reuse slots of removed nodes
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(range(5))
+    slot_count: int = len(linked_list._links)
+    linked_list.remove_node(1)
+    linked_list.remove_node(3)
+    linked_list.append_node(5)
+    linked_list.add_new_head(6)
+    assert len(linked_list._links) == slot_count
+    assert linked_list.as_list() == [6, 0, 2, 4, 5]
+
+
+# access_node_by_index() / __getitem__()
+
+def test_access_by_index() -> None:
+    """return node or value at index, negative index also works
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(['a', 'b', 'c'])
+    assert linked_list.access_node_by_index(1).get_value() == 'b'
+    assert linked_list.access_node_by_index(-1).get_value() == 'c'
+    assert linked_list[0] == 'a'
+    assert linked_list[-3] == 'a'
+
+def test_access_out_of_range() -> None:
+    """return None / raise IndexError if index out of range
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(['a', 'b'])
+    assert linked_list.access_node_by_index(2) is None
+    assert linked_list.access_node_by_index(-3) is None
+    with pytest.raises(IndexError):
+        linked_list[2]
+
+def test_slice() -> None:
+    """return new list for a slice
+    """
+    values: list[int] = list(range(8))
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(values)
+    for index in (slice(1, 6, 2), slice(None, None, -1), slice(6, 1, -3)):
+        result = linked_list[index]
+        assert isinstance(result, ArrayLinkedList)
+        assert result.as_list() == values[index]
+
+
+# update_at_index()
+
+def test_update_at_index() -> None:
+    """update value in place
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(['a', 'b'])
+    assert linked_list.update_at_index(1, 'B').get_value() == 'B'
+    assert linked_list.update_at_index(-2, 'A').get_value() == 'A'
+    assert linked_list.as_list() == ['A', 'B']
+
+def test_update_out_of_range() -> None:
+    """return None if index out of range
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(['a', 'b'])
+    assert linked_list.update_at_index(2, 'c') is None
+    assert linked_list.update_at_index(-3, 'c') is None
+
+
+# swap_nodes()
+
+def test_swap_nodes_false() -> None:
+    """return False if same values or value not present
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(range(5))
+    assert linked_list.swap_nodes(2, 2) is False
+    assert linked_list.swap_nodes(2, 7) is False
+    assert ArrayLinkedList().swap_nodes(1, 2) is False
+
+def test_swap_nodes() -> None:
+    """swap first nodes with given values
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable([0, 1, 2, 1, 3])
+    assert linked_list.swap_nodes(3, 1) is True
+    assert linked_list.as_list() == [0, 3, 2, 1, 1]
+
+
+# remove_all() / remove_if() / remove_duplicates()
+
+def test_bulk_remove() -> None:
+    """remove matching nodes in one pass, release their slots
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(range(12))
+    slot_count: int = len(linked_list._links)
+    assert linked_list.remove_if(lambda value: value % 3 != 0) == 8
+    assert linked_list.as_list() == [0, 3, 6, 9]
+    assert linked_list.remove_all([0, 9, 99]) == 2
+    assert linked_list.remove_all([]) == 0
+    assert linked_list.get_tail_node().get_value() == 6
+    assert linked_list.extend(range(10)) == 10
+    assert len(linked_list._links) == slot_count
+    assert linked_list.remove_duplicates() == 2
+    assert linked_list.as_list() == [3, 6, 0, 1, 2, 4, 5, 7, 8, 9]
+    assert linked_list.remove_if(lambda value: True) == 10
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+
+def test_remove_if_predicate_raises() -> None:
+    """keep checked and unchecked values consistent when predicate raises
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable(range(10))
+
+    def predicate(value: int | str) -> bool:
+        if value == 7:
+            raise ValueError(value)
+        return value in (0, 6)
+
+    with pytest.raises(ValueError):
+        linked_list.remove_if(predicate)
+    assert linked_list.as_list() == [1, 2, 3, 4, 5, 7, 8, 9]
+    assert linked_list.get_length() == 8
+    assert linked_list.get_tail_node().get_value() == 9
+    with pytest.raises(ValueError):
+        linked_list.remove_if(lambda value: value == 9 or predicate(value))
+    assert linked_list.remove_if(lambda value: value == 9) == 1
+    assert linked_list.get_tail_node().get_value() == 8
+
+
+# enable_index() / disable_index() / is_indexed()
+
+def test_index_flag() -> None:
+    """keep the index flag
+    """
+    linked_list: ArrayLinkedList = ArrayLinkedList.from_iterable([1, 2], indexed=True)
+    assert linked_list.is_indexed() is True
+    linked_list.disable_index()
+    assert linked_list.is_indexed() is False
+    linked_list.enable_index()
+    assert linked_list.is_indexed() is True
+    assert ArrayLinkedList().is_indexed() is False
+    assert ArrayLinkedList(1, indexed=True).is_indexed() is True
+
+
+# parity with LinkedList
+
+def test_same_as_linked_list() -> None:
+    """same results as LinkedList for the same operations
+    """
+    operations = [
+        ("extend", ([1, 2, 3, 4, 5],)), ("add_new_head", (0,)), ("remove_node", (3,)),
+        ("append_node", (6,)), ("swap_nodes", (0, 6)), ("update_at_index", (-2, 9)),
+        ("remove_node", (6,)), ("extend_left", ([7, 8],)), ("swap_nodes", (8, 2)),
+        ("remove_node", (0,)), ("append_node", (3,)),
+    ]
+    linked_list: LinkedList = LinkedList()
+    array_linked_list: ArrayLinkedList = ArrayLinkedList()
+    for name, args in operations:
+        result = getattr(linked_list, name)(*args)
+        array_result = getattr(array_linked_list, name)(*args)
+        if isinstance(result, Node):
+            assert array_result.get_value() == result.get_value()
+        else:
+            assert array_result == result
+        assert array_linked_list.as_list() == linked_list.as_list()
+        assert array_linked_list.get_length() == linked_list.get_length()
+
+def test_bulk_methods_same_as_linked_list() -> None:
+    """also for bulk methods and reordering, tail stays the last node
+    """
+    operations = [
+        ("extend", ([5, 3, 9, 3, 1, 7, 5, 2, 8],)), ("remove_duplicates", ()),
+        ("remove_all", ([9, 4],)), ("remove_all", ([],)),
+        ("remove_if", (lambda value: value == 2,)), ("move_to_front", (7,)),
+        ("move_to_front", (7,)), ("move_to_front", (42,)), ("move_to_front", (8,)),
+        ("rotate", (2,)), ("rotate", (-3,)), ("rotate", (0,)),
+        ("update_many", ({0: 4, -1: 6, 99: 1},)), ("update_many", ([(1, 2), (1, 3)],)),
+        ("sort", ()), ("apply_permutation", ([4, 3, 2, 1, 0],)),
+        ("apply_permutation", ([0, 0, 1, 2, 3],)), ("sort", (lambda value: value % 3, True)),
+        ("extend", ([10, 11, 12],)), ("sort", (None, True)),
+    ]
+    linked_list: LinkedList = LinkedList()
+    array_linked_list: ArrayLinkedList = ArrayLinkedList()
+    for name, args in operations:
+        result = getattr(linked_list, name)(*args)
+        array_result = getattr(array_linked_list, name)(*args)
+        if isinstance(result, Node):
+            assert array_result.get_value() == result.get_value()
+        else:
+            assert array_result == result, name
+        assert array_linked_list.as_list() == linked_list.as_list(), name
+        assert array_linked_list.get_length() == linked_list.get_length()
+    rng: random.Random = random.Random(5)
+    for _ in range(300):
+        name, args = rng.choice([
+            ("update_many", ([(rng.randrange(-15, 15), rng.randrange(10))],)),
+            ("move_to_front", (rng.randrange(13),)), ("rotate", (rng.randrange(-20, 20),)),
+            ("sort", (rng.choice([None, lambda value: value % 3]), rng.random() < 0.5)),
+            ("apply_permutation", (rng.sample(range(linked_list.length), linked_list.length),)),
+            ("remove_all", ([rng.randrange(13)],)),
+            ("extend", ([rng.randrange(10)],)), ("append_node", (rng.randrange(10),)),
+        ])
+        result = getattr(linked_list, name)(*args)
+        array_result = getattr(array_linked_list, name)(*args)
+        if isinstance(result, Node):
+            assert array_result.get_value() == result.get_value()
+        else:
+            assert array_result == result, name
+        assert array_linked_list.as_list() == linked_list.as_list(), name
+        if linked_list.length:
+            assert array_linked_list.get_tail_node().get_value() == linked_list[-1]
+        else:
+            assert array_linked_list.get_tail_node() is None
@@ -0,0 +1,94 @@
+"""
+ConcurrentLinkedList contention benchmark:
+    - writer threads append, swap and remove values, reader threads take snapshots
+    - every combination of writer and reader thread counts runs for a fixed time
+    - prints writes and snapshots per second for each combination
+    - with the GIL only one thread runs python code at a time, so the numbers show
+      how much the threads get in each other's way, not parallel speedup
+
+usage:
+    python benchmarks/concurrent_contention.py [seconds_per_run] [list_size]
+
+"""
+from __future__ import annotations
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from concurrent_linked_list import ConcurrentLinkedList  # pylint: disable=wrong-import-position
+
+WRITER_COUNTS: tuple[int, ...] = (1, 2, 4, 8)
+READER_COUNTS: tuple[int, ...] = (0, 1, 2, 4, 8)
+
+
+def run(writers: int, readers: int, seconds: float, list_size: int) -> tuple[float, float]:
+    """run writer and reader threads against one list
+
+    Args:
+        writers (int): number of writer threads
+        readers (int): number of reader threads
+        seconds (float): duration of the run
+        list_size (int): number of values in the list
+
+    Returns:
+        tuple[float, float]: writes per second and snapshots per second
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(list_size))
+    stop: threading.Event = threading.Event()
+    writes: list[int] = [0] * writers
+    snapshots: list[int] = [0] * readers
+
+    def writer(number: int) -> None:
+        rng: random.Random = random.Random(number)
+        extra_value: int = list_size + number
+        count: int = 0
+        while not stop.is_set():
+            linked_list.swap_nodes(rng.randrange(list_size), rng.randrange(list_size))
+            linked_list.append_node(extra_value)
+            linked_list.remove_node(extra_value)
+            count += 3
+        writes[number] = count
+
+    def reader(number: int) -> None:
+        count: int = 0
+        while not stop.is_set():
+            linked_list.snapshot()
+            count += 1
+        snapshots[number] = count
+
+    threads: list[threading.Thread] = (
+        [threading.Thread(target=writer, args=(number,)) for number in range(writers)]
+        + [threading.Thread(target=reader, args=(number,)) for number in range(readers)]
+    )
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(writes) / seconds, sum(snapshots) / seconds
+
+
+def main(seconds: float, list_size: int) -> None:
+    """print throughput table
+
+    Args:
+        seconds (float): duration of every run
+        list_size (int): number of values in the list
+    """
+    print(f"python {sys.version.split()[0]}, list of {list_size:,}, {seconds}s per run")
+    print(f"{'writers':>8}{'readers':>8}{'writes/s':>12}{'snapshots/s':>14}")
+    for writers in WRITER_COUNTS:
+        for readers in READER_COUNTS:
+            write_rate, snapshot_rate = run(writers, readers, seconds, list_size)
+            print(f"{writers:>8}{readers:>8}{write_rate:>12,.0f}{snapshot_rate:>14,.1f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000)
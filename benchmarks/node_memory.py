@@ -0,0 +1,68 @@
+"""
+Node memory report:
+    - builds a chain of nodes and measures the memory it allocates with tracemalloc
+    - compares the slotted node.Node with a node that keeps a per instance __dict__
+    - values are small ints, which are cached by python and cost nothing per node,
+      so the numbers are the cost of the chain itself
+
+usage:
+    python benchmarks/node_memory.py [node_count]
+
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from node import Node  # pylint: disable=wrong-import-position
+
+
+class DictNode:
+    """node with the same fields as Node but stored in a per instance __dict__
+    """
+
+    def __init__(self, value: int | str, next_node: DictNode | None = None) -> None:
+        self.value = value
+        self.next_node = next_node
+
+
+def chain_bytes(node_class: type, node_count: int) -> int:
+    """measure bytes allocated by a chain of node_count nodes
+
+    Args:
+        node_class (type): class used for the nodes
+        node_count (int): number of nodes in the chain
+
+    Returns:
+        int: allocated bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    head_node = None
+    for _ in range(node_count):
+        head_node = node_class(1, head_node)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del head_node
+    return allocated
+
+
+def main(node_count: int) -> None:
+    """print bytes per element for every node layout
+
+    Args:
+        node_count (int): number of nodes in the chain
+    """
+    print(f"python {sys.version.split()[0]}, {node_count:,} nodes")
+    print(f"{'layout':<12}{'total MiB':>12}{'bytes/node':>12}")
+    for name, node_class in (("__dict__", DictNode), ("__slots__", Node)):
+        allocated: int = chain_bytes(node_class, node_count)
+        print(f"{name:<12}{allocated / 2**20:>12.1f}{allocated / node_count:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
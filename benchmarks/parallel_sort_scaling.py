@@ -0,0 +1,74 @@
+"""
+parallel_sort scaling benchmark:
+    - sorts the same random int array with 1, 2, 4 ... up to all available cpus
+    - one worker is the serial introsort, so the speedup column is relative to it
+    - also times a few sizes around PARALLEL_THRESHOLD with all cpus, to check
+      where the process pool starts to pay off
+    - on a machine with a single cpu every run is serial work plus overhead
+
+usage:
+    python benchmarks/parallel_sort_scaling.py [size]
+
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "algorithms"))
+
+# pylint: disable=wrong-import-position
+from parallel_sort import PARALLEL_THRESHOLD, available_cpus, parallel_sort
+
+
+def sort_time(array: list[int], workers: int) -> float:
+    """wall time of one parallel_sort run, without the serial fallback
+
+    Args:
+        array (list[int]): values to sort
+        workers (int): number of worker processes
+
+    Returns:
+        float: seconds
+    """
+    start: float = time.perf_counter()
+    parallel_sort(array, workers=workers, threshold=0)
+    return time.perf_counter() - start
+
+
+def main(size: int) -> None:
+    """print time and speedup per worker count, and time per size around the threshold
+
+    Args:
+        size (int): number of values to sort
+    """
+    cpus: int = available_cpus()
+    rng: random.Random = random.Random(23)
+    array: list[int] = [rng.randrange(1 << 62) for _ in range(size)]
+    print(f"python {sys.version.split()[0]}, {size:,} ints, {cpus} cpus")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+    worker_counts: list[int] = [1]
+    while worker_counts[-1] * 2 <= cpus:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != cpus:
+        worker_counts.append(cpus)
+    serial: float = 0.0
+    for workers in worker_counts:
+        seconds: float = sort_time(array, workers)
+        serial = serial or seconds
+        print(f"{workers:>8}{seconds:>10.2f}{serial / seconds:>10.2f}")
+    pool_size: int = max(2, cpus)
+    print(f"\nthreshold {PARALLEL_THRESHOLD:,}, serial vs {pool_size} workers")
+    print(f"{'size':>10}{'serial':>10}{'parallel':>10}")
+    for small_size in (PARALLEL_THRESHOLD // 4, PARALLEL_THRESHOLD, PARALLEL_THRESHOLD * 4):
+        if small_size > size:
+            break
+        small: list[int] = array[:small_size]
+        print(f"{small_size:>10,}{sort_time(small, 1):>10.3f}"
+              f"{sort_time(small, pool_size):>10.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
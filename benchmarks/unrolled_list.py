@@ -0,0 +1,93 @@
+"""
+Unrolled linked list benchmark:
+    - compares LinkedList, one Node per value, with UnrolledLinkedList, blocks of values
+    - memory: bytes allocated to build the list, measured with tracemalloc
+    - traversal: time to iterate all values, as_list, and node_present for a missing value
+    - values are distinct ints, their own memory is not part of the numbers
+      because the same int objects are shared by both lists
+
+usage:
+    python benchmarks/unrolled_list.py [size ...]
+
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from linked_list import LinkedList
+from unrolled_linked_list import UnrolledLinkedList
+
+DEFAULT_SIZES: tuple[int, ...] = (100_000, 1_000_000, 10_000_000)
+
+
+def build_bytes(factory: Callable[[list[int]], object], values: list[int]) -> tuple[object, int]:
+    """build a list and measure the memory it allocates
+
+    Args:
+        factory (Callable[[list[int]], object]): builds the list from values
+        values (list[int]): values of the list
+
+    Returns:
+        tuple[object, int]: built list and allocated bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    built = factory(values)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, allocated
+
+
+def best_time(action: Callable[[], object], repeat: int = 3) -> float:
+    """best wall time of a few runs
+
+    Args:
+        action (Callable[[], object]): code to time
+        repeat (int, optional): number of runs. Defaults to 3.
+
+    Returns:
+        float: seconds of the fastest run
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes: list[int]) -> None:
+    """print memory and traversal table for every size
+
+    Args:
+        sizes (list[int]): list sizes to measure
+    """
+    layouts: tuple[tuple[str, Callable[[list[int]], object]], ...] = (
+        ("LinkedList", LinkedList.from_iterable),
+        ("Unrolled64", UnrolledLinkedList.from_iterable),
+    )
+    print(f"python {sys.version.split()[0]}")
+    print(f"{'size':>11} {'layout':<11}{'bytes/value':>12}{'iterate s':>11}"
+          f"{'as_list s':>11}{'missing s':>11}")
+    for size in sizes:
+        values: list[int] = list(range(size))
+        for name, factory in layouts:
+            built, allocated = build_bytes(factory, values)
+            iterate: float = best_time(lambda: sum(1 for _ in built))
+            as_list: float = best_time(built.as_list)
+            missing: float = best_time(lambda: built.node_present(-1))
+            print(f"{size:>11,} {name:<11}{allocated / size:>12.1f}{iterate:>11.3f}"
+                  f"{as_list:>11.3f}{missing:>11.3f}")
+            del built
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or list(DEFAULT_SIZES))
@@ -0,0 +1,408 @@
+"""
+Concurrent Linked List:
+    - Linked list which can be shared between threads.
+    - Every node has its own lock. Writers walk the list hand over hand, holding the
+      lock of a node before releasing the lock of the node behind it, so writers
+      working on different parts of the list do not wait for each other.
+    - Locks are always taken in list order, so writers cannot deadlock.
+    - A sentinel node sits before the head node, so every real node has a previous node.
+    - Readers never take node locks and never wait for a write to finish, writers never
+      wait for a snapshot to finish. Both only share a short lock around the version
+      counter. Every node keeps the recent versions of its link to the next node:
+      a write stamps the links it changes with a version number, taken while it
+      still holds its node locks, so all links of one write appear at once.
+      A snapshot reads the newest version and follows, at every node, the newest
+      link of that version or older.
+    - When no snapshot is running, a write keeps only the new link of every node it
+      changed, so removed nodes are freed at once. Links older than the oldest running
+      snapshot are dropped by the next write to that node.
+
+"""
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+from node import Node
+
+# single item list holding the version of a write, None until the write is committed
+Stamp = list[int | None]
+# stamp of links which every snapshot sees
+VISIBLE: Stamp = [0]
+
+
+class LockedNode(Node):
+    """Node with its own lock and the recent versions of its link
+    """
+
+    __slots__ = ("lock", "links")
+
+    def __init__(self, value: int | str | None, next_node: LockedNode | None = None) -> None:
+        """creates a node with value, link to next node and a lock
+
+        A new node is only reachable through links of the write which created it,
+        so its first link is visible to every snapshot.
+
+        Args:
+            value (int | str | None): value of the node, None for the sentinel
+            next_node (LockedNode | None, optional): next node. Defaults to None.
+        """
+        super().__init__(value, next_node)
+        self.lock: threading.Lock = threading.Lock()
+        # (stamp, next node) from oldest to newest, replaced as a whole, never changed
+        self.links: tuple[tuple[Stamp, LockedNode | None], ...] = ((VISIBLE, next_node),)
+
+
+class ConcurrentLinkedList:
+    """
+    ConcurrentLinkedList Class
+    """
+
+    def __init__(self, head_node_value: int | str | None = None) -> None:
+        """create linked list with given value as head node
+
+        Args:
+            head_node_value (int | str | None, optional): value for head node of the list.
+            Defaults to None.
+        """
+        self._sentinel: LockedNode = LockedNode(None)
+        # last node, the sentinel when the list is empty. only changed while holding its lock
+        self._tail: LockedNode = self._sentinel
+        self._length: int = 0
+        # guards the fields below, only held for a few assignments
+        self._meta_lock: threading.Lock = threading.Lock()
+        self._version: int = 0
+        # versions of running snapshots, and the oldest version any of them can read
+        self._readers: Counter[int] = Counter()
+        self._oldest_read: int = 0
+        if head_node_value is not None:
+            self.append_node(head_node_value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str]) -> ConcurrentLinkedList:
+        """create linked list from given values in a single pass
+
+        Args:
+            values (Iterable[int | str]): values in list order. Generators are consumed lazily
+
+        Returns:
+            ConcurrentLinkedList: new linked list holding given values
+        """
+        linked_list: ConcurrentLinkedList = cls()
+        # no other thread can see the new list yet, so nodes are linked without locks
+        last_node: LockedNode = linked_list._sentinel
+        length: int = 0
+        for value in values:
+            new_node: LockedNode = LockedNode(value)
+            last_node.next_node = new_node
+            last_node.links = ((VISIBLE, new_node),)
+            last_node = new_node
+            length += 1
+        linked_list._tail = last_node
+        linked_list._length = length
+        return linked_list
+
+    def _set_next(self, node: LockedNode, next_node: LockedNode | None, stamp: Stamp) -> None:
+        """link node to next_node as part of the write with given stamp, node must be locked
+
+        Args:
+            node (LockedNode): node whose link changes
+            next_node (LockedNode | None): new next node
+            stamp (Stamp): stamp of the running write
+        """
+        node.next_node = next_node
+        links: tuple[tuple[Stamp, LockedNode | None], ...] = node.links
+        oldest_read: int = self._oldest_read
+        # keep the newest committed link every running and future snapshot can see
+        for position in range(len(links) - 1, 0, -1):
+            version: int | None = links[position][0][0]
+            if version is not None and version <= oldest_read:
+                links = links[position:]
+                break
+        node.links = links + ((stamp, next_node),)
+
+    def _commit(self, stamp: Stamp, length_change: int, *written: LockedNode) -> None:
+        """make every link of a write visible to new snapshots, node locks must still be held
+
+        Args:
+            stamp (Stamp): stamp of the write
+            length_change (int): change of length done by the write
+            written (LockedNode): nodes whose links the write changed
+        """
+        with self._meta_lock:
+            self._version += 1
+            stamp[0] = self._version
+            self._length += length_change
+            if not self._readers:
+                self._oldest_read = self._version
+                # no snapshot can need the older links, they would keep removed nodes alive
+                for node in written:
+                    node.links = ((VISIBLE, node.next_node),)
+
+    def add_new_head(self, head_node_value: int | str) -> Node:
+        """adds new head node to the list
+
+        Args:
+            head_node_value (int | str): value of new head node
+
+        Returns:
+            Node: new head node
+        """
+        stamp: Stamp = [None]
+        with self._sentinel.lock:
+            new_node: LockedNode = LockedNode(head_node_value, self._sentinel.next_node)
+            self._set_next(self._sentinel, new_node, stamp)
+            if self._tail is self._sentinel:
+                self._tail = new_node
+            self._commit(stamp, 1, self._sentinel)
+        return new_node
+
+    def append_node(self, new_node_value: int | str) -> Node:
+        """append node with given value at the end of the list
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            Node: newly appended node
+        """
+        new_node: LockedNode = LockedNode(new_node_value)
+        stamp: Stamp = [None]
+        while True:
+            tail_node: LockedNode = self._tail
+            with tail_node.lock:
+                # tail may have been removed or moved while waiting for its lock
+                if tail_node is self._tail and tail_node.next_node is None:
+                    self._set_next(tail_node, new_node, stamp)
+                    self._tail = new_node
+                    self._commit(stamp, 1, tail_node)
+                    return new_node
+
+    def remove_node(self, value: int | str) -> Node | None:
+        """remove first node with given value from the list
+
+        Args:
+            value (int | str): value to remove
+
+        Returns:
+            Node | None: returns removed node or None if not found
+        """
+        previous_node: LockedNode = self._sentinel
+        previous_node.lock.acquire()
+        current_node: LockedNode | None = previous_node.next_node
+        while current_node is not None:
+            current_node.lock.acquire()
+            if current_node.value == value:
+                stamp: Stamp = [None]
+                self._set_next(previous_node, current_node.next_node, stamp)
+                if current_node is self._tail:
+                    self._tail = previous_node
+                self._commit(stamp, -1, previous_node)
+                current_node.lock.release()
+                previous_node.lock.release()
+                return current_node
+            previous_node.lock.release()
+            previous_node = current_node
+            current_node = current_node.next_node
+        previous_node.lock.release()
+        return None
+
+    def swap_nodes(self, value_1: int | str, value_2: int | str) -> bool:
+        """swap first nodes with given values
+
+        The nodes and the nodes before them stay locked from the moment they are found
+        until the swap is done.
+
+        Args:
+            value_1 (int | str): value of node 1
+            value_2 (int | str): value of node 2
+
+        Returns:
+            bool: returns True on successful swap else False
+        """
+        if value_1 == value_2:
+            return False
+        held: list[LockedNode] = []
+        try:
+            return self._swap_locked(value_1, value_2, held)
+        finally:
+            for node in reversed(held):
+                node.lock.release()
+
+    def _swap_locked(self, value_1: int | str, value_2: int | str,
+                     held: list[LockedNode]) -> bool:
+        """find and swap first nodes with given values, locked nodes are added to held
+
+        Args:
+            value_1 (int | str): value of node 1
+            value_2 (int | str): value of node 2
+            held (list[LockedNode]): locked nodes, released by the caller
+
+        Returns:
+            bool: returns True on successful swap else False
+        """
+        # first node with either value
+        previous_node: LockedNode = self._sentinel
+        previous_node.lock.acquire()
+        held.append(previous_node)
+        current_node: LockedNode | None = previous_node.next_node
+        while current_node is not None:
+            current_node.lock.acquire()
+            held.append(current_node)
+            if current_node.value in (value_1, value_2):
+                break
+            held.remove(previous_node)
+            previous_node.lock.release()
+            previous_node = current_node
+            current_node = current_node.next_node
+        if current_node is None:
+            return False
+        previous_1, node_1 = previous_node, current_node
+        other_value: int | str = value_2 if node_1.value == value_1 else value_1
+        # first node with the other value, previous_1 and node_1 stay locked
+        previous_node, current_node = node_1, node_1.next_node
+        while current_node is not None:
+            current_node.lock.acquire()
+            held.append(current_node)
+            if current_node.value == other_value:
+                break
+            if previous_node is not node_1:
+                held.remove(previous_node)
+                previous_node.lock.release()
+            previous_node = current_node
+            current_node = current_node.next_node
+        if current_node is None:
+            return False
+        previous_2, node_2 = previous_node, current_node
+        stamp: Stamp = [None]
+        next_1: LockedNode | None = node_1.next_node
+        next_2: LockedNode | None = node_2.next_node
+        if next_1 is node_2:
+            self._set_next(previous_1, node_2, stamp)
+            self._set_next(node_1, next_2, stamp)
+            self._set_next(node_2, node_1, stamp)
+        else:
+            self._set_next(previous_1, node_2, stamp)
+            self._set_next(previous_2, node_1, stamp)
+            self._set_next(node_1, next_2, stamp)
+            self._set_next(node_2, next_1, stamp)
+        if node_1.next_node is None:
+            self._tail = node_1
+        self._commit(stamp, 0, previous_1, previous_2, node_1, node_2)
+        return True
+
+    def snapshot(self) -> tuple[int | str, ...]:
+        """get values of the list as they were at a single moment, without taking node locks
+
+        Writes which finish during the walk are not seen, writers are never held back.
+
+        Returns:
+            tuple[int | str, ...]: values from head to tail
+        """
+        with self._meta_lock:
+            version: int = self._version
+            self._readers[version] += 1
+        try:
+            return self._walk(version)
+        finally:
+            with self._meta_lock:
+                self._readers[version] -= 1
+                if not self._readers[version]:
+                    del self._readers[version]
+                self._oldest_read = min(self._readers, default=self._version)
+
+    def _walk(self, version: int) -> tuple[int | str, ...]:
+        """values of the list at given version, the version must be registered in _readers
+
+        Args:
+            version (int): version to read
+
+        Returns:
+            tuple[int | str, ...]: values from head to tail
+        """
+        values: list[int | str] = []
+        append = values.append
+        next_at = self._next_at
+        current_node: LockedNode = self._sentinel
+        while True:
+            stamp, next_node = current_node.links[-1]
+            # newest link is usually finished and old enough, skip the search then
+            if stamp[0] is None or stamp[0] > version:
+                next_node = next_at(current_node, version)
+            if next_node is None:
+                return tuple(values)
+            append(next_node.value)
+            current_node = next_node
+
+    @staticmethod
+    def _next_at(node: LockedNode, version: int) -> LockedNode | None:
+        """next node as it was at given version
+
+        Args:
+            node (LockedNode): node to follow
+            version (int): version of the snapshot
+
+        Returns:
+            LockedNode | None: next node at that version
+        """
+        links: tuple[tuple[Stamp, LockedNode | None], ...] = node.links
+        for position in range(len(links) - 1, 0, -1):
+            stamp, next_node = links[position]
+            if stamp[0] is not None and stamp[0] <= version:
+                return next_node
+        return links[0][1]
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of a snapshot of the list
+
+        Yields:
+            int | str: value of next node
+        """
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self._length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in a snapshot of the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self.snapshot()
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self._length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in a snapshot of the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self
+
+    def as_list(self) -> list[int | str]:
+        """return snapshot of the list in form of list
+
+        Returns:
+            list[int | str]: list of str of list of int. Depending on dtype of value
+        """
+        return list(self.snapshot())
@@ -0,0 +1,261 @@
+"""
+ConcurrentLinkedList class unit tests
+
+- __init__ / from_iterable
+    - create empty list, list with given head value or list with given values
+
+- add_new_head / append_node
+    - add nodes at the start / end of the list
+
+- remove_node
+    - remove first node with given value, head, middle and tail
+    - return None if not found
+
+- swap_nodes
+    - swap first nodes with given values, adjacent, head and tail
+    - return False if same values or value not found
+
+- snapshot
+    - return values from head to tail
+    - iteration and membership use a snapshot
+    - do not wait for a writer holding node locks
+    - keep reading the version a snapshot started at while writers go on,
+      drop old links once no snapshot needs them
+    - free removed nodes at once when no snapshot is running
+
+- threads
+    - keep every appended and added value
+    - remove every value exactly once
+    - readers only see whole states while writers swap nodes
+
+"""
+
+import gc
+import threading
+
+from node import Node
+from concurrent_linked_list import ConcurrentLinkedList, LockedNode
+
+
+def run_threads(targets: list) -> None:
+    """start all targets as threads and wait for them
+    """
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+# __init__() / from_iterable()
+
+def test_create_list() -> None:
+    """create empty list, list with given head value or list with given values
+    """
+    assert ConcurrentLinkedList().as_list() == []
+    assert ConcurrentLinkedList('abc').as_list() == ['abc']
+    assert ConcurrentLinkedList(0).get_length() == 1
+    assert ConcurrentLinkedList.from_iterable(x for x in 'abc').as_list() == ['a', 'b', 'c']
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable([1, 2, 3])
+    assert linked_list.as_list() == [1, 2, 3]
+    assert linked_list.get_length() == 3
+
+
+# add_new_head() / append_node()
+
+def test_add_nodes() -> None:
+    """add nodes at the start / end of the list
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList()
+    linked_list.add_new_head(2)
+    linked_list.append_node(3)
+    result = linked_list.add_new_head(1)
+    assert isinstance(result, Node)
+    assert result.get_value() == 1
+    assert linked_list.as_list() == [1, 2, 3]
+    assert len(linked_list) == 3
+
+
+# remove_node()
+
+def test_remove_node() -> None:
+    """remove first node with given value, head, middle and tail
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable([1, 2, 3, 2, 4])
+    assert linked_list.remove_node(2).get_value() == 2
+    assert linked_list.remove_node(1).get_value() == 1
+    assert linked_list.remove_node(4).get_value() == 4
+    assert linked_list.as_list() == [3, 2]
+    linked_list.append_node(5)
+    assert linked_list.as_list() == [3, 2, 5]
+    assert linked_list.get_length() == 3
+
+def test_remove_not_found() -> None:
+    """return None if not found
+    """
+    assert ConcurrentLinkedList().remove_node(1) is None
+    assert ConcurrentLinkedList.from_iterable([1]).remove_node(2) is None
+
+
+# swap_nodes()
+
+def test_swap_nodes() -> None:
+    """swap first nodes with given values, adjacent, head and tail
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(6))
+    assert linked_list.swap_nodes(0, 5) is True
+    assert linked_list.as_list() == [5, 1, 2, 3, 4, 0]
+    assert linked_list.swap_nodes(3, 2) is True
+    assert linked_list.as_list() == [5, 1, 3, 2, 4, 0]
+    assert linked_list.swap_nodes(4, 0) is True
+    assert linked_list.as_list() == [5, 1, 3, 2, 0, 4]
+    linked_list.append_node(6)
+    assert linked_list.as_list() == [5, 1, 3, 2, 0, 4, 6]
+
+def test_swap_nodes_false() -> None:
+    """return False if same values or value not found
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(3))
+    assert linked_list.swap_nodes(1, 1) is False
+    assert linked_list.swap_nodes(1, 7) is False
+    assert linked_list.swap_nodes(7, 1) is False
+    assert linked_list.as_list() == [0, 1, 2]
+    assert linked_list.swap_nodes(1, 2) is True
+
+
+# snapshot()
+
+def test_snapshot() -> None:
+    """return values from head to tail
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable('abc')
+    assert linked_list.snapshot() == ('a', 'b', 'c')
+
+def test_snapshot_iteration() -> None:
+    """iteration and membership use a snapshot
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(4))
+    for value in linked_list:
+        linked_list.remove_node(value)
+    assert linked_list.as_list() == []
+    linked_list.append_node(1)
+    assert 1 in linked_list
+    assert linked_list.node_present(2) is False
+
+
+def test_snapshot_with_locked_nodes() -> None:
+    """do not wait for a writer holding node locks
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(4))
+    with linked_list._sentinel.lock:
+        writer: threading.Thread = threading.Thread(target=lambda: linked_list.remove_node(2))
+        writer.start()
+        assert linked_list.snapshot() == (0, 1, 2, 3)
+        assert writer.is_alive()
+    writer.join()
+    assert linked_list.snapshot() == (0, 1, 3)
+
+def test_snapshot_version() -> None:
+    """keep reading the version a snapshot started at while writers go on,
+    drop old links once no snapshot needs them
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(5))
+    # a snapshot which is still walking the list at this version
+    version: int = linked_list._version
+    linked_list._readers[version] += 1
+    linked_list._oldest_read = version
+    for _ in range(3):
+        assert linked_list.swap_nodes(0, 4) is True
+        linked_list.remove_node(2)
+        linked_list.add_new_head(2)
+    assert linked_list._walk(version) == (0, 1, 2, 3, 4)
+    assert linked_list.snapshot() == (2, 4, 1, 3, 0)
+    linked_list._readers.clear()
+    linked_list._oldest_read = linked_list._version
+    for value in (2, 4, 1, 3, 0):
+        linked_list.remove_node(value)
+        linked_list.append_node(value)
+    assert linked_list.snapshot() == (2, 4, 1, 3, 0)
+    node = linked_list._sentinel
+    while node is not None:
+        assert len(node.links) <= 2
+        node = node.next_node
+
+def test_removed_nodes_freed() -> None:
+    """free removed nodes at once when no snapshot is running
+    """
+
+    def live_nodes() -> int:
+        gc.collect()
+        return sum(isinstance(item, LockedNode) for item in gc.get_objects())
+
+    before: int = live_nodes()
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(500))
+    for value in range(499, 0, -1):
+        linked_list.remove_node(value)
+    assert linked_list.as_list() == [0]
+    # sentinel and node 0
+    assert live_nodes() - before == 2
+    assert len(linked_list._sentinel.links) == 1
+    linked_list.append_node(1)
+    assert linked_list.swap_nodes(0, 1) is True
+    linked_list.remove_node(1)
+    assert linked_list.as_list() == [0]
+    assert live_nodes() - before == 2
+
+
+# threads
+
+def test_threads_add() -> None:
+    """keep every appended and added value
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList()
+
+    def writer(start: int) -> None:
+        for value in range(start, start + 500):
+            if value % 2:
+                linked_list.append_node(value)
+            else:
+                linked_list.add_new_head(value)
+
+    run_threads([lambda start=start: writer(start) for start in range(0, 4000, 500)])
+    assert sorted(linked_list.as_list()) == list(range(4000))
+    assert linked_list.get_length() == 4000
+
+def test_threads_remove() -> None:
+    """remove every value exactly once
+    """
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(range(2000))
+    removed: list[int] = []
+
+    def remover(values: range) -> None:
+        for value in values:
+            node = linked_list.remove_node(value)
+            if node is not None:
+                removed.append(node.get_value())
+        linked_list.append_node(-1)
+
+    run_threads([lambda start=start: remover(range(start, 2000, 4)) for start in range(4)])
+    assert sorted(removed) == list(range(2000))
+    assert linked_list.as_list() == [-1, -1, -1, -1]
+
+def test_threads_snapshot_while_swapping() -> None:
+    """readers only see whole states while writers swap nodes
+    """
+    values: list[int] = list(range(200))
+    linked_list: ConcurrentLinkedList = ConcurrentLinkedList.from_iterable(values)
+    failures: list[tuple] = []
+
+    def swapper(offset: int) -> None:
+        for step in range(300):
+            linked_list.swap_nodes((step * 7 + offset) % 200, (step * 13 + 5) % 200)
+
+    def reader() -> None:
+        for _ in range(50):
+            snapshot = linked_list.snapshot()
+            if sorted(snapshot) != values:
+                failures.append(snapshot)
+
+    run_threads([lambda: swapper(1), lambda: swapper(2), reader, reader])
+    assert failures == []
+    assert sorted(linked_list.as_list()) == values
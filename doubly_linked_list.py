@@ -0,0 +1,411 @@
+"""
+Doubly Linked List:
+    - Linked list whose nodes link to both the next and the previous node.
+    - Can be traversed from head to tail and from tail to head.
+    - A node can be removed, or a new node inserted next to it, in O(1) given the node
+      itself, no scan for the previous node is needed.
+    - Negative indexes are walked from the tail node.
+
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from node import DoublyNode
+
+
+class DoublyLinkedList:
+    """
+    DoublyLinkedList Class
+    """
+
+    def __init__(self, head_node_value: int | str | None = None) -> None:
+        """create doubly linked list with given value as head node
+
+        Args:
+            head_node_value (int | str | None, optional): value for head node of the list.
+            Defaults to None.
+        """
+        self.head_node: DoublyNode | None = None
+        self.tail_node: DoublyNode | None = None
+        self.length: int = 0
+        if head_node_value is not None:
+            self.append_node(head_node_value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str]) -> DoublyLinkedList:
+        """create doubly linked list from given values in a single pass
+
+        Args:
+            values (Iterable[int | str]): values in list order
+
+        Returns:
+            DoublyLinkedList: new list holding given values
+        """
+        linked_list: DoublyLinkedList = cls()
+        linked_list.extend(values)
+        return linked_list
+
+    def _link_between(self, new_node: DoublyNode, prev_node: DoublyNode | None,
+                      next_node: DoublyNode | None) -> DoublyNode:
+        """link new_node between two neighbouring nodes, None for list ends
+
+        Args:
+            new_node (DoublyNode): node to link
+            prev_node (DoublyNode | None): node before new_node, None for head
+            next_node (DoublyNode | None): node after new_node, None for tail
+
+        Returns:
+            DoublyNode: linked node
+        """
+        new_node.prev_node = prev_node
+        new_node.next_node = next_node
+        if prev_node is None:
+            self.head_node = new_node
+        else:
+            prev_node.next_node = new_node
+        if next_node is None:
+            self.tail_node = new_node
+        else:
+            next_node.prev_node = new_node
+        self.length += 1
+        return new_node
+
+    def _check_linked(self, node: DoublyNode) -> None:
+        """check in O(1) that node is linked into this list
+
+        A detached node, or an end node of another list, fails the check. A middle
+        node of another list cannot be told apart without a scan.
+
+        Args:
+            node (DoublyNode): node to check
+
+        Raises:
+            ValueError: if node is not linked into this list
+        """
+        if (node.prev_node is None and node is not self.head_node) or \
+                (node.next_node is None and node is not self.tail_node):
+            raise ValueError("node is not in this doubly linked list")
+
+    def get_head_node(self) -> DoublyNode | None:
+        """get head node of the list
+
+        Returns:
+            DoublyNode | None: returns node if present else None
+        """
+        return self.head_node
+
+    def get_tail_node(self) -> DoublyNode | None:
+        """get tail node of the list
+
+        Returns:
+            DoublyNode | None: returns node if present else None
+        """
+        return self.tail_node
+
+    def add_new_head(self, head_node_value: int | str) -> DoublyNode:
+        """adds new head node to the list
+
+        Args:
+            head_node_value (int | str): value of new head node
+
+        Returns:
+            DoublyNode: new head node
+        """
+        return self._link_between(DoublyNode(head_node_value), None, self.head_node)
+
+    def append_node(self, new_node_value: int | str) -> DoublyNode:
+        """append node with given value at the end of the list
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            DoublyNode: newly appended node
+        """
+        return self._link_between(DoublyNode(new_node_value), self.tail_node, None)
+
+    def append_existing_node(self, node: DoublyNode) -> DoublyNode:
+        """link a node which is not in any list at the end of the list
+
+        Lets callers link DoublyNode subclasses which carry extra fields.
+
+        Args:
+            node (DoublyNode): detached node
+
+        Returns:
+            DoublyNode: appended node
+        """
+        return self._link_between(node, self.tail_node, None)
+
+    def move_to_tail(self, node: DoublyNode) -> DoublyNode:
+        """move node of this list to the end of the list in O(1)
+
+        Args:
+            node (DoublyNode): node of this list
+
+        Raises:
+            ValueError: if node is not linked into this list
+
+        Returns:
+            DoublyNode: moved node
+        """
+        if node is not self.tail_node:
+            self._link_between(self.remove(node), self.tail_node, None)
+        return node
+
+    def extend(self, values: Iterable[int | str]) -> int:
+        """append given values at the end of the list, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to append
+
+        Returns:
+            int: number of appended nodes
+        """
+        count: int = 0
+        for value in values:
+            self._link_between(DoublyNode(value), self.tail_node, None)
+            count += 1
+        return count
+
+    def insert_before(self, node: DoublyNode, value: int | str) -> DoublyNode:
+        """insert node with given value before node of this list
+
+        Args:
+            node (DoublyNode): node of this list
+            value (int | str): value of new node
+
+        Raises:
+            ValueError: if node is not linked into this list
+
+        Returns:
+            DoublyNode: new node
+        """
+        self._check_linked(node)
+        return self._link_between(DoublyNode(value), node.prev_node, node)
+
+    def insert_after(self, node: DoublyNode, value: int | str) -> DoublyNode:
+        """insert node with given value after node of this list
+
+        Args:
+            node (DoublyNode): node of this list
+            value (int | str): value of new node
+
+        Raises:
+            ValueError: if node is not linked into this list
+
+        Returns:
+            DoublyNode: new node
+        """
+        self._check_linked(node)
+        return self._link_between(DoublyNode(value), node, node.next_node)
+
+    def remove(self, node: DoublyNode) -> DoublyNode:
+        """unlink node of this list, its links are cleared
+
+        Args:
+            node (DoublyNode): node of this list
+
+        Raises:
+            ValueError: if node is not linked into this list, the list is not changed
+
+        Returns:
+            DoublyNode: removed node
+        """
+        self._check_linked(node)
+        prev_node: DoublyNode | None = node.prev_node
+        next_node: DoublyNode | None = node.next_node
+        if prev_node is None:
+            self.head_node = next_node
+        else:
+            prev_node.next_node = next_node
+        if next_node is None:
+            self.tail_node = prev_node
+        else:
+            next_node.prev_node = prev_node
+        node.prev_node = None
+        node.next_node = None
+        self.length -= 1
+        return node
+
+    def remove_node(self, value: int | str) -> DoublyNode | None:
+        """remove first node with given value from the list
+
+        Args:
+            value (int | str): value to remove
+
+        Returns:
+            DoublyNode | None: returns removed node or None if not found
+        """
+        for node in self.iter_nodes():
+            if node.value == value:
+                return self.remove(node)
+        return None
+
+    def pop_head(self) -> DoublyNode | None:
+        """remove head node
+
+        Returns:
+            DoublyNode | None: removed node or None if list is empty
+        """
+        if self.head_node is None:
+            return None
+        return self.remove(self.head_node)
+
+    def pop_tail(self) -> DoublyNode | None:
+        """remove tail node
+
+        Returns:
+            DoublyNode | None: removed node or None if list is empty
+        """
+        if self.tail_node is None:
+            return None
+        return self.remove(self.tail_node)
+
+    def iter_nodes(self, reverse: bool = False) -> Iterator[DoublyNode]:
+        """yield nodes of the list
+
+        Args:
+            reverse (bool, optional): yield from tail to head. Defaults to False.
+
+        Yields:
+            DoublyNode: next node of the list
+        """
+        if reverse:
+            current_node: DoublyNode | None = self.tail_node
+            while current_node is not None:
+                # read link first, the caller may remove the yielded node
+                prev_node: DoublyNode | None = current_node.prev_node
+                yield current_node
+                current_node = prev_node
+        else:
+            current_node = self.head_node
+            while current_node is not None:
+                next_node: DoublyNode | None = current_node.next_node
+                yield current_node
+                current_node = next_node
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        current_node: DoublyNode | None = self.head_node
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_node
+
+    def __reversed__(self) -> Iterator[int | str]:
+        """yield values of the list from tail to head
+
+        Yields:
+            int | str: value of previous node
+        """
+        current_node: DoublyNode | None = self.tail_node
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.prev_node
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        for node_value in self:
+            if node_value == value:
+                return True
+        return False
+
+    def __getitem__(self, index: int) -> int | str:
+        """get value at index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Raises:
+            IndexError: if index is out of range
+
+        Returns:
+            int | str: value at index
+        """
+        node: DoublyNode | None = self.access_node_by_index(index)
+        if node is None:
+            raise IndexError("doubly linked list index out of range")
+        return node.value
+
+    def access_node_by_index(self, index: int) -> DoublyNode | None:
+        """get node from list by index, negative index is walked from tail node
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            DoublyNode | None: return node if found else None
+        """
+        if index >= 0:
+            current_node: DoublyNode | None = self.head_node
+            while current_node is not None and index > 0:
+                current_node = current_node.next_node
+                index -= 1
+            return current_node
+        current_node = self.tail_node
+        while current_node is not None and index < -1:
+            current_node = current_node.prev_node
+            index += 1
+        return current_node
+
+    def update_at_index(self, index: int, new_value: int | str) -> DoublyNode | None:
+        """update value of node at index in place
+
+        Args:
+            index (int): index of the node. Negative index also works
+            new_value (int | str): new value of the node
+
+        Returns:
+            DoublyNode | None: return updated node if found else None
+        """
+        node: DoublyNode | None = self.access_node_by_index(index)
+        if node is not None:
+            node.value = new_value
+        return node
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self
+
+    def as_list(self) -> list[int | str]:
+        """return doubly linked list in form of list
+
+        Returns:
+            list[int | str]: list of str of list of int. Depending on dtype of value
+        """
+        return list(self)
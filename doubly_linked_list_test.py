@@ -0,0 +1,286 @@
+"""
+DoublyLinkedList class unit tests
+
+- __init__
+    - create empty list if no value is provided
+    - create list with provided value as head and tail node
+
+- add_new_head / append_node / extend
+    - add nodes at the start / end of the list
+    - link previous and next nodes both ways
+
+- append_existing_node / move_to_tail
+    - link detached node at the end of the list
+    - move node to the end of the list, tail node stays in place
+
+- insert_before / insert_after
+    - insert node next to given node
+    - update head and tail node when inserting at the ends
+
+- remove
+    - unlink given node and clear its links
+    - update head and tail node when removing the ends
+    - raise ValueError for a removed node or an end node of another list
+
+- remove_node / pop_head / pop_tail
+    - remove first node with given value
+    - return None if not found or list is empty
+
+- iteration
+    - iterate values and nodes from head to tail and from tail to head
+    - remove nodes while iterating nodes
+
+- access_node_by_index / __getitem__
+    - return node at index, negative index is walked from tail
+    - return None / raise IndexError if index out of range
+
+- update_at_index
+    - update value in place
+
+"""
+
+import pytest
+
+from node import DoublyNode
+from doubly_linked_list import DoublyLinkedList
+
+
+def assert_links(linked_list: DoublyLinkedList) -> None:
+    """check that next and previous links match and length is right
+    """
+    nodes = list(linked_list.iter_nodes())
+    assert list(reversed(nodes)) == list(linked_list.iter_nodes(reverse=True))
+    assert len(nodes) == linked_list.get_length()
+    for prev_node, next_node in zip(nodes, nodes[1:]):
+        assert prev_node.next_node is next_node
+        assert next_node.prev_node is prev_node
+    if nodes:
+        assert nodes[0].prev_node is None
+        assert nodes[-1].next_node is None
+
+
+# __init__()
+
+def test_empty_list() -> None:
+    """create empty list if no value is provided
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList()
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+    assert linked_list.get_length() == 0
+
+def test_head_node_value() -> None:
+    """create list with provided value as head and tail node
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList('a')
+    head_node = linked_list.get_head_node()
+    assert isinstance(head_node, DoublyNode)
+    assert head_node.get_value() == 'a'
+    assert linked_list.get_tail_node() is head_node
+
+
+# add_new_head() / append_node() / extend()
+
+def test_add_nodes() -> None:
+    """add nodes at the start / end of the list
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList()
+    linked_list.append_node(2)
+    linked_list.add_new_head(1)
+    assert linked_list.extend([3, 4]) == 2
+    assert linked_list.as_list() == [1, 2, 3, 4]
+    assert linked_list.get_head_node().get_value() == 1
+    assert linked_list.get_tail_node().get_value() == 4
+
+def test_add_nodes_links() -> None:
+    """link previous and next nodes both ways
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([2, 3])
+    linked_list.add_new_head(1)
+    linked_list.append_node(4)
+    assert_links(linked_list)
+
+
+# append_existing_node() / move_to_tail()
+
+def test_append_existing_node() -> None:
+    """link detached node at the end of the list
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1])
+    node: DoublyNode = DoublyNode(2)
+    assert linked_list.append_existing_node(node) is node
+    assert linked_list.get_tail_node() is node
+    assert linked_list.get_length() == 2
+    assert_links(linked_list)
+
+def test_move_to_tail() -> None:
+    """move node to the end of the list, tail node stays in place
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1, 2, 3])
+    head_node = linked_list.get_head_node()
+    assert linked_list.move_to_tail(head_node) is head_node
+    assert linked_list.as_list() == [2, 3, 1]
+    linked_list.move_to_tail(linked_list.access_node_by_index(1))
+    linked_list.move_to_tail(linked_list.get_tail_node())
+    assert linked_list.as_list() == [2, 1, 3]
+    assert linked_list.get_length() == 3
+    assert_links(linked_list)
+
+
+# insert_before() / insert_after()
+
+def test_insert_next_to_node() -> None:
+    """insert node next to given node
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1, 4])
+    node = linked_list.access_node_by_index(1)
+    linked_list.insert_before(node, 3)
+    linked_list.insert_after(linked_list.get_head_node(), 2)
+    assert linked_list.as_list() == [1, 2, 3, 4]
+    assert_links(linked_list)
+
+def test_insert_at_ends() -> None:
+    """update head and tail node when inserting at the ends
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList('b')
+    head_node = linked_list.insert_before(linked_list.get_head_node(), 'a')
+    tail_node = linked_list.insert_after(linked_list.get_tail_node(), 'c')
+    assert linked_list.get_head_node() is head_node
+    assert linked_list.get_tail_node() is tail_node
+    assert linked_list.as_list() == ['a', 'b', 'c']
+    assert_links(linked_list)
+
+
+# remove()
+
+def test_remove() -> None:
+    """unlink given node and clear its links
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1, 2, 3])
+    node = linked_list.access_node_by_index(1)
+    assert linked_list.remove(node) is node
+    assert node.prev_node is None
+    assert node.next_node is None
+    assert linked_list.as_list() == [1, 3]
+    assert_links(linked_list)
+
+def test_remove_ends() -> None:
+    """update head and tail node when removing the ends
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1, 2, 3])
+    linked_list.remove(linked_list.get_head_node())
+    linked_list.remove(linked_list.get_tail_node())
+    assert linked_list.get_head_node() is linked_list.get_tail_node()
+    assert linked_list.as_list() == [2]
+    linked_list.remove(linked_list.get_head_node())
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+    assert linked_list.get_length() == 0
+
+def test_remove_not_linked() -> None:
+    """raise ValueError for a removed node or an end node of another list
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1, 2, 3])
+    node = linked_list.access_node_by_index(1)
+    linked_list.remove(node)
+    other: DoublyLinkedList = DoublyLinkedList.from_iterable([4, 5])
+    for not_linked in (node, DoublyNode(9), other.get_head_node(), other.get_tail_node()):
+        with pytest.raises(ValueError):
+            linked_list.remove(not_linked)
+        with pytest.raises(ValueError):
+            linked_list.move_to_tail(not_linked)
+        with pytest.raises(ValueError):
+            linked_list.insert_after(not_linked, 0)
+    assert linked_list.as_list() == [1, 3]
+    assert linked_list.get_length() == 2
+    assert_links(linked_list)
+    assert other.as_list() == [4, 5]
+    assert_links(other)
+    empty: DoublyLinkedList = DoublyLinkedList()
+    with pytest.raises(ValueError):
+        empty.remove(node)
+    assert empty.get_length() == 0
+
+
+# remove_node() / pop_head() / pop_tail()
+
+def test_remove_by_value() -> None:
+    """remove first node with given value
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1, 2, 1, 3])
+    assert linked_list.remove_node(1).get_value() == 1
+    assert linked_list.pop_head().get_value() == 2
+    assert linked_list.pop_tail().get_value() == 3
+    assert linked_list.as_list() == [1]
+    assert_links(linked_list)
+
+def test_remove_not_found() -> None:
+    """return None if not found or list is empty
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable([1])
+    assert linked_list.remove_node(2) is None
+    linked_list.pop_tail()
+    assert linked_list.pop_head() is None
+    assert linked_list.pop_tail() is None
+
+
+# iteration
+
+def test_iteration() -> None:
+    """iterate values and nodes from head to tail and from tail to head
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable('abc')
+    assert list(linked_list) == ['a', 'b', 'c']
+    assert list(reversed(linked_list)) == ['c', 'b', 'a']
+    assert [node.value for node in linked_list.iter_nodes(reverse=True)] == ['c', 'b', 'a']
+    assert 'b' in linked_list
+    assert 'd' not in linked_list
+    assert len(linked_list) == 3
+
+def test_remove_while_iterating() -> None:
+    """remove nodes while iterating nodes
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable(range(6))
+    for node in linked_list.iter_nodes():
+        if node.value % 2:
+            linked_list.remove(node)
+    for node in linked_list.iter_nodes(reverse=True):
+        if node.value == 2:
+            linked_list.remove(node)
+    assert linked_list.as_list() == [0, 4]
+    assert_links(linked_list)
+
+
+# access_node_by_index() / __getitem__()
+
+def test_access_by_index() -> None:
+    """return node at index, negative index is walked from tail
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable(range(5))
+    assert linked_list.access_node_by_index(0).get_value() == 0
+    assert linked_list.access_node_by_index(3).get_value() == 3
+    assert linked_list.access_node_by_index(-1) is linked_list.get_tail_node()
+    assert linked_list.access_node_by_index(-5).get_value() == 0
+    assert linked_list[-2] == 3
+
+def test_access_out_of_range() -> None:
+    """return None / raise IndexError if index out of range
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable(range(3))
+    assert linked_list.access_node_by_index(3) is None
+    assert linked_list.access_node_by_index(-4) is None
+    assert DoublyLinkedList().access_node_by_index(-1) is None
+    with pytest.raises(IndexError):
+        linked_list[-4]
+
+
+# update_at_index()
+
+def test_update_at_index() -> None:
+    """update value in place
+    """
+    linked_list: DoublyLinkedList = DoublyLinkedList.from_iterable(['a', 'b'])
+    node = linked_list.get_tail_node()
+    assert linked_list.update_at_index(-1, 'B') is node
+    assert linked_list.update_at_index(5, 'x') is None
+    assert linked_list.as_list() == ['a', 'B']
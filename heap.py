@@ -0,0 +1,404 @@
+"""
+Heap:
+    - Binary heap stored in a list, the children of item i are items 2i + 1 and 2i + 2.
+    - Every item is ordered before its children, so the top item is at index 0.
+    - BinaryHeap is a min heap, a max heap, or ordered by a key computed once per value.
+    - push and pop take O(log n), peek O(1). Building a heap from n values with
+      heapify takes O(n), sifting down every parent from the last one to the root.
+    - push_pop and replace do a push and a pop with a single sift.
+    - IndexedHeap is a min priority queue of distinct items which tracks the position
+      of every item, so the priority of an item can be lowered, or the item removed,
+      in O(log n). Use negated priorities for a max priority queue.
+    - Like the linked lists, pop / peek of an empty heap return None instead of raising.
+
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from operator import gt, lt
+
+
+class BinaryHeap:
+    """
+    BinaryHeap Class
+    """
+
+    def __init__(self, values: Iterable[int | str] = (),
+                 key: Callable[[int | str], object] | None = None,
+                 max_heap: bool = False) -> None:
+        """create heap holding given values
+
+        Args:
+            values (Iterable[int | str], optional): values of the heap. Defaults to ().
+            key (Callable[[int | str], object] | None, optional): computes the value to
+            order by, called once per value. Defaults to None, the value itself.
+            max_heap (bool, optional): largest value on top. Defaults to False.
+        """
+        self.key: Callable[[int | str], object] | None = key
+        self.max_heap: bool = max_heap
+        self._before: Callable[[object, object], bool] = gt if max_heap else lt
+        self._keys: list[object] = []
+        self._values: list[int | str] = []
+        self.heapify(values)
+
+    def heapify(self, values: Iterable[int | str]) -> None:
+        """replace contents of the heap with given values in O(n)
+
+        Args:
+            values (Iterable[int | str]): new values of the heap
+        """
+        self._values = list(values)
+        self._keys = self._values[:] if self.key is None else [self.key(v) for v in self._values]
+        for index in reversed(range(len(self._values) // 2)):
+            self._sift_down(index)
+
+    def _sift_up(self, index: int) -> None:
+        """move item at index up until its parent is ordered before it
+
+        Args:
+            index (int): index of the item
+        """
+        keys: list[object] = self._keys
+        values: list[int | str] = self._values
+        before: Callable[[object, object], bool] = self._before
+        item_key: object = keys[index]
+        item_value: int | str = values[index]
+        while index > 0:
+            parent: int = (index - 1) >> 1
+            if not before(item_key, keys[parent]):
+                break
+            keys[index] = keys[parent]
+            values[index] = values[parent]
+            index = parent
+        keys[index] = item_key
+        values[index] = item_value
+
+    def _sift_down(self, index: int) -> None:
+        """move item at index down until it is ordered before its children
+
+        Args:
+            index (int): index of the item
+        """
+        keys: list[object] = self._keys
+        values: list[int | str] = self._values
+        before: Callable[[object, object], bool] = self._before
+        size: int = len(keys)
+        item_key: object = keys[index]
+        item_value: int | str = values[index]
+        child: int = 2 * index + 1
+        while child < size:
+            if child + 1 < size and before(keys[child + 1], keys[child]):
+                child += 1
+            if not before(keys[child], item_key):
+                break
+            keys[index] = keys[child]
+            values[index] = values[child]
+            index = child
+            child = 2 * index + 1
+        keys[index] = item_key
+        values[index] = item_value
+
+    def _key(self, value: int | str) -> object:
+        """value to order by
+
+        Args:
+            value (int | str): value of an item
+
+        Returns:
+            object: key of the value
+        """
+        return value if self.key is None else self.key(value)
+
+    def push(self, value: int | str) -> None:
+        """add value to the heap
+
+        Args:
+            value (int | str): value to add
+        """
+        self._keys.append(self._key(value))
+        self._values.append(value)
+        self._sift_up(len(self._values) - 1)
+
+    def pop(self) -> int | str | None:
+        """remove and return top value
+
+        Returns:
+            int | str | None: top value, None if the heap is empty
+        """
+        if not self._values:
+            return None
+        last_key: object = self._keys.pop()
+        last_value: int | str = self._values.pop()
+        if not self._values:
+            return last_value
+        top_value: int | str = self._values[0]
+        self._keys[0] = last_key
+        self._values[0] = last_value
+        self._sift_down(0)
+        return top_value
+
+    def peek(self) -> int | str | None:
+        """get top value without removing it
+
+        Returns:
+            int | str | None: top value, None if the heap is empty
+        """
+        if not self._values:
+            return None
+        return self._values[0]
+
+    def push_pop(self, value: int | str) -> int | str:
+        """push value, then pop and return top value, with a single sift
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            int | str: top value after the push, value itself if it would be on top
+        """
+        value_key: object = self._key(value)
+        if not self._values or not self._before(self._keys[0], value_key):
+            return value
+        top_value: int | str = self._values[0]
+        self._keys[0] = value_key
+        self._values[0] = value
+        self._sift_down(0)
+        return top_value
+
+    def replace(self, value: int | str) -> int | str | None:
+        """pop top value, then push value, with a single sift
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            int | str | None: top value before the push, None if the heap was empty
+        """
+        if not self._values:
+            self.push(value)
+            return None
+        top_value: int | str = self._values[0]
+        self._keys[0] = self._key(value)
+        self._values[0] = value
+        self._sift_down(0)
+        return top_value
+
+    def is_empty(self) -> bool:
+        """check if the heap is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return not self._values
+
+    def __len__(self) -> int:
+        """get number of items in the heap
+
+        Returns:
+            int: item count
+        """
+        return len(self._values)
+
+    def as_list(self) -> list[int | str]:
+        """return values in heap order, top value first
+
+        Returns:
+            list[int | str]: values as stored in the heap list
+        """
+        return self._values[:]
+
+
+class IndexedHeap:
+    """
+    IndexedHeap Class
+    """
+
+    def __init__(self) -> None:
+        """create empty priority queue
+        """
+        self._items: list[Hashable] = []
+        self._priorities: list[object] = []
+        self._positions: dict[Hashable, int] = {}
+
+    def _place(self, index: int, item: Hashable, priority: object) -> None:
+        """store item at index and record its position
+
+        Args:
+            index (int): index in the heap list
+            item (Hashable): item to store
+            priority (object): priority of the item
+        """
+        self._items[index] = item
+        self._priorities[index] = priority
+        self._positions[item] = index
+
+    def _sift_up(self, index: int) -> None:
+        """move item at index up until its parent has a lower or equal priority
+
+        Args:
+            index (int): index of the item
+        """
+        items: list[Hashable] = self._items
+        priorities: list[object] = self._priorities
+        item: Hashable = items[index]
+        priority: object = priorities[index]
+        while index > 0:
+            parent: int = (index - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            self._place(index, items[parent], priorities[parent])
+            index = parent
+        self._place(index, item, priority)
+
+    def _sift_down(self, index: int) -> None:
+        """move item at index down until its children have higher or equal priorities
+
+        Args:
+            index (int): index of the item
+        """
+        items: list[Hashable] = self._items
+        priorities: list[object] = self._priorities
+        size: int = len(items)
+        item: Hashable = items[index]
+        priority: object = priorities[index]
+        child: int = 2 * index + 1
+        while child < size:
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            self._place(index, items[child], priorities[child])
+            index = child
+            child = 2 * index + 1
+        self._place(index, item, priority)
+
+    def push(self, item: Hashable, priority: object) -> bool:
+        """add item with given priority
+
+        Args:
+            item (Hashable): item to add
+            priority (object): priority, lowest priority is popped first
+
+        Returns:
+            bool: True if added, False if item is already present
+        """
+        if item in self._positions:
+            return False
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._sift_up(len(self._items) - 1)
+        return True
+
+    def _remove_at(self, index: int) -> tuple[Hashable, object]:
+        """remove item at index, moving the last item into its place
+
+        Args:
+            index (int): index of the item
+
+        Returns:
+            tuple[Hashable, object]: removed item and its priority
+        """
+        item: Hashable = self._items[index]
+        priority: object = self._priorities[index]
+        del self._positions[item]
+        last_item: Hashable = self._items.pop()
+        last_priority: object = self._priorities.pop()
+        if index < len(self._items):
+            self._place(index, last_item, last_priority)
+            if index > 0 and last_priority < self._priorities[(index - 1) >> 1]:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        return item, priority
+
+    def pop(self) -> tuple[Hashable, object] | None:
+        """remove and return item with the lowest priority
+
+        Returns:
+            tuple[Hashable, object] | None: item and its priority, None if the heap is empty
+        """
+        if not self._items:
+            return None
+        return self._remove_at(0)
+
+    def peek(self) -> tuple[Hashable, object] | None:
+        """get item with the lowest priority without removing it
+
+        Returns:
+            tuple[Hashable, object] | None: item and its priority, None if the heap is empty
+        """
+        if not self._items:
+            return None
+        return self._items[0], self._priorities[0]
+
+    def decrease_key(self, item: Hashable, priority: object) -> bool:
+        """lower priority of an item in O(log n)
+
+        Args:
+            item (Hashable): item in the heap
+            priority (object): new priority
+
+        Returns:
+            bool: True if lowered, False if item is missing or priority is not lower
+        """
+        index: int | None = self._positions.get(item)
+        if index is None or not priority < self._priorities[index]:
+            return False
+        self._priorities[index] = priority
+        self._sift_up(index)
+        return True
+
+    def remove(self, item: Hashable) -> object | None:
+        """remove item in O(log n)
+
+        Args:
+            item (Hashable): item to remove
+
+        Returns:
+            object | None: priority of removed item, None if item is missing
+        """
+        index: int | None = self._positions.get(item)
+        if index is None:
+            return None
+        return self._remove_at(index)[1]
+
+    def priority(self, item: Hashable) -> object | None:
+        """get priority of an item
+
+        Args:
+            item (Hashable): item in the heap
+
+        Returns:
+            object | None: priority, None if item is missing
+        """
+        index: int | None = self._positions.get(item)
+        if index is None:
+            return None
+        return self._priorities[index]
+
+    def is_empty(self) -> bool:
+        """check if the heap is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return not self._items
+
+    def __contains__(self, item: object) -> bool:
+        """check if item is in the heap
+
+        Args:
+            item (object): item to find
+
+        Returns:
+            bool: True if present else False
+        """
+        return item in self._positions
+
+    def __len__(self) -> int:
+        """get number of items in the heap
+
+        Returns:
+            int: item count
+        """
+        return len(self._items)
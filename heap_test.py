@@ -0,0 +1,177 @@
+"""
+BinaryHeap and IndexedHeap class unit tests
+
+- BinaryHeap __init__ / heapify
+    - build heap from given values
+    - order as min heap, max heap or by key, key called once per value
+    - heapify replaces contents
+
+- BinaryHeap push / pop / peek
+    - pop values in heap order
+    - return None for pop / peek of an empty heap
+
+- BinaryHeap push_pop / replace
+    - push_pop returns pushed value if it would be on top
+    - replace returns old top value, None if heap was empty
+
+- IndexedHeap push / pop / peek
+    - pop items by lowest priority
+    - refuse to push an item twice
+
+- IndexedHeap decrease_key / remove / priority
+    - lower priority and move item up
+    - return False if item is missing or priority is not lower
+    - remove any item, keep heap order
+
+"""
+
+import random
+
+from heap import BinaryHeap, IndexedHeap
+
+
+def drain(heap: BinaryHeap) -> list:
+    """pop every value of the heap
+    """
+    return [heap.pop() for _ in range(len(heap))]
+
+
+# BinaryHeap __init__() / heapify()
+
+def test_build_heap() -> None:
+    """build heap from given values
+    """
+    values: list[int] = [5, 3, 8, 1, 9, 2, 2]
+    heap: BinaryHeap = BinaryHeap(values)
+    assert len(heap) == 7
+    assert heap.peek() == 1
+    assert sorted(heap.as_list()) == sorted(values)
+    assert drain(heap) == sorted(values)
+    assert heap.is_empty() is True
+
+def test_heap_order() -> None:
+    """order as min heap, max heap or by key, key called once per value
+    """
+    calls: list[str] = []
+
+    def length(value: str) -> int:
+        calls.append(value)
+        return len(value)
+
+    assert drain(BinaryHeap([3, 1, 2], max_heap=True)) == [3, 2, 1]
+    heap: BinaryHeap = BinaryHeap(['ccc', 'a', 'bb'], key=length)
+    heap.push('dddd')
+    assert drain(heap) == ['a', 'bb', 'ccc', 'dddd']
+    assert sorted(calls) == ['a', 'bb', 'ccc', 'dddd']
+    assert drain(BinaryHeap(['ccc', 'a', 'bb'], key=len, max_heap=True)) == ['ccc', 'bb', 'a']
+
+def test_heapify() -> None:
+    """heapify replaces contents
+    """
+    heap: BinaryHeap = BinaryHeap([1, 2])
+    heap.heapify(x for x in [9, 7, 8])
+    assert drain(heap) == [7, 8, 9]
+
+
+# BinaryHeap push() / pop() / peek()
+
+def test_push_pop_order() -> None:
+    """pop values in heap order
+    """
+    rng: random.Random = random.Random(20)
+    values: list[int] = [rng.randrange(100) for _ in range(200)]
+    heap: BinaryHeap = BinaryHeap()
+    for value in values:
+        heap.push(value)
+    assert drain(heap) == sorted(values)
+
+def test_empty_heap() -> None:
+    """return None for pop / peek of an empty heap
+    """
+    heap: BinaryHeap = BinaryHeap()
+    assert heap.pop() is None
+    assert heap.peek() is None
+
+
+# BinaryHeap push_pop() / replace()
+
+def test_push_pop() -> None:
+    """push_pop returns pushed value if it would be on top
+    """
+    heap: BinaryHeap = BinaryHeap([2, 4])
+    assert heap.push_pop(1) == 1
+    assert heap.push_pop(3) == 2
+    assert drain(heap) == [3, 4]
+    assert BinaryHeap().push_pop(5) == 5
+
+def test_replace() -> None:
+    """replace returns old top value, None if heap was empty
+    """
+    heap: BinaryHeap = BinaryHeap([2, 4])
+    assert heap.replace(5) == 2
+    assert drain(heap) == [4, 5]
+    assert heap.replace(1) is None
+    assert heap.peek() == 1
+
+
+# IndexedHeap push() / pop() / peek()
+
+def test_indexed_pop_order() -> None:
+    """pop items by lowest priority
+    """
+    heap: IndexedHeap = IndexedHeap()
+    heap.push('a', 3)
+    heap.push('b', 1)
+    heap.push('c', 2)
+    assert heap.peek() == ('b', 1)
+    assert [heap.pop() for _ in range(3)] == [('b', 1), ('c', 2), ('a', 3)]
+    assert heap.pop() is None
+    assert heap.peek() is None
+
+def test_indexed_push_twice() -> None:
+    """refuse to push an item twice
+    """
+    heap: IndexedHeap = IndexedHeap()
+    assert heap.push('a', 3) is True
+    assert heap.push('a', 1) is False
+    assert heap.priority('a') == 3
+    assert len(heap) == 1
+
+
+# IndexedHeap decrease_key() / remove() / priority()
+
+def test_decrease_key() -> None:
+    """lower priority and move item up
+    """
+    heap: IndexedHeap = IndexedHeap()
+    for item, priority in [('a', 1), ('b', 5), ('c', 9)]:
+        heap.push(item, priority)
+    assert heap.decrease_key('c', 0) is True
+    assert heap.priority('c') == 0
+    assert heap.pop() == ('c', 0)
+
+def test_decrease_key_refused() -> None:
+    """return False if item is missing or priority is not lower
+    """
+    heap: IndexedHeap = IndexedHeap()
+    heap.push('a', 5)
+    assert heap.decrease_key('a', 5) is False
+    assert heap.decrease_key('a', 6) is False
+    assert heap.decrease_key('b', 1) is False
+    assert heap.priority('a') == 5
+
+def test_remove() -> None:
+    """remove any item, keep heap order
+    """
+    rng: random.Random = random.Random(20)
+    heap: IndexedHeap = IndexedHeap()
+    priorities: dict[int, int] = {item: rng.randrange(50) for item in range(30)}
+    for item, priority in priorities.items():
+        heap.push(item, priority)
+    for item in range(0, 30, 3):
+        assert heap.remove(item) == priorities.pop(item)
+    assert heap.remove(0) is None
+    assert 3 not in heap
+    assert 4 in heap
+    popped: list[object] = [heap.pop()[1] for _ in range(len(heap))]
+    assert popped == sorted(priorities.values())
@@ -0,0 +1,359 @@
+"""
+Indexable Skip List:
+    - Linked list with express lanes on top of it for positional access.
+    - The bottom level is a plain chain of nodes linked with next_node, same as LinkedList.
+    - A node is also linked on a random number of upper levels, each level skips
+      about twice as many nodes as the level below it.
+    - Every link stores its width, the number of nodes it skips, so the position
+      of a node is the sum of widths followed to reach it.
+    - get, update, insert and delete at an index take O(log n) on average.
+    - Negative indexes are converted with the stored length, no counting pass.
+
+"""
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable, Iterator
+
+from node import Node
+
+MAX_LEVEL: int = 32
+
+
+class SkipNode(Node):
+    """Node with links and link widths for every level it is part of
+    """
+
+    __slots__ = ("links", "widths")
+
+    def __init__(self, value: int | str | None, level: int) -> None:
+        """creates a node linked on given number of levels
+
+        Args:
+            value (int | str | None): value of the node, None for the head sentinel
+            level (int): number of levels the node is part of
+        """
+        super().__init__(value)
+        self.links: list[SkipNode | None] = [None] * level
+        self.widths: list[int] = [0] * level
+
+
+class IndexableSkipList:
+    """
+    IndexableSkipList Class
+    """
+
+    def __init__(self, head_node_value: int | str | None = None) -> None:
+        """create skip list with given value as head node
+
+        Args:
+            head_node_value (int | str | None, optional): value for head node of the list.
+            Defaults to None.
+        """
+        # sentinel before the first node, position 0. nodes are at positions 1 to length
+        self._head: SkipNode = SkipNode(None, MAX_LEVEL)
+        self._head.widths[0] = 1
+        self._level: int = 1
+        self.tail_node: SkipNode | None = None
+        self.length: int = 0
+        if head_node_value is not None:
+            self.append_node(head_node_value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str]) -> IndexableSkipList:
+        """create skip list from given values
+
+        Args:
+            values (Iterable[int | str]): values in list order
+
+        Returns:
+            IndexableSkipList: new skip list holding given values
+        """
+        skip_list: IndexableSkipList = cls()
+        skip_list.extend(values)
+        return skip_list
+
+    @staticmethod
+    def _random_level() -> int:
+        """pick number of levels for a new node, each extra level with probability 1/2
+
+        Returns:
+            int: level count between 1 and MAX_LEVEL
+        """
+        level: int = 1
+        while level < MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _normalize_index(self, index: int, upper: int) -> int | None:
+        """convert negative index and check range
+
+        Args:
+            index (int): index, negative index counts from the end
+            upper (int): largest valid index
+
+        Returns:
+            int | None: index between 0 and upper, None if out of range
+        """
+        if index < 0:
+            index += self.length
+        if index < 0 or index > upper:
+            return None
+        return index
+
+    def _find_previous(self, index: int) -> tuple[list[SkipNode], list[int]]:
+        """find last node before position index + 1 on every level
+
+        Args:
+            index (int): index between 0 and length
+
+        Returns:
+            tuple[list[SkipNode], list[int]]: previous node and its position for every used level
+        """
+        previous_nodes: list[SkipNode] = [self._head] * self._level
+        positions: list[int] = [0] * self._level
+        node: SkipNode = self._head
+        position: int = 0
+        for level in range(self._level - 1, -1, -1):
+            while node.links[level] is not None and position + node.widths[level] <= index:
+                position += node.widths[level]
+                node = node.links[level]
+            previous_nodes[level] = node
+            positions[level] = position
+        return previous_nodes, positions
+
+    def _node_at(self, index: int) -> SkipNode:
+        """get node at a valid, non negative index
+
+        Args:
+            index (int): index between 0 and length - 1
+
+        Returns:
+            SkipNode: node at index
+        """
+        if index == self.length - 1:
+            return self.tail_node
+        target: int = index + 1
+        node: SkipNode = self._head
+        position: int = 0
+        for level in range(self._level - 1, -1, -1):
+            while node.links[level] is not None and position + node.widths[level] <= target:
+                position += node.widths[level]
+                node = node.links[level]
+            if position == target:
+                return node
+        return node
+
+    def get_head_node(self) -> Node | None:
+        """get head node of the list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        return self._head.links[0]
+
+    def get_tail_node(self) -> Node | None:
+        """get tail node of the list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        return self.tail_node
+
+    def insert_at_index(self, index: int, value: int | str) -> Node | None:
+        """insert node with given value so that it ends up at index
+
+        Args:
+            index (int): index of the new node, from 0 to length. Negative index also works
+            value (int | str): value of new node
+
+        Returns:
+            Node | None: new node, None if index out of range
+        """
+        position: int | None = self._normalize_index(index, self.length)
+        if position is None:
+            return None
+        previous_nodes, positions = self._find_previous(position)
+        new_level: int = self._random_level()
+        for level in range(self._level, new_level):
+            # new top levels start as a single link from head to the end of the list
+            self._head.links[level] = None
+            self._head.widths[level] = self.length + 1
+            previous_nodes.append(self._head)
+            positions.append(0)
+        self._level = max(self._level, new_level)
+        new_node: SkipNode = SkipNode(value, new_level)
+        for level in range(new_level):
+            previous_node: SkipNode = previous_nodes[level]
+            new_node.links[level] = previous_node.links[level]
+            new_node.widths[level] = positions[level] + previous_node.widths[level] - position
+            previous_node.links[level] = new_node
+            previous_node.widths[level] = position + 1 - positions[level]
+        for level in range(new_level, self._level):
+            previous_nodes[level].widths[level] += 1
+        new_node.next_node = new_node.links[0]
+        previous_nodes[0].next_node = new_node
+        if new_node.next_node is None:
+            self.tail_node = new_node
+        self.length += 1
+        return new_node
+
+    def remove_at_index(self, index: int) -> Node | None:
+        """remove node at index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            Node | None: removed node, None if index out of range
+        """
+        position: int | None = self._normalize_index(index, self.length - 1)
+        if position is None:
+            return None
+        previous_nodes, _ = self._find_previous(position)
+        removed_node: SkipNode = previous_nodes[0].links[0]
+        for level in range(self._level):
+            previous_node: SkipNode = previous_nodes[level]
+            if previous_node.links[level] is removed_node:
+                previous_node.links[level] = removed_node.links[level]
+                previous_node.widths[level] += removed_node.widths[level] - 1
+            else:
+                previous_node.widths[level] -= 1
+        previous_nodes[0].next_node = removed_node.next_node
+        if removed_node is self.tail_node:
+            previous_node = previous_nodes[0]
+            self.tail_node = None if previous_node is self._head else previous_node
+        self.length -= 1
+        return removed_node
+
+    def add_new_head(self, head_node_value: int | str) -> Node:
+        """adds new head node to the list
+
+        Args:
+            head_node_value (int | str): value of new head node
+
+        Returns:
+            Node: new head node
+        """
+        return self.insert_at_index(0, head_node_value)
+
+    def append_node(self, new_node_value: int | str) -> Node:
+        """append node with given value at the end of the list
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            Node: newly appended node
+        """
+        return self.insert_at_index(self.length, new_node_value)
+
+    def extend(self, values: Iterable[int | str]) -> int:
+        """append given values at the end of the list, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to append
+
+        Returns:
+            int: number of appended nodes
+        """
+        count: int = 0
+        for value in values:
+            self.insert_at_index(self.length, value)
+            count += 1
+        return count
+
+    def access_node_by_index(self, index: int) -> Node | None:
+        """get node from list by index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            Node | None: return node if found else None
+        """
+        position: int | None = self._normalize_index(index, self.length - 1)
+        if position is None:
+            return None
+        return self._node_at(position)
+
+    def update_at_index(self, index: int, new_value: int | str) -> Node | None:
+        """update value of node at index in place
+
+        Args:
+            index (int): index of the node. Negative index also works
+            new_value (int | str): new value of the node
+
+        Returns:
+            Node | None: return updated node if found else None
+        """
+        node: Node | None = self.access_node_by_index(index)
+        if node is not None:
+            node.value = new_value
+        return node
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        current_node: Node | None = self._head.next_node
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_node
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __getitem__(self, index: int) -> int | str:
+        """get value at index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Raises:
+            IndexError: if index is out of range
+
+        Returns:
+            int | str: value at index
+        """
+        node: Node | None = self.access_node_by_index(index)
+        if node is None:
+            raise IndexError("skip list index out of range")
+        return node.value
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        for node_value in self:
+            if node_value == value:
+                return True
+        return False
+
+    def as_list(self) -> list[str | int]:
+        """return skip list in form of list
+
+        Returns:
+            list[str | int]: list of str of list of int. Depending on dtype of value
+        """
+        return list(self)
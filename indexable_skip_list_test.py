@@ -0,0 +1,189 @@
+"""
+IndexableSkipList class unit tests
+
+- __init__
+    - create empty list if no value is provided
+    - create list with provided value as head node
+
+- insert_at_index
+    - insert node at start, middle and end
+    - negative index also works
+    - return None if index out of range
+
+- remove_at_index
+    - remove node at start, middle and end
+    - return None if index out of range
+
+- access_node_by_index / __getitem__
+    - return node or value at index, negative index also works
+    - return None / raise IndexError if index out of range
+
+- update_at_index
+    - update value of node in place
+    - return None if index out of range
+
+- bottom level is a chain of nodes
+    - follow next_node from head node to tail node
+
+- same results as a python list for random positional operations
+
+"""
+
+import random
+
+import pytest
+
+from node import Node
+from indexable_skip_list import IndexableSkipList
+
+
+# __init__()
+
+def test_empty_list() -> None:
+    """create empty list if no value is provided
+    """
+    skip_list: IndexableSkipList = IndexableSkipList()
+    assert skip_list.get_head_node() is None
+    assert skip_list.get_tail_node() is None
+    assert skip_list.get_length() == 0
+
+def test_head_node_value() -> None:
+    """create list with provided value as head node
+    """
+    skip_list: IndexableSkipList = IndexableSkipList('a')
+    head_node = skip_list.get_head_node()
+    assert isinstance(head_node, Node)
+    assert head_node.get_value() == 'a'
+    assert skip_list.get_tail_node() is head_node
+
+
+# insert_at_index()
+
+def test_insert_at_index() -> None:
+    """insert node at start, middle and end
+    """
+    skip_list: IndexableSkipList = IndexableSkipList()
+    skip_list.insert_at_index(0, 'b')
+    skip_list.insert_at_index(0, 'a')
+    skip_list.insert_at_index(2, 'd')
+    skip_list.insert_at_index(2, 'c')
+    assert skip_list.as_list() == ['a', 'b', 'c', 'd']
+    assert skip_list.get_tail_node().get_value() == 'd'
+
+def test_insert_negative_index() -> None:
+    """negative index also works
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable([1, 3])
+    skip_list.insert_at_index(-1, 2)
+    skip_list.insert_at_index(-3, 0)
+    assert skip_list.as_list() == [0, 1, 2, 3]
+
+def test_insert_out_of_range() -> None:
+    """return None if index out of range
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable([1, 2])
+    assert skip_list.insert_at_index(3, 5) is None
+    assert skip_list.insert_at_index(-3, 5) is None
+    assert skip_list.as_list() == [1, 2]
+
+
+# remove_at_index()
+
+def test_remove_at_index() -> None:
+    """remove node at start, middle and end
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable(range(6))
+    assert skip_list.remove_at_index(0).get_value() == 0
+    assert skip_list.remove_at_index(2).get_value() == 3
+    assert skip_list.remove_at_index(-1).get_value() == 5
+    assert skip_list.as_list() == [1, 2, 4]
+    assert skip_list.get_tail_node().get_value() == 4
+    assert skip_list.get_length() == 3
+
+def test_remove_out_of_range() -> None:
+    """return None if index out of range
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable([1, 2])
+    assert skip_list.remove_at_index(2) is None
+    assert skip_list.remove_at_index(-3) is None
+    assert IndexableSkipList().remove_at_index(0) is None
+
+
+# access_node_by_index() / __getitem__()
+
+def test_access_by_index() -> None:
+    """return node or value at index, negative index also works
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable(range(100))
+    assert skip_list.access_node_by_index(42).get_value() == 42
+    assert skip_list.access_node_by_index(-1).get_value() == 99
+    assert skip_list[0] == 0
+    assert skip_list[-100] == 0
+
+def test_access_out_of_range() -> None:
+    """return None / raise IndexError if index out of range
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable(range(3))
+    assert skip_list.access_node_by_index(3) is None
+    assert skip_list.access_node_by_index(-4) is None
+    with pytest.raises(IndexError):
+        skip_list[3]
+
+
+# update_at_index()
+
+def test_update_at_index() -> None:
+    """update value of node in place
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable(['a', 'b'])
+    node = skip_list.access_node_by_index(1)
+    assert skip_list.update_at_index(-1, 'B') is node
+    assert skip_list.as_list() == ['a', 'B']
+
+def test_update_out_of_range() -> None:
+    """return None if index out of range
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable(['a'])
+    assert skip_list.update_at_index(1, 'b') is None
+
+
+# bottom level
+
+def test_node_chain() -> None:
+    """follow next_node from head node to tail node
+    """
+    skip_list: IndexableSkipList = IndexableSkipList.from_iterable(range(20))
+    skip_list.remove_at_index(5)
+    skip_list.insert_at_index(10, 'x')
+    values: list[int | str] = []
+    current_node = skip_list.get_head_node()
+    while current_node is not None:
+        values.append(current_node.get_value())
+        last_node = current_node
+        current_node = current_node.get_next_node()
+    assert values == skip_list.as_list()
+    assert last_node is skip_list.get_tail_node()
+
+
+# random operations
+
+def test_same_as_python_list() -> None:
+    """same results as a python list for random positional operations
+    """
+    rng: random.Random = random.Random(7)
+    skip_list: IndexableSkipList = IndexableSkipList()
+    expected: list[int] = []
+    for step in range(2000):
+        operation: int = rng.randrange(3)
+        if operation == 0 or not expected:
+            index: int = rng.randint(0, len(expected))
+            skip_list.insert_at_index(index, step)
+            expected.insert(index, step)
+        elif operation == 1:
+            index = rng.randrange(-len(expected), len(expected))
+            assert skip_list.remove_at_index(index).get_value() == expected.pop(index)
+        else:
+            index = rng.randrange(-len(expected), len(expected))
+            assert skip_list[index] == expected[index]
+    assert skip_list.as_list() == expected
+    assert len(skip_list) == len(expected)
@@ -0,0 +1,598 @@
+"""
+Int Linked List:
+    - Linked list specialized for int values, stored unboxed in one array('q') in list order.
+    - 8 bytes per value instead of a Node object plus a boxed int per value.
+    - Search, as_list, removal and swaps run inside the array, in C.
+    - add_new_head and removals shift the values after the changed position,
+      which is a single memmove and fast in practice, but O(n) in theory.
+    - As soon as a value which is not an int or does not fit in 64 bits is added,
+      the values move to a generic LinkedList and every method is delegated to it.
+      The list never moves back to the array.
+    - Has the same public methods as LinkedList. Methods which return a Node return
+      a detached copy holding the value while values live in the array.
+    - Bulk methods (remove_if, sort, rotate, apply_permutation, ...) rebuild the
+      array in one pass. The value index of LinkedList is only built once values
+      move to a generic LinkedList, the array is searched in C without it.
+
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import chain
+
+from linked_list import LinkedList
+from node import Node
+
+INT64_MIN: int = -(1 << 63)
+INT64_MAX: int = (1 << 63) - 1
+
+
+def _fits(value: object) -> bool:
+    """check if value can be stored in the int array
+
+    bool and other int subclasses are not stored, the array would return them as plain ints.
+
+    Args:
+        value (object): value to check
+
+    Returns:
+        bool: True if value is an int between INT64_MIN and INT64_MAX
+    """
+    return type(value) is int and INT64_MIN <= value <= INT64_MAX  # pylint: disable=unidiomatic-typecheck
+
+
+class IntLinkedList:
+    """
+    IntLinkedList Class
+    """
+
+    def __init__(self, head_node_value: int | str | None = None, indexed: bool = False) -> None:
+        """create linked list with given value as head node
+
+        Args:
+            head_node_value (int | str | None, optional): value for head node of the list.
+            Defaults to None.
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+        """
+        self._values: array = array("q")
+        self._generic: LinkedList | None = None
+        self._indexed: bool = indexed
+        if head_node_value is not None:
+            self.append_node(head_node_value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str], indexed: bool = False) -> IntLinkedList:
+        """create linked list from given values in a single pass
+
+        Args:
+            values (Iterable[int | str]): values in list order. Generators are consumed lazily
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+
+        Returns:
+            IntLinkedList: new linked list holding given values
+        """
+        linked_list: IntLinkedList = cls(indexed=indexed)
+        linked_list.extend(values)
+        return linked_list
+
+    @property
+    def length(self) -> int:
+        """number of items in the list
+        """
+        if self._generic is not None:
+            return self._generic.length
+        return len(self._values)
+
+    def is_specialized(self) -> bool:
+        """check if values are still stored in the int array
+
+        Returns:
+            bool: True if no value has made the list move to a generic LinkedList
+        """
+        return self._generic is None
+
+    def enable_index(self) -> None:
+        """start keeping the value index
+
+        Values in the array are searched in C and need no index, it is built
+        when values move to a generic LinkedList.
+        """
+        self._indexed = True
+        if self._generic is not None:
+            self._generic.enable_index()
+
+    def disable_index(self) -> None:
+        """stop keeping the value index and free its memory
+        """
+        self._indexed = False
+        if self._generic is not None:
+            self._generic.disable_index()
+
+    def is_indexed(self) -> bool:
+        """check if value index is kept
+
+        Returns:
+            bool: True if value index is kept else False
+        """
+        return self._indexed
+
+    def _migrate(self) -> LinkedList:
+        """move values to a generic LinkedList and free the array
+
+        Returns:
+            LinkedList: list which now holds the values
+        """
+        self._generic = LinkedList.from_iterable(self._values, indexed=self._indexed)
+        self._values = array("q")
+        return self._generic
+
+    def _normalize_index(self, index: int) -> int | None:
+        """convert negative index and check range
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            int | None: index between 0 and length - 1, None if out of range
+        """
+        length: int = len(self._values)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            return None
+        return index
+
+    def extend(self, values: Iterable[int | str]) -> int:
+        """append given values at the end of the list, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to append
+
+        Returns:
+            int: number of appended nodes
+        """
+        if self._generic is not None:
+            return self._generic.extend(values)
+        append = self._values.append
+        count: int = 0
+        iterator: Iterator[int | str] = iter(values)
+        for value in iterator:
+            if not _fits(value):
+                return count + self._migrate().extend(chain((value,), iterator))
+            append(value)
+            count += 1
+        return count
+
+    def extend_left(self, values: Iterable[int | str]) -> int:
+        """add given values before the head node, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to add. First value becomes new head node
+
+        Returns:
+            int: number of added nodes
+        """
+        if self._generic is not None:
+            return self._generic.extend_left(values)
+        added: array = array("q")
+        iterator: Iterator[int | str] = iter(values)
+        for value in iterator:
+            if not _fits(value):
+                return self._migrate().extend_left(chain(added, (value,), iterator))
+            added.append(value)
+        self._values[0:0] = added
+        return len(added)
+
+    def get_head_node(self) -> Node | None:
+        """get head node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        if self._generic is not None:
+            return self._generic.get_head_node()
+        if not self._values:
+            return None
+        return Node(self._values[0])
+
+    def get_tail_node(self) -> Node | None:
+        """get tail node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        if self._generic is not None:
+            return self._generic.get_tail_node()
+        if not self._values:
+            return None
+        return Node(self._values[-1])
+
+    def add_new_head(self, head_node_value: int | str) -> Node:
+        """adds new head node to the list
+
+        Args:
+            head_node_value (int | str): value of new head node
+
+        Returns:
+            Node: new head node
+        """
+        if self._generic is not None:
+            return self._generic.add_new_head(head_node_value)
+        if not _fits(head_node_value):
+            return self._migrate().add_new_head(head_node_value)
+        self._values.insert(0, head_node_value)
+        return Node(head_node_value)
+
+    def append_node(self, new_node_value: int | str) -> Node:
+        """append node with given value at the end of the list
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            Node: newly appended node
+        """
+        if self._generic is not None:
+            return self._generic.append_node(new_node_value)
+        if not _fits(new_node_value):
+            return self._migrate().append_node(new_node_value)
+        self._values.append(new_node_value)
+        return Node(new_node_value)
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """yield nodes of the list from head to tail
+
+        Yields:
+            Node: node holding the next value
+        """
+        if self._generic is not None:
+            yield from self._generic.iter_nodes()
+            return
+        for value in self._values:
+            yield Node(value)
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        if self._generic is not None:
+            return iter(self._generic)
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        if self._generic is not None:
+            return value in self._generic
+        return value in self._values
+
+    def __getitem__(self, index: int | slice) -> int | str | IntLinkedList:
+        """get value at index, or a new linked list for a slice
+
+        Args:
+            index (int | slice): index of the node or slice of the list. Negative index also works
+
+        Raises:
+            TypeError: if index is not an int or slice
+            IndexError: if index is out of range
+
+        Returns:
+            int | str | IntLinkedList: value at index or new linked list with sliced values
+        """
+        if isinstance(index, slice):
+            if self._generic is not None:
+                return type(self).from_iterable(self._generic[index])
+            linked_list: IntLinkedList = type(self)()
+            linked_list._values = self._values[index]
+            return linked_list
+        if not isinstance(index, int):
+            raise TypeError("linked list indices must be integers or slices")
+        if self._generic is not None:
+            return self._generic[index]
+        position: int | None = self._normalize_index(index)
+        if position is None:
+            raise IndexError("linked list index out of range")
+        return self._values[position]
+
+    def as_list(self) -> list[str | int]:
+        """return linked list in form of list
+
+        Returns:
+            list[str | int]: list of str of list of int. Depending on dtype of value
+        """
+        if self._generic is not None:
+            return self._generic.as_list()
+        return self._values.tolist()
+
+    def remove_node(self, value: str | int) -> Node | None:
+        """remove node with given value from the list
+
+        Args:
+            value (str | int): value to remove
+
+        Returns:
+            Node | None: returns removed node or None if not found
+        """
+        if self._generic is not None:
+            return self._generic.remove_node(value)
+        try:
+            position: int = self._values.index(value)
+        except ValueError:
+            return None
+        return Node(self._values.pop(position))
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self
+
+    def access_node_by_index(self, index: int) -> Node | None:
+        """get node from list by index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            Node | None: return node if found else None
+        """
+        if self._generic is not None:
+            return self._generic.access_node_by_index(index)
+        position: int | None = self._normalize_index(index)
+        if position is None:
+            return None
+        return Node(self._values[position])
+
+    def update_at_index(self, index: int, new_value: int | str) -> Node | None:
+        """update value of node at index with the given new_value
+
+        Args:
+            index (int): index of the node. Negative index also works
+            new_value (int | str): new value of the node
+
+        Returns:
+            Node | None: return updated node if found else None
+        """
+        if self._generic is not None:
+            return self._generic.update_at_index(index, new_value)
+        position: int | None = self._normalize_index(index)
+        if position is None:
+            return None
+        if not _fits(new_value):
+            return self._migrate().update_at_index(position, new_value)
+        self._values[position] = new_value
+        return Node(new_value)
+
+    def swap_nodes(self, value_1: str | int, value_2: str | int) -> bool:
+        """swap nodes with given value from the list
+
+        Values sit in one array, so swapping two nodes is swapping two array items.
+
+        Args:
+            value_1 (str | int): value of node 1
+            value_2 (str | int): value of node 2
+
+        Returns:
+            bool: returns True on successful swap else False
+        """
+        if self._generic is not None:
+            return self._generic.swap_nodes(value_1, value_2)
+        if value_1 == value_2:
+            return False
+        values: array = self._values
+        try:
+            position_1: int = values.index(value_1)
+            position_2: int = values.index(value_2)
+        except ValueError:
+            return False
+        values[position_1], values[position_2] = values[position_2], values[position_1]
+        return True
+
+    def remove_all(self, values: Iterable[int | str]) -> int:
+        """remove every node whose value is one of the given values, in one pass
+
+        Args:
+            values (Iterable[int | str]): values to remove
+
+        Returns:
+            int: number of removed nodes
+        """
+        if self._generic is not None:
+            return self._generic.remove_all(values)
+        targets: set[int | str] = set(values)
+        if not targets:
+            return 0
+        return self._remove_where(targets.__contains__)
+
+    def remove_if(self, predicate: Callable[[int | str], bool]) -> int:
+        """remove every node whose value matches predicate, in one pass
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with value of every node
+
+        Returns:
+            int: number of removed nodes
+        """
+        if self._generic is not None:
+            return self._generic.remove_if(predicate)
+        return self._remove_where(predicate)
+
+    def remove_duplicates(self) -> int:
+        """remove every node whose value already appeared before it, in one pass
+
+        Returns:
+            int: number of removed nodes
+        """
+        if self._generic is not None:
+            return self._generic.remove_duplicates()
+        seen: set[int] = set()
+
+        def is_duplicate(value: int) -> bool:
+            if value in seen:
+                return True
+            seen.add(value)
+            return False
+
+        return self._remove_where(is_duplicate)
+
+    def _remove_where(self, predicate: Callable[[int | str], bool]) -> int:
+        """rebuild the array without the values matching predicate
+
+        If predicate raises, values checked before are still removed and the
+        rest are kept, same as LinkedList.
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with every value
+
+        Returns:
+            int: number of removed values
+        """
+        values: array = self._values
+        kept: array = array("q")
+        position: int = 0
+        try:
+            for value in values:
+                if not predicate(value):
+                    kept.append(value)
+                position += 1
+        finally:
+            kept.extend(values[position:])
+            self._values = kept
+        return len(values) - len(kept)
+
+    def update_many(self, updates: Mapping[int, int | str] | Iterable[tuple[int, int | str]]) -> int:
+        """update values of many nodes in place
+
+        Out of range indexes are skipped, for repeated indexes the last value wins.
+
+        Args:
+            updates (Mapping[int, int | str] | Iterable[tuple[int, int | str]]): index to new
+            value mapping or (index, new value) pairs. Negative index also works
+
+        Returns:
+            int: number of applied updates
+        """
+        if self._generic is not None:
+            return self._generic.update_many(updates)
+        pairs: Iterable[tuple[int, int | str]] = (
+            updates.items() if isinstance(updates, Mapping) else updates
+        )
+        targets: list[tuple[int, int | str]] = []
+        for index, new_value in pairs:
+            position: int | None = self._normalize_index(index)
+            if position is not None:
+                targets.append((position, new_value))
+        if not all(_fits(new_value) for _, new_value in targets):
+            return self._migrate().update_many(targets)
+        values: array = self._values
+        for position, new_value in targets:
+            values[position] = new_value
+        return len(targets)
+
+    def move_to_front(self, value: str | int) -> bool:
+        """move first node with given value to the head of the list
+
+        Args:
+            value (str | int): value of node to move
+
+        Returns:
+            bool: True if node was found else False
+        """
+        if self._generic is not None:
+            return self._generic.move_to_front(value)
+        try:
+            position: int = self._values.index(value)
+        except ValueError:
+            return False
+        if position:
+            self._values.insert(0, self._values.pop(position))
+        return True
+
+    def rotate(self, steps: int = 1) -> Node | None:
+        """rotate the list to the right, last steps nodes move to the front
+
+        Negative steps rotate to the left.
+
+        Args:
+            steps (int, optional): number of steps to rotate. Defaults to 1.
+
+        Returns:
+            Node | None: new head node
+        """
+        if self._generic is not None:
+            return self._generic.rotate(steps)
+        values: array = self._values
+        if len(values) > 1:
+            steps %= len(values)
+            if steps:
+                self._values = values[-steps:] + values[:-steps]
+        return self.get_head_node()
+
+    def sort(self, key: Callable[[int | str], object] | None = None, reverse: bool = False) -> None:
+        """sort the list in place, stable
+
+        Values are copied out, sorted and written back, so the list is unchanged
+        if key or a comparison raises.
+
+        Args:
+            key (Callable[[int | str], object] | None, optional): computes the value to
+            compare from node value. Defaults to None.
+            reverse (bool, optional): sort in descending order. Defaults to False.
+        """
+        if self._generic is not None:
+            self._generic.sort(key=key, reverse=reverse)
+            return
+        self._values = array("q", sorted(self._values, key=key, reverse=reverse))
+
+    def apply_permutation(self, order: Sequence[int]) -> bool:
+        """reorder values so that new index i holds the value which was at index order[i]
+
+        Args:
+            order (Sequence[int]): permutation of range(length)
+
+        Returns:
+            bool: True if values were reordered, False if order is not a permutation
+        """
+        if self._generic is not None:
+            return self._generic.apply_permutation(order)
+        values: array = self._values
+        length: int = len(values)
+        if len(order) != length:
+            return False
+        seen: bytearray = bytearray(length)
+        for index in order:
+            if not 0 <= index < length or seen[index]:
+                return False
+            seen[index] = 1
+        self._values = array("q", [values[index] for index in order])
+        return True
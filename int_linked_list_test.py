@@ -0,0 +1,268 @@
+"""
+IntLinkedList class unit tests
+
+- __init__
+    - create empty list if no value is provided
+    - create list with provided value as head node
+
+- from_iterable / extend / extend_left
+    - link values in given order
+    - return number of added nodes
+
+- add_new_head / append_node / update_at_index
+    - add / update values, return node holding the given value
+    - move to a generic LinkedList for non int values, big ints and bools
+    - keep every value and its order when moving
+
+- remove_node / swap_nodes / node_present
+    - return None / False if value not found
+    - remove / swap first nodes with given values
+
+- access_node_by_index / __getitem__
+    - return node or value at index, negative index also works
+    - return None / raise IndexError if index out of range
+    - return new list for a slice
+
+- same results as LinkedList for the same operations
+    - also for bulk methods, in the array and after moving to a generic LinkedList
+    - keep the index flag when moving to a generic LinkedList
+
+"""
+
+import pytest
+
+from node import Node
+from linked_list import LinkedList
+from int_linked_list import IntLinkedList
+
+
+# __init__()
+
+def test_empty_list() -> None:
+    """create empty list if no value is provided
+    """
+    linked_list: IntLinkedList = IntLinkedList()
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+    assert linked_list.get_length() == 0
+    assert linked_list.as_list() == []
+    assert linked_list.is_specialized() is True
+
+def test_head_node_value() -> None:
+    """create list with provided value as head node
+    """
+    linked_list: IntLinkedList = IntLinkedList(123)
+    head_node = linked_list.get_head_node()
+    assert isinstance(head_node, Node)
+    assert head_node.get_value() == 123
+    assert linked_list.as_list() == [123]
+
+
+# from_iterable() / extend() / extend_left()
+
+def test_bulk_order() -> None:
+    """link values in given order
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable(x for x in [3, 4])
+    linked_list.extend([5, 6])
+    linked_list.extend_left([1, 2])
+    assert linked_list.as_list() == [1, 2, 3, 4, 5, 6]
+    assert linked_list.get_tail_node().get_value() == 6
+    assert linked_list.is_specialized() is True
+
+def test_bulk_count() -> None:
+    """return number of added nodes
+    """
+    linked_list: IntLinkedList = IntLinkedList()
+    assert linked_list.extend(range(4)) == 4
+    assert linked_list.extend_left([]) == 0
+    assert linked_list.extend_left([7, 'a', 8]) == 3
+    assert linked_list.extend([9, 'b']) == 2
+    assert len(linked_list) == 9
+
+
+# add_new_head() / append_node() / update_at_index()
+
+def test_add_and_update() -> None:
+    """add / update values, return node holding the given value
+    """
+    linked_list: IntLinkedList = IntLinkedList()
+    assert linked_list.append_node(2).get_value() == 2
+    assert linked_list.add_new_head(1).get_value() == 1
+    assert linked_list.update_at_index(-1, 3).get_value() == 3
+    assert linked_list.update_at_index(2, 4) is None
+    assert linked_list.as_list() == [1, 3]
+    assert linked_list.is_specialized() is True
+
+@pytest.mark.parametrize("value", ['a', 2 ** 63, -(2 ** 63) - 1, True])
+def test_move_to_generic(value: object) -> None:
+    """move to a generic LinkedList for non int values, big ints and bools
+    """
+    for change in ("append_node", "add_new_head", "extend", "extend_left", "update_at_index"):
+        linked_list: IntLinkedList = IntLinkedList.from_iterable([1, 2])
+        if change == "update_at_index":
+            linked_list.update_at_index(0, value)
+        elif change.startswith("extend"):
+            getattr(linked_list, change)([value])
+        else:
+            getattr(linked_list, change)(value)
+        assert linked_list.is_specialized() is False
+        assert (type(value), value) in [(type(node_value), node_value) for node_value in linked_list]
+
+def test_move_keeps_values() -> None:
+    """keep every value and its order when moving
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([1, 2, 3])
+    linked_list.extend_left([-1, 'x', 0])
+    assert linked_list.as_list() == [-1, 'x', 0, 1, 2, 3]
+    linked_list.append_node(4)
+    linked_list.remove_node('x')
+    assert linked_list.as_list() == [-1, 0, 1, 2, 3, 4]
+    assert linked_list.is_specialized() is False
+    assert isinstance(linked_list[1:3], IntLinkedList)
+    assert linked_list[1:3].as_list() == [0, 1]
+
+
+# remove_node() / swap_nodes() / node_present()
+
+def test_not_found() -> None:
+    """return None / False if value not found
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([1, 2])
+    assert linked_list.remove_node(3) is None
+    assert linked_list.remove_node('a') is None
+    assert linked_list.swap_nodes(1, 3) is False
+    assert linked_list.swap_nodes(1, 1) is False
+    assert linked_list.node_present(2 ** 70) is False
+    assert linked_list.as_list() == [1, 2]
+
+def test_remove_and_swap() -> None:
+    """remove / swap first nodes with given values
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([0, 1, 2, 1, 3])
+    assert linked_list.swap_nodes(3, 1) is True
+    assert linked_list.as_list() == [0, 3, 2, 1, 1]
+    assert linked_list.remove_node(1).get_value() == 1
+    assert linked_list.as_list() == [0, 3, 2, 1]
+    assert linked_list.node_present(2) is True
+
+
+# access_node_by_index() / __getitem__()
+
+def test_access_by_index() -> None:
+    """return node or value at index, negative index also works
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([5, 6, 7])
+    assert linked_list.access_node_by_index(1).get_value() == 6
+    assert linked_list.access_node_by_index(-1).get_value() == 7
+    assert linked_list[0] == 5
+    assert linked_list[-3] == 5
+
+def test_access_out_of_range() -> None:
+    """return None / raise IndexError if index out of range
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([5, 6])
+    assert linked_list.access_node_by_index(2) is None
+    assert linked_list.access_node_by_index(-3) is None
+    with pytest.raises(IndexError):
+        linked_list[2]
+    with pytest.raises(TypeError):
+        linked_list['a']
+
+def test_slice() -> None:
+    """return new list for a slice
+    """
+    values: list[int] = list(range(8))
+    linked_list: IntLinkedList = IntLinkedList.from_iterable(values)
+    for index in (slice(1, 6, 2), slice(None, None, -1), slice(6, 1, -3)):
+        result = linked_list[index]
+        assert isinstance(result, IntLinkedList)
+        assert result.as_list() == values[index]
+
+
+# parity with LinkedList
+
+def test_same_as_linked_list() -> None:
+    """same results as LinkedList for the same operations
+    """
+    operations = [
+        ("extend", ([1, 2, 3, 4, 5],)), ("add_new_head", (0,)), ("remove_node", (3,)),
+        ("append_node", (6,)), ("swap_nodes", (0, 6)), ("update_at_index", (-2, 9)),
+        ("remove_node", (6,)), ("extend_left", ([7, 8],)), ("swap_nodes", (8, 2)),
+        ("append_node", ('a',)), ("remove_node", (0,)), ("swap_nodes", ('a', 9)),
+    ]
+    linked_list: LinkedList = LinkedList()
+    int_linked_list: IntLinkedList = IntLinkedList()
+    for name, args in operations:
+        result = getattr(linked_list, name)(*args)
+        int_result = getattr(int_linked_list, name)(*args)
+        if isinstance(result, Node):
+            assert int_result.get_value() == result.get_value()
+        else:
+            assert int_result == result
+        assert int_linked_list.as_list() == linked_list.as_list()
+        assert int_linked_list.get_length() == linked_list.get_length()
+
+@pytest.mark.parametrize("specialized", [True, False])
+def test_bulk_methods_same_as_linked_list(specialized: bool) -> None:
+    """also for bulk methods, in the array and after moving to a generic LinkedList
+    """
+    operations = [
+        ("extend", ([5, 3, 9, 3, 1, 7, 5, 2, 8],)), ("remove_duplicates", ()),
+        ("remove_all", ([9, 4],)), ("remove_all", ([],)),
+        ("remove_if", (lambda value: value == 2,)), ("move_to_front", (7,)),
+        ("move_to_front", (7,)), ("move_to_front", (42,)), ("rotate", (2,)),
+        ("rotate", (-3,)), ("rotate", (0,)), ("update_many", ({0: 4, -1: 6, 99: 1},)),
+        ("update_many", ([(1, 2), (1, 3)],)), ("sort", ()),
+        ("apply_permutation", ([4, 3, 2, 1, 0],)),
+        ("apply_permutation", ([0, 0, 1, 2, 3],)), ("sort", (lambda value: value % 3, True)),
+        ("extend", ([10, 11, 12],)), ("sort", (None, True)),
+    ]
+    linked_list: LinkedList = LinkedList()
+    int_linked_list: IntLinkedList = IntLinkedList()
+    if not specialized:
+        linked_list.append_node('x')
+        int_linked_list.append_node('x')
+        linked_list.remove_node('x')
+        int_linked_list.remove_node('x')
+    for name, args in operations:
+        result = getattr(linked_list, name)(*args)
+        int_result = getattr(int_linked_list, name)(*args)
+        if isinstance(result, Node):
+            assert int_result.get_value() == result.get_value()
+        else:
+            assert int_result == result, name
+        assert int_linked_list.as_list() == linked_list.as_list(), name
+        assert int_linked_list.get_length() == linked_list.get_length()
+    assert int_linked_list.is_specialized() is specialized
+
+def test_bulk_methods_migrate() -> None:
+    """also for bulk methods, in the array and after moving to a generic LinkedList
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([1, 2, 3])
+    assert linked_list.update_many({0: 5, 2: 'c'}) == 2
+    assert linked_list.is_specialized() is False
+    assert linked_list.as_list() == [5, 2, 'c']
+    failing: IntLinkedList = IntLinkedList.from_iterable([4, 3, 2, 1])
+    with pytest.raises(ZeroDivisionError):
+        failing.sort(key=lambda value: 1 // (value - 2))
+    assert failing.as_list() == [4, 3, 2, 1]
+    with pytest.raises(ZeroDivisionError):
+        failing.remove_if(lambda value: value == 4 or 1 // (value - 2) == 5)
+    assert failing.as_list() == [3, 2, 1]
+
+def test_index_flag() -> None:
+    """keep the index flag when moving to a generic LinkedList
+    """
+    linked_list: IntLinkedList = IntLinkedList.from_iterable([1, 2], indexed=True)
+    assert linked_list.is_indexed() is True
+    linked_list.disable_index()
+    assert linked_list.is_indexed() is False
+    linked_list.enable_index()
+    linked_list.append_node('a')
+    assert linked_list.is_specialized() is False
+    assert linked_list.is_indexed() is True
+    assert linked_list.remove_node(2).get_value() == 2
+    linked_list.disable_index()
+    assert linked_list.is_indexed() is False
+    assert linked_list.as_list() == [1, 'a']
@@ -6,8 +6,17 @@ Linked List:
     - The head node is the node at the beginning of the list.
     - This last node is called the tail node.
     - Have a single head node, which serves as the first node in the list.
+    - Optionally keeps an index from value to nodes and from node to previous node,
+      which makes membership checks, removal and swaps by value O(1) on average.
+      With duplicate values the first node in list order is used, same as without index.
 
 """
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from operator import itemgetter
 
 from node import Node
 
@@ -16,18 +25,267 @@ class LinkedList:
     LinkedList Class
     """
 
-    def __init__(self, head_node_value: int | str | None = None) -> None:
+    def __init__(self, head_node_value: int | str | None = None, indexed: bool = False) -> None:
         """create linked list with given value as head node
 
         Args:
             head_node_value (int | str | None, optional): value for head node of the list.
             Defaults to None.
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
         """
         if head_node_value is None:
             self.head_node: Node | None = None
+            self.length: int = 0
         else:
             head_node = Node(head_node_value)
             self.head_node: Node | None = head_node
+            self.length: int = 1
+        self.tail_node: Node | None = self.head_node
+        # value -> nodes with that value in list order, node -> previous node
+        self._index: dict[int | str, deque[Node]] | None = None
+        self._previous: dict[Node, Node | None] | None = None
+        if indexed:
+            self.enable_index()
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str], indexed: bool = False) -> LinkedList:
+        """create linked list from given values in a single pass
+
+        Args:
+            values (Iterable[int | str]): values in list order. Generators are consumed lazily
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+
+        Returns:
+            LinkedList: new linked list holding given values
+        """
+        linked_list: LinkedList = cls(indexed=indexed)
+        linked_list.extend(values)
+        return linked_list
+
+    def enable_index(self) -> None:
+        """start keeping the value index, built with one pass over the list
+
+        The index maps every value to its nodes and every node to its previous node,
+        it is updated by every change to the list.
+        """
+        if self._index is None:
+            self._reindex()
+
+    def disable_index(self) -> None:
+        """stop keeping the value index and free its memory
+        """
+        self._index = None
+        self._previous = None
+
+    def is_indexed(self) -> bool:
+        """check if value index is kept
+
+        Returns:
+            bool: True if value index is kept else False
+        """
+        return self._index is not None
+
+    def _index_usable(self, *values: object) -> bool:
+        """check if the value index is kept and can look up all given values
+
+        Unhashable values cannot be looked up in the index, they are searched
+        by a scan like without index, so results do not depend on the index.
+
+        Args:
+            values (object): values to look up
+
+        Returns:
+            bool: True if the index can be used for every value
+        """
+        if self._index is None:
+            return False
+        try:
+            for value in values:
+                hash(value)
+        except TypeError:
+            return False
+        return True
+
+    def _reindex(self) -> None:
+        """build value index from scratch
+        """
+        index: dict[int | str, deque[Node]] = {}
+        previous: dict[Node, Node | None] = {}
+        previous_node: Node | None = None
+        current_node: Node | None = self.head_node
+        while current_node is not None:
+            nodes: deque[Node] | None = index.get(current_node.value)
+            if nodes is None:
+                index[current_node.value] = deque((current_node,))
+            else:
+                nodes.append(current_node)
+            previous[current_node] = previous_node
+            previous_node = current_node
+            current_node = current_node.next_node
+        self._index = index
+        self._previous = previous
+
+    def _reindex_values(self, *values: int | str) -> None:
+        """rebuild index entries of given values with one pass, keeping list order
+
+        Args:
+            values (int | str): values whose nodes may have changed order
+        """
+        index: dict[int | str, deque[Node]] = self._index
+        for value in values:
+            index[value] = deque()
+        for node in self.iter_nodes():
+            if node.value in values:
+                index[node.value].append(node)
+        for value in values:
+            if not index[value]:
+                del index[value]
+
+    def _index_chain(self, first_node: Node, last_node: Node, previous_node: Node | None) -> None:
+        """add nodes of a chain just linked into the list to the index
+
+        Args:
+            first_node (Node): first node of the chain
+            last_node (Node): last node of the chain
+            previous_node (Node | None): node before the chain, None if chain is at head
+        """
+        index: dict[int | str, deque[Node]] = self._index
+        previous: dict[Node, Node | None] = self._previous
+        at_head: bool = previous_node is None
+        added: dict[int | str, list[Node]] = {}
+        current_node: Node = first_node
+        while True:
+            previous[current_node] = previous_node
+            added.setdefault(current_node.value, []).append(current_node)
+            if current_node is last_node:
+                break
+            previous_node = current_node
+            current_node = current_node.next_node
+        if last_node.next_node is not None:
+            previous[last_node.next_node] = last_node
+        for value, nodes in added.items():
+            if value in index:
+                if at_head:
+                    index[value].extendleft(reversed(nodes))
+                else:
+                    index[value].extend(nodes)
+            else:
+                index[value] = deque(nodes)
+
+    def _link(self, previous_node: Node | None, node: Node | None) -> None:
+        """link node after previous_node, or make it head node if previous_node is None
+
+        Args:
+            previous_node (Node | None): node to link from
+            node (Node | None): node to link
+        """
+        if previous_node is None:
+            self.head_node = node
+        else:
+            previous_node.next_node = node
+
+    def _swap_linked(self, previous_1: Node | None, node_1: Node,
+                     previous_2: Node | None, node_2: Node) -> None:
+        """swap positions of two different nodes of the list
+
+        Args:
+            previous_1 (Node | None): node before node_1, None if node_1 is head node
+            node_1 (Node): first node to swap
+            previous_2 (Node | None): node before node_2, None if node_2 is head node
+            node_2 (Node): second node to swap
+        """
+        if node_2.next_node is node_1:
+            previous_1, node_1, previous_2, node_2 = previous_2, node_2, previous_1, node_1
+        if node_1.next_node is node_2:
+            # adjacent nodes, node_1 comes first
+            self._link(previous_1, node_2)
+            node_1.next_node = node_2.next_node
+            node_2.next_node = node_1
+            new_previous_1, new_previous_2 = node_2, previous_1
+        else:
+            self._link(previous_1, node_2)
+            self._link(previous_2, node_1)
+            node_1.next_node, node_2.next_node = node_2.next_node, node_1.next_node
+            new_previous_1, new_previous_2 = previous_2, previous_1
+        if node_1.next_node is None:
+            self.tail_node = node_1
+        elif node_2.next_node is None:
+            self.tail_node = node_2
+        if self._previous is not None:
+            self._previous[node_1] = new_previous_1
+            self._previous[node_2] = new_previous_2
+            for node in (node_1, node_2):
+                if node.next_node is not None:
+                    self._previous[node.next_node] = node
+
+    @staticmethod
+    def _build_chain(values: Iterable[int | str]) -> tuple[Node | None, Node | None, int]:
+        """link given values into a detached chain of nodes
+
+        Args:
+            values (Iterable[int | str]): values in chain order
+
+        Returns:
+            tuple[Node | None, Node | None, int]: first node, last node and node count
+        """
+        iterator = iter(values)
+        for first_value in iterator:
+            break
+        else:
+            return None, None, 0
+        first_node: Node = Node(first_value)
+        last_node: Node = first_node
+        count: int = 1
+        for value in iterator:
+            new_node: Node = Node(value)
+            last_node.next_node = new_node
+            last_node = new_node
+            count += 1
+        return first_node, last_node, count
+
+    def extend(self, values: Iterable[int | str]) -> int:
+        """append given values at the end of the list, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to append
+
+        Returns:
+            int: number of appended nodes
+        """
+        first_node, last_node, count = self._build_chain(values)
+        if first_node is None:
+            return 0
+        previous_node: Node | None = self.tail_node
+        if previous_node is None:
+            self.head_node = first_node
+        else:
+            previous_node.set_next_node(first_node)
+        self.tail_node = last_node
+        self.length += count
+        if self._index is not None:
+            self._index_chain(first_node, last_node, previous_node)
+        return count
+
+    def extend_left(self, values: Iterable[int | str]) -> int:
+        """add given values before the head node, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to add. First value becomes new head node
+
+        Returns:
+            int: number of added nodes
+        """
+        first_node, last_node, count = self._build_chain(values)
+        if first_node is None:
+            return 0
+        last_node.set_next_node(self.head_node)
+        if self.head_node is None:
+            self.tail_node = last_node
+        self.head_node = first_node
+        self.length += count
+        if self._index is not None:
+            self._index_chain(first_node, last_node, None)
+        return count
 
     def get_head_node(self) -> Node | None:
         """get head node of linked list
@@ -37,6 +295,14 @@ class LinkedList:
         """
         return self.head_node
 
+    def get_tail_node(self) -> Node | None:
+        """get tail node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        return self.tail_node
+
     def add_new_head(self, head_node_value: int | str) -> Node:
         """adds new head node to the list
 
@@ -49,7 +315,12 @@ class LinkedList:
         new_node: Node = Node(head_node_value)
         if self.head_node is not None:
             new_node.set_next_node(self.head_node)
+        else:
+            self.tail_node = new_node
         self.head_node = new_node
+        self.length += 1
+        if self._index is not None:
+            self._index_chain(new_node, new_node, None)
         return self.head_node
 
     def append_node(self, new_node_value: int | str) -> Node:
@@ -62,30 +333,100 @@ class LinkedList:
             Node: newly appended node
         """
         new_node: Node = Node(new_node_value)
-        previous_node: Node | None = self.head_node
-        if previous_node is None:
+        tail_node: Node | None = self.tail_node
+        if tail_node is None:
             self.head_node = new_node
-            return self.head_node
-        current_node: Node | None = previous_node.get_next_node()
-        while current_node:
-            previous_node = current_node
-            current_node = current_node.get_next_node()
-        previous_node.set_next_node(new_node)
+        else:
+            tail_node.set_next_node(new_node)
+        self.tail_node = new_node
+        self.length += 1
+        if self._index is not None:
+            self._index_chain(new_node, new_node, tail_node)
         return new_node
 
+    def iter_nodes(self) -> Iterator[Node]:
+        """yield nodes of the list from head to tail
+
+        Yields:
+            Node: next node of the list
+        """
+        current_node: Node | None = self.head_node
+        while current_node is not None:
+            yield current_node
+            current_node = current_node.next_node
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        current_node: Node | None = self.head_node
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_node
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        if self._index_usable(value):
+            return value in self._index
+        for node_value in self:
+            if node_value == value:
+                return True
+        return False
+
+    def __getitem__(self, index: int | slice) -> int | str | LinkedList:
+        """get value at index, or a new linked list for a slice
+
+        Args:
+            index (int | slice): index of the node or slice of the list. Negative index also works
+
+        Raises:
+            TypeError: if index is not an int or slice
+            IndexError: if index is out of range
+
+        Returns:
+            int | str | LinkedList: value at index or new linked list with sliced values
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step > 0:
+                return type(self).from_iterable(islice(self, start, stop, step))
+            indexes: range = range(start, stop, step)
+            if not indexes:
+                return type(self)()
+            first: int = indexes[-1]
+            window: list[int | str] = list(islice(self, first, indexes[0] + 1))
+            return type(self).from_iterable(window[i - first] for i in indexes)
+        if not isinstance(index, int):
+            raise TypeError("linked list indices must be integers or slices")
+        node: Node | None = self.access_node_by_index(index)
+        if node is None:
+            raise IndexError("linked list index out of range")
+        return node.value
+
     def as_list(self) -> list[str | int]:
         """return linked list in form of list
 
         Returns:
             list[str | int]: list of str of list of int. Depending on dtype of value
         """
-        item_list: list[str | int] = []
-        current_node: Node | None = self.head_node
-        while current_node:
-            value: int | str = current_node.get_value()
-            item_list.append(value)
-            current_node = current_node.get_next_node()
-        return item_list
+        return list(self)
 
     def remove_node(self, value: str | int) -> Node | None:
         """remove node with given value from the list
@@ -96,32 +437,136 @@ class LinkedList:
         Returns:
             Node | None: returns removed node or None if not found
         """
+        if self._index_usable(value):
+            return self._remove_indexed_node(value)
         previous_node: Node | None = self.head_node
         if previous_node is None:
             return None
-        if previous_node.get_value() == value:
-            self.head_node = previous_node.get_next_node()
+        if previous_node.value == value:
+            self.head_node = previous_node.next_node
+            if self.head_node is None:
+                self.tail_node = None
+            self.length -= 1
+            if self._index is not None:
+                self._reindex()
             return previous_node
-        current_node: Node | None = previous_node.get_next_node()
-        while current_node:
-            if current_node.get_value() == value:
-                previous_node.set_next_node(current_node.get_next_node())
+        current_node: Node | None = previous_node.next_node
+        while current_node is not None:
+            if current_node.value == value:
+                previous_node.next_node = current_node.next_node
+                if current_node is self.tail_node:
+                    self.tail_node = previous_node
+                self.length -= 1
+                if self._index is not None:
+                    self._reindex()
                 return current_node
-            current_node = current_node.get_next_node()
+            previous_node = current_node
+            current_node = current_node.next_node
         return None
 
+    def remove_all(self, values: Iterable[int | str]) -> int:
+        """remove every node whose value is one of the given values, in one traversal
+
+        Args:
+            values (Iterable[int | str]): values to remove
+
+        Returns:
+            int: number of removed nodes
+        """
+        targets: set[int | str] = set(values)
+        if not targets:
+            return 0
+        return self._unlink_where(targets.__contains__)
+
+    def remove_if(self, predicate: Callable[[int | str], bool]) -> int:
+        """remove every node whose value matches predicate, in one traversal
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with value of every node
+
+        Returns:
+            int: number of removed nodes
+        """
+        return self._unlink_where(predicate)
+
+    def remove_duplicates(self) -> int:
+        """remove every node whose value already appeared before it, in one traversal
+
+        Returns:
+            int: number of removed nodes
+        """
+        seen: set[int | str] = set()
+
+        def is_duplicate(value: int | str) -> bool:
+            if value in seen:
+                return True
+            seen.add(value)
+            return False
+
+        return self._unlink_where(is_duplicate)
+
+    def _unlink_where(self, predicate: Callable[[int | str], bool]) -> int:
+        """unlink every node whose value matches predicate
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with value of every node
+
+        Returns:
+            int: number of removed nodes
+        """
+        removed: int = 0
+        previous_node: Node | None = None
+        current_node: Node | None = self.head_node
+        try:
+            while current_node is not None:
+                next_node: Node | None = current_node.next_node
+                if predicate(current_node.value):
+                    self._link(previous_node, next_node)
+                    removed += 1
+                else:
+                    previous_node = current_node
+                current_node = next_node
+        finally:
+            # also runs when predicate raises, nodes after current node are kept
+            if current_node is None:
+                self.tail_node = previous_node
+            self.length -= removed
+            if removed and self._index is not None:
+                self._reindex()
+        return removed
+
+    def _remove_indexed_node(self, value: str | int) -> Node | None:
+        """remove first node with given value using the value index
+
+        Args:
+            value (str | int): value to remove
+
+        Returns:
+            Node | None: returns removed node or None if not found
+        """
+        nodes: deque[Node] | None = self._index.get(value)
+        if nodes is None:
+            return None
+        node: Node = nodes.popleft()
+        if not nodes:
+            del self._index[value]
+        previous_node: Node | None = self._previous.pop(node)
+        next_node: Node | None = node.next_node
+        self._link(previous_node, next_node)
+        if next_node is None:
+            self.tail_node = previous_node
+        else:
+            self._previous[next_node] = previous_node
+        self.length -= 1
+        return node
+
     def get_length(self) -> int:
         """get number of items in the list
 
         Returns:
             int: item count
         """
-        counter: int = 0
-        current_node: Node | None = self.head_node
-        while current_node:
-            counter += 1
-            current_node = current_node.get_next_node()
-        return counter
+        return self.length
 
     def node_present(self, value: int | str) -> bool:
         """check if node with given value is present in the list
@@ -132,12 +577,7 @@ class LinkedList:
         Returns:
             bool: True if node is present else False
         """
-        current_node: Node | None = self.head_node
-        while current_node:
-            if current_node.get_value() == value:
-                return True
-            current_node = current_node.get_next_node()
-        return False
+        return value in self
 
     def access_node_by_index(self, index: int) -> Node | None:
         """get node from list by index
@@ -148,17 +588,19 @@ class LinkedList:
         Returns:
             Node | None: return node if found else None
         """
-        counter: int = 0 if index >= 0 else (self.get_length() * -1)
-        current_node: Node | None = self.head_node
-        while current_node:
-            if counter == index:
-                return current_node
-            counter = counter + 1
-            current_node = current_node.get_next_node()
-        return None
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            return None
+        if index == self.length - 1:
+            return self.tail_node
+        current_node: Node = self.head_node
+        for _ in range(index):
+            current_node = current_node.next_node
+        return current_node
 
     def update_at_index(self, index: int, new_value: int | str) -> Node | None:
-        """update node at index with the given new_value
+        """update value of node at index in place with the given new_value
 
         Args:
             index (int): index of the node. Negative index also works
@@ -167,30 +609,71 @@ class LinkedList:
         Returns:
             Node | None: return updated node if found else None
         """
-        previous_node: Node | None = self.head_node
-        if previous_node is None:
+        node: Node | None = self.access_node_by_index(index)
+        if node is None:
             return None
-        if index in (0, self.get_length() * -1):
-            new_node: Node = Node(new_value)
-            new_node.set_next_node(previous_node.get_next_node())
-            self.head_node = new_node
-            return new_node
-        counter: int = 1 if index >= 0 else ((self.get_length() * -1) + 1)
-        current_node: Node | None = previous_node.get_next_node()
-        while current_node:
-            if counter == index:
-                new_node: Node = Node(new_value)
-                new_node.set_next_node(current_node.get_next_node())
-                previous_node.set_next_node(new_node)
-                return new_node
-            counter = counter + 1
-            previous_node = current_node
-            current_node = current_node.get_next_node()
-        return None
+        old_value: int | str = node.value
+        node.value = new_value
+        if self._index is not None:
+            self._index_updated_node(node, old_value)
+        return node
+
+    def update_many(self, updates: Mapping[int, int | str] | Iterable[tuple[int, int | str]]) -> int:
+        """update values of many nodes in place with a single traversal
+
+        Indexes are sorted first, so k updates cost O(n + k log k) and allocate no nodes.
+        Out of range indexes are skipped, for repeated indexes the last value wins.
+
+        Args:
+            updates (Mapping[int, int | str] | Iterable[tuple[int, int | str]]): index to new
+            value mapping or (index, new value) pairs. Negative index also works
+
+        Returns:
+            int: number of applied updates
+        """
+        pairs: Iterable[tuple[int, int | str]] = (
+            updates.items() if isinstance(updates, Mapping) else updates
+        )
+        length: int = self.length
+        targets: list[tuple[int, int | str]] = []
+        for index, new_value in pairs:
+            if index < 0:
+                index += length
+            if 0 <= index < length:
+                targets.append((index, new_value))
+        if not targets:
+            return 0
+        # stable sort keeps repeated indexes in given order
+        targets.sort(key=itemgetter(0))
+        current_node: Node = self.head_node
+        position: int = 0
+        for index, new_value in targets:
+            while position < index:
+                current_node = current_node.next_node
+                position += 1
+            current_node.value = new_value
+        if self._index is not None:
+            self._reindex()
+        return len(targets)
+
+    def _index_updated_node(self, node: Node, old_value: int | str) -> None:
+        """move node to the index entry of its new value
+
+        Args:
+            node (Node): node whose value was updated
+            old_value (int | str): value of the node before the update
+        """
+        nodes: deque[Node] = self._index[old_value]
+        nodes.remove(node)
+        if not nodes:
+            del self._index[old_value]
+        if node.value in self._index:
+            self._reindex_values(node.value)
+        else:
+            self._index[node.value] = deque((node,))
 
-    # refactoring required
     def swap_nodes(self, value_1: str | int, value_2: str | int) -> bool:
-        """swap nodes with given value from the list
+        """swap first nodes with given values, found together in a single pass
 
         Args:
             value_1 (str | int): value of node 1
@@ -199,95 +682,270 @@ class LinkedList:
         Returns:
             bool: returns True on successful swap else False
         """
+        if self.head_node is None or value_1 == value_2:
+            return False
+        if self._index_usable(value_1, value_2):
+            return self._swap_indexed_nodes(value_1, value_2)
+        node_1: Node | None = None
+        node_2: Node | None = None
+        previous_1: Node | None = None
+        previous_2: Node | None = None
+        previous_node: Node | None = None
+        current_node: Node | None = self.head_node
+        while current_node is not None:
+            if node_1 is None and current_node.value == value_1:
+                node_1, previous_1 = current_node, previous_node
+                if node_2 is not None:
+                    break
+            elif node_2 is None and current_node.value == value_2:
+                node_2, previous_2 = current_node, previous_node
+                if node_1 is not None:
+                    break
+            previous_node = current_node
+            current_node = current_node.next_node
+        if node_1 is None or node_2 is None:
+            return False
+        self._swap_linked(previous_1, node_1, previous_2, node_2)
+        if self._index is not None:
+            self._reindex()
+        return True
 
-        def swap_adjacent_head_nodes(previous: Node, next_node: Node) -> None:
-            previous.set_next_node(next_node.get_next_node())
-            next_node.set_next_node(previous)
-            self.head_node = next_node
-
-        def swap_adjacent_nodes(p_1: Node, c_1: Node, p_2: Node) -> None:
-            temp = p_2.get_next_node()
-            p_2.set_next_node(c_1)
-            p_1.set_next_node(p_2)
-            c_1.set_next_node(temp)
-
-        def swap_non_adjacent_head_nodes(c_1: Node, p_2: Node, c_2: Node) -> None:
-            temp: Node | None = c_2.get_next_node()
-            c_2.set_next_node(c_1.get_next_node())
-            self.head_node = c_2
-            c_1.set_next_node(temp)
-            p_2.set_next_node(c_1)
-
-        def swap_non_adjacent_nodes(p_1: Node, c_1: Node, p_2: Node, c_2: Node) -> None:
-            temp: Node | None = c_2.get_next_node()
-            c_2.set_next_node(c_1.get_next_node())
-            p_1.set_next_node(c_2)
-            c_1.set_next_node(temp)
-            p_2.set_next_node(c_1)
-
-        def one_head_node(is_value_1: bool, head_node: Node) -> bool:
-            curr_node_1: Node | None = None
-            pre_node_2: Node | None = None
-            curr_node_2: Node | None = None
-            second_value: str | int = value_2 if is_value_1 else value_1
-            curr_node_1 = head_node
-            pre_node_2 = curr_node_1.get_next_node()
-            # only 1 element list
-            if pre_node_2 is None:
+    def move_to_front(self, value: str | int) -> bool:
+        """move first node with given value to the head of the list
+
+        Args:
+            value (str | int): value of node to move
+
+        Returns:
+            bool: True if node was found else False
+        """
+        if self._index_usable(value):
+            nodes: deque[Node] | None = self._index.get(value)
+            if nodes is None:
                 return False
-            if pre_node_2.get_value() == second_value:
-                # adjacent nodes
-                swap_adjacent_head_nodes(curr_node_1, pre_node_2)
-                return True
-            curr_node_2 = pre_node_2.get_next_node()
-            while curr_node_2:
-                if curr_node_2.get_value() == second_value:
-                    break
-                pre_node_2 = curr_node_2
-                curr_node_2 = curr_node_2.get_next_node()
-            if curr_node_2 is None:
+            node: Node | None = nodes[0]
+            previous_node: Node | None = self._previous[node]
+        else:
+            previous_node = None
+            node = self.head_node
+            while node is not None and node.value != value:
+                previous_node = node
+                node = node.next_node
+            if node is None:
                 return False
-            swap_non_adjacent_head_nodes(curr_node_1, pre_node_2, curr_node_2)
+        if previous_node is None:
             return True
+        next_node: Node | None = node.next_node
+        previous_node.next_node = next_node
+        if next_node is None:
+            self.tail_node = previous_node
+        old_head_node: Node = self.head_node
+        node.next_node = old_head_node
+        self.head_node = node
+        if self._previous is not None:
+            if next_node is not None:
+                self._previous[next_node] = previous_node
+            self._previous[node] = None
+            self._previous[old_head_node] = node
+        return True
+
+    def rotate(self, steps: int = 1) -> Node | None:
+        """rotate the list to the right, last steps nodes move to the front
+
+        Negative steps rotate to the left. Only the links at the cut point change.
 
-        def no_head_node(head_node: Node) -> bool:
-            p_1 = head_node
-            c_1 = head_node.get_next_node()
-            while c_1:
-                if c_1.get_value() in (value_1, value_2):
-                    second_value = value_2 if c_1.get_value() == value_1 else value_1
-                    p_2 = c_1.get_next_node()
-                    # only 1 element list
-                    if p_2 is None:
-                        return False
-                    if p_2.get_value() == second_value:
-                        # adjacent nodes
-                        swap_adjacent_nodes(p_1, c_1, p_2)
-                        return True
-                    c_2 = p_2.get_next_node()
-                    while c_2:
-                        if c_2.get_value() == second_value:
-                            break
-                        p_2 = c_2
-                        c_2 = c_2.get_next_node()
-                    if c_2 is None:
-                        return False
-                    swap_non_adjacent_nodes(p_1, c_1, p_2, c_2)
-                    return True
-                p_1 = c_1
-                c_1 = c_1.get_next_node()
-            if c_1 is None:
-                return False
-            return False
+        Args:
+            steps (int, optional): number of steps to rotate. Defaults to 1.
+
+        Returns:
+            Node | None: new head node
+        """
+        if self.length < 2:
+            return self.head_node
+        steps %= self.length
+        if steps == 0:
+            return self.head_node
+        new_tail_node: Node = self.access_node_by_index(self.length - steps - 1)
+        new_head_node: Node = new_tail_node.next_node
+        self.tail_node.next_node = self.head_node
+        new_tail_node.next_node = None
+        self.head_node = new_head_node
+        self.tail_node = new_tail_node
+        if self._index is not None:
+            self._reindex()
+        return self.head_node
 
-        head_node = self.head_node
-        if head_node is None:
+    def sort(self, key: Callable[[int | str], object] | None = None, reverse: bool = False) -> None:
+        """sort the list in place by relinking its nodes
+
+        Stable bottom-up merge sort: runs of 1, 2, 4, ... nodes are merged pairwise,
+        so it takes O(n log n) comparisons, O(1) extra memory and no recursion.
+        Without key, node values are compared directly.
+
+        Args:
+            key (Callable[[int | str], object] | None, optional): computes the value to
+            compare from node value. Defaults to None.
+            reverse (bool, optional): sort in descending order. Defaults to False.
+        """
+        length: int = self.length
+        if length < 2:
+            return
+        # nodes merged so far in the current pass always hang off sentinel,
+        # so they stay reachable if key or a comparison raises
+        sentinel: Node = Node(0, self.head_node)
+        tail_node: Node = sentinel
+        current_node: Node | None = None
+        width: int = 1
+        try:
+            while width < length:
+                tail_node = sentinel
+                current_node = sentinel.next_node
+                sentinel.next_node = None
+                while current_node is not None:
+                    left_node: Node = current_node
+                    right_node: Node | None = self._split_after(left_node, width)
+                    current_node = self._split_after(right_node, width)
+                    tail_node = self._merge(tail_node, left_node, right_node, key, reverse)
+                width *= 2
+        except BaseException:
+            # keep every node, in whatever order the failed pass left them
+            while tail_node.next_node is not None:
+                tail_node = tail_node.next_node
+            tail_node.next_node = current_node
+            while tail_node.next_node is not None:
+                tail_node = tail_node.next_node
+            raise
+        finally:
+            self.head_node = sentinel.next_node
+            self.tail_node = tail_node
+            if self._index is not None:
+                self._reindex()
+
+    @staticmethod
+    def _split_after(node: Node | None, count: int) -> Node | None:
+        """cut chain after count nodes
+
+        Args:
+            node (Node | None): first node of the chain
+            count (int): number of nodes to keep
+
+        Returns:
+            Node | None: first node after the cut, None if chain is not longer than count
+        """
+        if node is None:
+            return None
+        for _ in range(count - 1):
+            if node.next_node is None:
+                return None
+            node = node.next_node
+        rest: Node | None = node.next_node
+        node.next_node = None
+        return rest
+
+    @staticmethod
+    def _merge(tail_node: Node, left_node: Node, right_node: Node | None,
+               key: Callable[[int | str], object] | None, reverse: bool) -> Node:
+        """merge two sorted chains after tail_node, on equal values left chain comes first
+
+        If key or a comparison raises, the rest of both chains is linked after the
+        nodes merged so far before the error propagates, so no node is lost.
+
+        Args:
+            tail_node (Node): node after which the merged chain is linked
+            left_node (Node): first node of left chain
+            right_node (Node | None): first node of right chain
+            key (Callable[[int | str], object] | None): computes the value to compare
+            reverse (bool): chains are in descending order
+
+        Returns:
+            Node: last node of merged chain
+        """
+        try:
+            # keys of the current node of each side, only the side which advanced is recomputed
+            left_value: object = left_node.value if key is None else key(left_node.value)
+            right_value: object = None
+            if right_node is not None:
+                right_value = right_node.value if key is None else key(right_node.value)
+            while right_node is not None:
+                # right node is taken only when it must come strictly before left node
+                if (right_value > left_value) if reverse else (right_value < left_value):
+                    node: Node = right_node
+                    right_node = right_node.next_node
+                    tail_node.next_node = node
+                    tail_node = node
+                    if right_node is not None:
+                        right_value = right_node.value if key is None else key(right_node.value)
+                else:
+                    node = left_node
+                    left_node = left_node.next_node
+                    tail_node.next_node = node
+                    tail_node = node
+                    if left_node is None:
+                        break
+                    left_value = left_node.value if key is None else key(left_node.value)
+        except BaseException:
+            tail_node.next_node = left_node
+            while tail_node.next_node is not None:
+                tail_node = tail_node.next_node
+            tail_node.next_node = right_node
+            raise
+        tail_node.next_node = left_node if left_node is not None else right_node
+        while tail_node.next_node is not None:
+            tail_node = tail_node.next_node
+        return tail_node
+
+    def apply_permutation(self, order: Sequence[int]) -> bool:
+        """reorder nodes so that new index i holds the node which was at index order[i]
+
+        Nodes are relinked in one pass, no node is allocated.
+
+        Args:
+            order (Sequence[int]): permutation of range(length)
+
+        Returns:
+            bool: True if nodes were reordered, False if order is not a permutation
+        """
+        length: int = self.length
+        if len(order) != length:
             return False
-        if value_1 == value_2:
+        seen: bytearray = bytearray(length)
+        for index in order:
+            if not 0 <= index < length or seen[index]:
+                return False
+            seen[index] = 1
+        if length == 0:
+            return True
+        nodes: list[Node] = list(self.iter_nodes())
+        previous_node: Node = nodes[order[0]]
+        self.head_node = previous_node
+        for index in islice(order, 1, None):
+            node: Node = nodes[index]
+            previous_node.next_node = node
+            previous_node = node
+        previous_node.next_node = None
+        self.tail_node = previous_node
+        if self._index is not None:
+            self._reindex()
+        return True
+
+    def _swap_indexed_nodes(self, value_1: str | int, value_2: str | int) -> bool:
+        """swap first nodes with given values using the value index
+
+        Args:
+            value_1 (str | int): value of node 1
+            value_2 (str | int): value of node 2
+
+        Returns:
+            bool: returns True on successful swap else False
+        """
+        nodes_1: deque[Node] | None = self._index.get(value_1)
+        nodes_2: deque[Node] | None = self._index.get(value_2)
+        if nodes_1 is None or nodes_2 is None:
             return False
-        if value_1 == head_node.get_value():
-            return one_head_node(True, head_node)
-        if value_2 == head_node.get_value():
-            return one_head_node(False, head_node)
-        # no head node
-        return no_head_node(head_node)
+        node_1: Node = nodes_1[0]
+        node_2: Node = nodes_2[0]
+        self._swap_linked(self._previous[node_1], node_1, self._previous[node_2], node_2)
+        # with duplicates the moved node may no longer be the first one
+        if len(nodes_1) > 1 or len(nodes_2) > 1:
+            self._reindex_values(value_1, value_2)
+        return True
@@ -5,10 +5,29 @@ LinkedList class unit tests
     - set linked list head node as None if no value is provided
     - set linked list head node as node with provided value
 
+- from_iterable
+    - create empty list from empty iterable
+    - create list with values in given order
+    - consume generators
+
+- extend
+    - append values at the end of the list
+    - set head and tail node if list is empty
+    - return number of appended nodes
+
+- extend_left
+    - add values before head node keeping their order
+    - set tail node if list is empty
+    - return number of added nodes
+
 - get_head_node
     - return None if head node does not exist
     - return head node of linked list if exists
 
+- get_tail_node
+    - return None if tail node does not exist
+    - return last node of linked list if exists
+
 - add_new_head
     - add node from given value as new head node
     - set previous head node as next node of new head node if previous head node exists
@@ -20,6 +39,25 @@ LinkedList class unit tests
     - append node from given_value at the end of linked list
     - return newly added node
 
+- iter_nodes
+    - yield nodes from head to tail
+
+- __iter__
+    - yield values from head to tail
+    - stop early without visiting the rest of the list
+
+- __len__
+    - return number of items
+
+- __contains__
+    - return True if value is present else False
+
+- __getitem__
+    - return value at index, negative index also works
+    - raise IndexError if index out of range
+    - raise TypeError if index is not an int or slice
+    - return new linked list for a slice
+
 - as_list
     - return linked list in form of python list
 
@@ -28,11 +66,26 @@ LinkedList class unit tests
     - return None if node with given value not found
     - if node to remove is head node, replace head node
     - else remove node with given value from the list
+    - remove node which is not next to head node
+    - move tail node back when tail node is removed
     - return removed node
 
+- remove_all
+    - remove every node with one of given values
+    - return number of removed nodes
+    - keep head and tail node
+
+- remove_if
+    - remove every node matching predicate
+    - keep length, tail and index consistent when predicate raises
+
+- remove_duplicates
+    - keep first node of every value
+
 - get_length
     - return 0 if no items
     - return number of items
+    - keep count after adding, removing and updating nodes
 
 - node_present
     - return False if list is empty
@@ -52,6 +105,13 @@ LinkedList class unit tests
     - return updated node
     - return None if negative index out of range
     - return updated node from tail if negative index
+    - update value of existing node in place
+
+- update_many
+    - update values at given indexes, negative index also works
+    - accept mapping or pairs, last value wins for repeated index
+    - skip out of range indexes and return number of applied updates
+    - keep value index
 
 - swap_nodes
     - return False if list is empty
@@ -59,10 +119,42 @@ LinkedList class unit tests
     - return False if either of the value is not present in the list
     - return True when swapping with head node
     - return True when swapping with non head node
+    - keep tail node after swapping tail node
+    - swap existing nodes without allocating new ones
+
+- move_to_front
+    - move first node with given value to head
+    - return False if value not found
+
+- rotate
+    - move last nodes to the front, negative steps rotate left
+    - return head node and keep tail node
+
+- sort
+    - sort values in ascending or descending order
+    - sort by key and keep order of equal keys
+    - call key at most once per node in every merge pass
+    - relink existing nodes and keep tail node
+    - keep every node when a comparison or key raises
+
+- apply_permutation
+    - reorder existing nodes by given order
+    - return False if order is not a permutation
+
+- value index
+    - enable and disable index
+    - find, remove and swap nodes with index
+    - look up unhashable values by a scan, same results as without index
+    - use first node in list order for duplicate values
+    - keep index after adding and updating nodes
 
 
 """
 
+from itertools import islice
+
+import pytest
+
 from node import Node
 from linked_list import LinkedList
 
@@ -85,6 +177,90 @@ def test_set_head_node() -> None:
     assert linked_list.head_node.get_next_node() is None
 
 
+# from_iterable()
+
+def test_from_empty_iterable() -> None:
+    """create empty list from empty iterable
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([])
+    assert linked_list.head_node is None
+    assert linked_list.tail_node is None
+    assert linked_list.get_length() == 0
+
+def test_from_iterable() -> None:
+    """create list with values in given order
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'c'])
+    assert linked_list.as_list() == ['a', 'b', 'c']
+    assert linked_list.get_length() == 3
+    tail_node = linked_list.get_tail_node()
+    assert isinstance(tail_node, Node)
+    assert tail_node.get_value() == 'c'
+
+def test_from_generator() -> None:
+    """consume generators
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(i * 2 for i in range(5))
+    assert linked_list.as_list() == [0, 2, 4, 6, 8]
+
+
+# extend()
+
+def test_extend() -> None:
+    """append values at the end of the list
+    """
+    linked_list: LinkedList = LinkedList(1)
+    linked_list.extend([2, 3])
+    linked_list.append_node(4)
+    assert linked_list.as_list() == [1, 2, 3, 4]
+    assert linked_list.get_length() == 4
+
+def test_extend_empty_list() -> None:
+    """set head and tail node if list is empty
+    """
+    linked_list: LinkedList = LinkedList()
+    linked_list.extend(iter([1, 2]))
+    assert isinstance(linked_list.head_node, Node)
+    assert linked_list.head_node.get_value() == 1
+    assert isinstance(linked_list.tail_node, Node)
+    assert linked_list.tail_node.get_value() == 2
+
+def test_extend_count() -> None:
+    """return number of appended nodes
+    """
+    linked_list: LinkedList = LinkedList(1)
+    assert linked_list.extend(range(3)) == 3
+    assert linked_list.extend([]) == 0
+    assert linked_list.get_length() == 4
+
+
+# extend_left()
+
+def test_extend_left() -> None:
+    """add values before head node keeping their order
+    """
+    linked_list: LinkedList = LinkedList(3)
+    linked_list.extend_left([1, 2])
+    linked_list.append_node(4)
+    assert linked_list.as_list() == [1, 2, 3, 4]
+    assert linked_list.get_length() == 4
+
+def test_extend_left_empty_list() -> None:
+    """set tail node if list is empty
+    """
+    linked_list: LinkedList = LinkedList()
+    linked_list.extend_left(['a', 'b'])
+    linked_list.append_node('c')
+    assert linked_list.as_list() == ['a', 'b', 'c']
+
+def test_extend_left_count() -> None:
+    """return number of added nodes
+    """
+    linked_list: LinkedList = LinkedList()
+    assert linked_list.extend_left(x for x in 'abc') == 3
+    assert linked_list.extend_left([]) == 0
+
+
 # get_head_node()
 
 def test_get_no_head_node() -> None:
@@ -103,6 +279,27 @@ def test_get_head_node() -> None:
     assert linked_list.head_node.get_next_node() is None
 
 
+# get_tail_node()
+
+def test_get_no_tail_node() -> None:
+    """return None if tail node does not exist
+    """
+    linked_list: LinkedList = LinkedList()
+    assert linked_list.get_tail_node() is None
+
+def test_get_tail_node() -> None:
+    """return last node of linked list if exists
+    """
+    linked_list: LinkedList = LinkedList(1)
+    assert linked_list.get_tail_node() is linked_list.head_node
+    linked_list.append_node(2)
+    linked_list.add_new_head(0)
+    tail_node = linked_list.get_tail_node()
+    assert isinstance(tail_node, Node)
+    assert tail_node.get_value() == 2
+    assert tail_node.get_next_node() is None
+
+
 # add_new_head()
 
 def test_add_new_head() -> None:
@@ -192,6 +389,98 @@ def test_return_appended_node() -> None:
     assert result.get_next_node() is None
 
 
+# iter_nodes()
+
+def test_iter_nodes() -> None:
+    """yield nodes from head to tail
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3])
+    nodes: list[Node] = list(linked_list.iter_nodes())
+    assert nodes[0] is linked_list.head_node
+    assert nodes[-1] is linked_list.tail_node
+    assert [node.get_value() for node in nodes] == [1, 2, 3]
+
+
+# __iter__()
+
+def test_iter() -> None:
+    """yield values from head to tail
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'c'])
+    assert list(linked_list) == ['a', 'b', 'c']
+    assert list(LinkedList()) == []
+
+def test_iter_short_circuit() -> None:
+    """stop early without visiting the rest of the list
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(5))
+    iterator = iter(linked_list)
+    assert list(islice(iterator, 2)) == [0, 1]
+    assert next(iterator) == 2
+
+
+# __len__()
+
+def test_len() -> None:
+    """return number of items
+    """
+    assert len(LinkedList()) == 0
+    assert len(LinkedList.from_iterable(range(7))) == 7
+
+
+# __contains__()
+
+def test_contains() -> None:
+    """return True if value is present else False
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b'])
+    assert 'b' in linked_list
+    assert 'c' not in linked_list
+    assert 'a' not in LinkedList()
+
+
+# __getitem__()
+
+def test_getitem() -> None:
+    """return value at index, negative index also works
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([10, 20, 30])
+    assert linked_list[0] == 10
+    assert linked_list[2] == 30
+    assert linked_list[-1] == 30
+    assert linked_list[-3] == 10
+
+def test_getitem_out_of_range() -> None:
+    """raise IndexError if index out of range
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([10, 20, 30])
+    with pytest.raises(IndexError):
+        linked_list[3]
+    with pytest.raises(IndexError):
+        linked_list[-4]
+    with pytest.raises(IndexError):
+        LinkedList()[0]
+
+def test_getitem_type_error() -> None:
+    """raise TypeError if index is not an int or slice
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([10, 20, 30])
+    with pytest.raises(TypeError):
+        linked_list['a']
+
+def test_getitem_slice() -> None:
+    """return new linked list for a slice
+    """
+    values: list[int] = list(range(10))
+    linked_list: LinkedList = LinkedList.from_iterable(values)
+    for index in (slice(2, 5), slice(None, None, 3), slice(-4, None), slice(8, 2, -2),
+                  slice(None, None, -1), slice(5, 5), slice(3, 1)):
+        result = linked_list[index]
+        assert isinstance(result, LinkedList)
+        assert result.as_list() == values[index]
+        assert len(result) == len(values[index])
+
+
 # as_list()
 
 def test_return_in_list_form() -> None:
@@ -258,6 +547,28 @@ def test_remove_node() -> None:
     result = linked_list.as_list()
     assert result == ['a', 'c']
 
+def test_remove_far_node() -> None:
+    """remove node which is not next to head node
+    """
+    linked_list: LinkedList = LinkedList('a')
+    linked_list.append_node('b')
+    linked_list.append_node('c')
+    linked_list.append_node('d')
+    linked_list.remove_node('c')
+    assert linked_list.as_list() == ['a', 'b', 'd']
+
+def test_remove_tail_node() -> None:
+    """move tail node back when tail node is removed
+    """
+    linked_list: LinkedList = LinkedList('a')
+    linked_list.append_node('b')
+    linked_list.remove_node('b')
+    assert linked_list.get_tail_node() is linked_list.head_node
+    linked_list.remove_node('a')
+    assert linked_list.get_tail_node() is None
+    linked_list.append_node('c')
+    assert linked_list.as_list() == ['c']
+
 def test_return_removed_node() -> None:
     """remove node with given value from the list
     """
@@ -270,6 +581,87 @@ def test_return_removed_node() -> None:
     assert result.get_value() == value_2
 
 
+# remove_all()
+
+def test_remove_all() -> None:
+    """remove every node with one of given values
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3, 2, 4, 1, 5])
+    linked_list.remove_all([2, 1])
+    assert linked_list.as_list() == [3, 4, 5]
+    assert linked_list.get_length() == 3
+
+def test_remove_all_count() -> None:
+    """return number of removed nodes
+    """
+    linked_list: LinkedList = LinkedList.from_iterable('abcabc')
+    assert linked_list.remove_all(iter('ax')) == 2
+    assert linked_list.remove_all([]) == 0
+    assert LinkedList().remove_all([1]) == 0
+
+def test_remove_all_ends() -> None:
+    """keep head and tail node
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 1, 2, 3, 3])
+    linked_list.remove_all({1, 3})
+    assert linked_list.get_head_node() is linked_list.get_tail_node()
+    assert linked_list.as_list() == [2]
+    linked_list.remove_all({2})
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+    linked_list.append_node(4)
+    assert linked_list.as_list() == [4]
+
+
+# remove_if()
+
+def test_remove_if() -> None:
+    """remove every node matching predicate
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(10), indexed=True)
+    assert linked_list.remove_if(lambda value: value % 3 == 0) == 4
+    assert linked_list.as_list() == [1, 2, 4, 5, 7, 8]
+    assert linked_list.node_present(3) is False
+    assert linked_list.get_tail_node().get_value() == 8
+
+def test_remove_if_predicate_raises() -> None:
+    """keep length, tail and index consistent when predicate raises
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3, 4], indexed=True)
+
+    def predicate(value: int | str) -> bool:
+        if value == 3:
+            raise ValueError(value)
+        return value == 1
+
+    with pytest.raises(ValueError):
+        linked_list.remove_if(predicate)
+    assert linked_list.as_list() == [2, 3, 4]
+    assert len(linked_list) == 3
+    assert linked_list.get_tail_node().get_value() == 4
+    assert linked_list.node_present(1) is False
+    with pytest.raises(ZeroDivisionError):
+        linked_list.remove_if(lambda value: value == 2 or 1 / (value - 4) == 0)
+    assert linked_list.as_list() == [3, 4]
+    assert len(linked_list) == 2
+    assert linked_list.get_tail_node().get_value() == 4
+    assert linked_list.remove_if(lambda value: value == 4) == 1
+    assert linked_list.get_tail_node().get_value() == 3
+
+
+# remove_duplicates()
+
+def test_remove_duplicates() -> None:
+    """keep first node of every value
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['b', 'a', 'b', 'c', 'a', 'a'])
+    first_nodes: list[Node] = [linked_list.access_node_by_index(i) for i in (0, 1, 3)]
+    assert linked_list.remove_duplicates() == 3
+    assert linked_list.as_list() == ['b', 'a', 'c']
+    assert list(linked_list.iter_nodes()) == first_nodes
+    assert linked_list.remove_duplicates() == 0
+
+
 # get_length()
 
 def test_0_length() -> None:
@@ -288,6 +680,20 @@ def test_get_length() -> None:
     result: int = linked_list.get_length()
     assert result == 10
 
+def test_get_length_after_changes() -> None:
+    """keep count after adding, removing and updating nodes
+    """
+    linked_list: LinkedList = LinkedList(1)
+    linked_list.add_new_head(0)
+    linked_list.append_node(2)
+    assert linked_list.get_length() == 3
+    linked_list.remove_node(1)
+    linked_list.remove_node(5)
+    assert linked_list.get_length() == 2
+    linked_list.update_at_index(-1, 3)
+    linked_list.swap_nodes(0, 3)
+    assert linked_list.get_length() == 2
+
 
 # node_present()
 
@@ -439,7 +845,60 @@ def test_update_node_by_index_negative() -> None:
     assert linked_list.as_list() == ['A', 'B']
 
 
-# update_node_at_index()
+def test_update_node_in_place() -> None:
+    """update value of existing node in place
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'c'])
+    nodes: list[Node] = list(linked_list.iter_nodes())
+    assert linked_list.update_at_index(0, 'A') is nodes[0]
+    assert linked_list.update_at_index(-1, 'C') is nodes[2]
+    assert list(linked_list.iter_nodes()) == nodes
+    assert linked_list.get_tail_node() is nodes[2]
+    assert linked_list.as_list() == ['A', 'b', 'C']
+
+
+# update_many()
+
+def test_update_many() -> None:
+    """update values at given indexes, negative index also works
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(6))
+    nodes: list[Node] = list(linked_list.iter_nodes())
+    linked_list.update_many({4: 'e', 0: 'a', -1: 'f'})
+    assert linked_list.as_list() == ['a', 1, 2, 3, 'e', 'f']
+    assert list(linked_list.iter_nodes()) == nodes
+
+def test_update_many_pairs() -> None:
+    """accept mapping or pairs, last value wins for repeated index
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(4))
+    linked_list.update_many([(2, 'x'), (1, 'y'), (2, 'z'), (-2, 'w')])
+    assert linked_list.as_list() == [0, 'y', 'w', 3]
+    linked_list.update_many(iter([(3, 'v')]))
+    assert linked_list.as_list() == [0, 'y', 'w', 'v']
+
+def test_update_many_out_of_range() -> None:
+    """skip out of range indexes and return number of applied updates
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(3))
+    assert linked_list.update_many({5: 'a', -4: 'b', 1: 'c'}) == 1
+    assert linked_list.as_list() == [0, 'c', 2]
+    assert LinkedList().update_many({0: 'a'}) == 0
+
+def test_update_many_index() -> None:
+    """keep value index
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3, 4], indexed=True)
+    linked_list.update_many({0: 4, 3: 1})
+    assert linked_list.node_present(1) is True
+    linked_list.remove_node(4)
+    assert linked_list.as_list() == [2, 3, 1]
+    linked_list.update_at_index(1, 2)
+    linked_list.remove_node(2)
+    assert linked_list.as_list() == [2, 1]
+
+
+# swap_nodes()
 
 def test_swap_nodes_empty() -> None:
     """return False if list is empty
@@ -517,3 +976,285 @@ def test_swap_nodes_non_head() -> None:
     result: bool = linked_list.swap_nodes(6, 4)
     assert result is True
     assert linked_list.as_list() == [0, 1, 7, 8, 5, 6, 4, 2, 3, 9]
+
+def test_swap_nodes_tail() -> None:
+    """keep tail node after swapping tail node
+    """
+    linked_list: LinkedList = LinkedList()
+    for i in range(4):
+        linked_list.append_node(i)
+    linked_list.swap_nodes(3, 2)
+    assert linked_list.access_node_by_index(-1).get_value() == 2
+    linked_list.swap_nodes(0, 2)
+    assert linked_list.access_node_by_index(-1).get_value() == 0
+    linked_list.swap_nodes(1, 0)
+    assert linked_list.access_node_by_index(-1).get_value() == 1
+    linked_list.append_node(4)
+    assert linked_list.as_list() == [2, 0, 3, 1, 4]
+    linked_list.swap_nodes(4, 2)
+    assert linked_list.as_list() == [4, 0, 3, 1, 2]
+    assert linked_list.get_tail_node().get_value() == 2
+
+
+def test_swap_nodes_same_nodes() -> None:
+    """swap existing nodes without allocating new ones
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(5))
+    nodes: set[Node] = set(linked_list.iter_nodes())
+    linked_list.swap_nodes(1, 3)
+    linked_list.swap_nodes(4, 0)
+    assert set(linked_list.iter_nodes()) == nodes
+    assert linked_list.as_list() == [4, 3, 2, 1, 0]
+
+
+# move_to_front()
+
+def test_move_to_front() -> None:
+    """move first node with given value to head
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3, 2])
+    tail_node = linked_list.get_tail_node()
+    assert linked_list.move_to_front(2) is True
+    assert linked_list.as_list() == [2, 1, 3, 2]
+    assert linked_list.move_to_front(2) is True
+    assert linked_list.as_list() == [2, 1, 3, 2]
+    assert linked_list.get_tail_node() is tail_node
+    assert linked_list.move_to_front(2) is True
+    linked_list.remove_node(2)
+    assert linked_list.move_to_front(2) is True
+    assert linked_list.as_list() == [2, 1, 3]
+    assert linked_list.get_tail_node().get_value() == 3
+
+def test_move_to_front_not_found() -> None:
+    """return False if value not found
+    """
+    assert LinkedList().move_to_front(1) is False
+    assert LinkedList.from_iterable([1, 2], indexed=True).move_to_front(3) is False
+
+
+# rotate()
+
+def test_rotate() -> None:
+    """move last nodes to the front, negative steps rotate left
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(5))
+    linked_list.rotate(2)
+    assert linked_list.as_list() == [3, 4, 0, 1, 2]
+    linked_list.rotate(-3)
+    assert linked_list.as_list() == [1, 2, 3, 4, 0]
+    linked_list.rotate(10)
+    assert linked_list.as_list() == [1, 2, 3, 4, 0]
+    LinkedList().rotate(3)
+
+def test_rotate_ends() -> None:
+    """return head node and keep tail node
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'c'])
+    head_node = linked_list.rotate()
+    assert head_node is linked_list.get_head_node()
+    assert head_node.get_value() == 'c'
+    assert linked_list.get_tail_node().get_value() == 'b'
+    assert linked_list.get_tail_node().get_next_node() is None
+
+
+# sort()
+
+def test_sort() -> None:
+    """sort values in ascending or descending order
+    """
+    values: list[int] = [5, 3, 9, 1, 3, 7, 2, 8, 0, 6, 4]
+    linked_list: LinkedList = LinkedList.from_iterable(values)
+    linked_list.sort()
+    assert linked_list.as_list() == sorted(values)
+    linked_list.sort(reverse=True)
+    assert linked_list.as_list() == sorted(values, reverse=True)
+    words: LinkedList = LinkedList.from_iterable(['pear', 'apple', 'fig'])
+    words.sort()
+    assert words.as_list() == ['apple', 'fig', 'pear']
+    empty: LinkedList = LinkedList()
+    empty.sort()
+    assert empty.as_list() == []
+
+def test_sort_stable_key() -> None:
+    """sort by key and keep order of equal keys
+    """
+    values: list[str] = ['bb', 'a', 'ccc', 'dd', 'e', 'fff', 'gg']
+    linked_list: LinkedList = LinkedList.from_iterable(values)
+    linked_list.sort(key=len)
+    assert linked_list.as_list() == sorted(values, key=len)
+    linked_list.sort(key=len, reverse=True)
+    assert linked_list.as_list() == sorted(values, key=len, reverse=True)
+
+def test_sort_key_calls() -> None:
+    """call key at most once per node in every merge pass
+    """
+    calls: list[int] = []
+
+    def key(value: int) -> int:
+        calls.append(value)
+        return value
+
+    values: list[int] = [(value * 7919) % 1024 for value in range(1024)]
+    for reverse in (False, True):
+        calls.clear()
+        linked_list: LinkedList = LinkedList.from_iterable(values)
+        linked_list.sort(key=key, reverse=reverse)
+        assert linked_list.as_list() == sorted(values, reverse=reverse)
+        # 10 merge passes for 1024 nodes
+        assert len(calls) <= 1024 * 10
+
+def test_sort_nodes() -> None:
+    """relink existing nodes and keep tail node
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([3, 1, 2], indexed=True)
+    nodes: dict[int | str, Node] = {node.value: node for node in linked_list.iter_nodes()}
+    linked_list.sort()
+    assert list(linked_list.iter_nodes()) == [nodes[1], nodes[2], nodes[3]]
+    assert linked_list.get_tail_node() is nodes[3]
+    assert nodes[3].get_next_node() is None
+    linked_list.remove_node(2)
+    assert linked_list.as_list() == [1, 3]
+
+def test_sort_error_keeps_nodes() -> None:
+    """keep every node when a comparison or key raises
+    """
+    values: list[int | str] = [5, 4, 3, 'a', 2, 1, 0, 9]
+    linked_list: LinkedList = LinkedList.from_iterable(values, indexed=True)
+    with pytest.raises(TypeError):
+        linked_list.sort()
+    assert sorted(linked_list.as_list(), key=str) == sorted(values, key=str)
+    assert len(linked_list) == len(values)
+    assert linked_list.get_tail_node().get_next_node() is None
+    assert list(linked_list.iter_nodes())[-1] is linked_list.get_tail_node()
+    assert linked_list.remove_node('a') is not None
+
+    def failing_key(value: int | str) -> int | str:
+        if value == 2:
+            raise ValueError(value)
+        return value
+
+    numbers: LinkedList = LinkedList.from_iterable([7, 3, 5, 1, 2, 6])
+    with pytest.raises(ValueError):
+        numbers.sort(key=failing_key)
+    assert sorted(numbers.as_list()) == [1, 2, 3, 5, 6, 7]
+    assert numbers.get_tail_node().get_next_node() is None
+
+
+# apply_permutation()
+
+def test_apply_permutation() -> None:
+    """reorder existing nodes by given order
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'c', 'd'])
+    nodes: list[Node] = list(linked_list.iter_nodes())
+    assert linked_list.apply_permutation([2, 0, 3, 1]) is True
+    assert linked_list.as_list() == ['c', 'a', 'd', 'b']
+    assert list(linked_list.iter_nodes()) == [nodes[2], nodes[0], nodes[3], nodes[1]]
+    assert linked_list.get_tail_node() is nodes[1]
+    assert LinkedList().apply_permutation([]) is True
+
+def test_apply_permutation_invalid() -> None:
+    """return False if order is not a permutation
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'c'])
+    assert linked_list.apply_permutation([0, 1]) is False
+    assert linked_list.apply_permutation([0, 1, 1]) is False
+    assert linked_list.apply_permutation([0, 1, 3]) is False
+    assert linked_list.apply_permutation([0, -1, 1]) is False
+    assert linked_list.as_list() == ['a', 'b', 'c']
+
+
+# value index
+
+def test_enable_disable_index() -> None:
+    """enable and disable index
+    """
+    linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3])
+    assert linked_list.is_indexed() is False
+    linked_list.enable_index()
+    assert linked_list.is_indexed() is True
+    assert linked_list.node_present(3) is True
+    linked_list.disable_index()
+    assert linked_list.is_indexed() is False
+    assert linked_list.node_present(3) is True
+    assert LinkedList(1, indexed=True).is_indexed() is True
+
+def test_index_operations() -> None:
+    """find, remove and swap nodes with index
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(range(10), indexed=True)
+    assert linked_list.node_present(9) is True
+    assert linked_list.node_present(10) is False
+    removed_node = linked_list.remove_node(9)
+    assert isinstance(removed_node, Node)
+    assert removed_node.get_value() == 9
+    assert linked_list.get_tail_node().get_value() == 8
+    assert linked_list.remove_node(9) is None
+    assert linked_list.swap_nodes(0, 8) is True
+    assert linked_list.swap_nodes(3, 4) is True
+    assert linked_list.swap_nodes(0, 10) is False
+    assert linked_list.as_list() == [8, 1, 2, 4, 3, 5, 6, 7, 0]
+    assert linked_list.get_tail_node().get_value() == 0
+    assert linked_list.get_length() == 9
+
+def test_index_unhashable() -> None:
+    """look up unhashable values by a scan, same results as without index
+    """
+
+    class EqualsThree:
+        """unhashable value equal to 3"""
+
+        __hash__ = None
+
+        def __eq__(self, other: object) -> bool:
+            return other == 3
+
+    for indexed in (False, True):
+        linked_list: LinkedList = LinkedList.from_iterable([1, 2, 3, 4], indexed=indexed)
+        assert [1] not in linked_list
+        assert linked_list.node_present([1]) is False
+        assert linked_list.remove_node([1]) is None
+        assert linked_list.swap_nodes([1], 2) is False
+        assert linked_list.move_to_front([1]) is False
+        assert EqualsThree() in linked_list
+        assert linked_list.swap_nodes(EqualsThree(), 1) is True
+        assert linked_list.move_to_front(EqualsThree()) is True
+        assert linked_list.remove_node(EqualsThree()).get_value() == 3
+        assert linked_list.as_list() == [2, 1, 4]
+        assert linked_list.node_present(3) is False
+        assert linked_list.remove_node(4).get_value() == 4
+        assert linked_list.get_tail_node().get_value() == 1
+        assert linked_list.swap_nodes(1, 2) is True
+        assert linked_list.as_list() == [1, 2]
+
+def test_index_duplicates() -> None:
+    """use first node in list order for duplicate values
+    """
+    linked_list: LinkedList = LinkedList.from_iterable(['a', 'b', 'a', 'c', 'b'], indexed=True)
+    assert linked_list.swap_nodes('c', 'a') is True
+    assert linked_list.as_list() == ['c', 'b', 'a', 'a', 'b']
+    assert linked_list.swap_nodes('b', 'a') is True
+    assert linked_list.as_list() == ['c', 'a', 'b', 'a', 'b']
+    linked_list.remove_node('b')
+    assert linked_list.as_list() == ['c', 'a', 'a', 'b']
+    linked_list.remove_node('a')
+    assert linked_list.as_list() == ['c', 'a', 'b']
+
+def test_index_after_changes() -> None:
+    """keep index after adding and updating nodes
+    """
+    linked_list: LinkedList = LinkedList(indexed=True)
+    linked_list.append_node(2)
+    linked_list.add_new_head(1)
+    linked_list.extend([3, 1])
+    linked_list.extend_left([0, 3])
+    assert linked_list.as_list() == [0, 3, 1, 2, 3, 1]
+    linked_list.update_at_index(2, 3)
+    linked_list.update_at_index(0, 5)
+    assert linked_list.as_list() == [5, 3, 3, 2, 3, 1]
+    linked_list.remove_node(3)
+    linked_list.remove_node(1)
+    linked_list.remove_node(5)
+    assert linked_list.as_list() == [3, 2, 3]
+    assert linked_list.node_present(1) is False
+    assert linked_list.get_tail_node().get_value() == 3
@@ -0,0 +1,261 @@
+"""
+LRU Cache:
+    - Cache holding at most capacity entries, the least recently used entry is evicted first.
+    - A dict maps every key to its node, and a doubly linked list keeps the nodes
+      in recency order, least recently used at the head and most recently used at the tail.
+    - get, put, delete and eviction take O(1): the dict finds the node and the doubly
+      linked list unlinks or moves it without a scan.
+    - Entries can expire after a time to live. Expired entries are removed when they
+      are read, or all at once by purge_expired.
+    - on_evict is called with key and value of every entry removed by eviction or expiry.
+    - Counts hits, misses, evictions and expirations.
+
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable, Iterator
+
+from doubly_linked_list import DoublyLinkedList
+from node import DoublyNode
+
+
+class CacheNode(DoublyNode):
+    """
+    node of the recency list holding key, value and expiry time of an entry
+    """
+
+    __slots__ = ("key", "expires_at")
+
+    def __init__(self, key: Hashable, value: object, expires_at: float | None) -> None:
+        """creates a detached node for a cache entry
+
+        Args:
+            key (Hashable): key of the entry
+            value (object): cached value
+            expires_at (float | None): clock time after which the entry expires, None never
+        """
+        super().__init__(value)
+        self.key: Hashable = key
+        self.expires_at: float | None = expires_at
+
+
+class LRUCache:
+    """
+    LRUCache Class
+    """
+
+    def __init__(self, capacity: int, ttl: float | None = None,
+                 on_evict: Callable[[Hashable, object], None] | None = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """create empty cache
+
+        Args:
+            capacity (int): largest number of entries
+            ttl (float | None, optional): seconds an entry lives after put, None for no expiry.
+            Defaults to None.
+            on_evict (Callable[[Hashable, object], None] | None, optional): called with key
+            and value of evicted and expired entries. Defaults to None.
+            clock (Callable[[], float], optional): source of current time in seconds.
+            Defaults to time.monotonic.
+
+        Raises:
+            ValueError: if capacity is below 1 or ttl is not positive
+        """
+        if capacity < 1:
+            raise ValueError("cache capacity must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("cache ttl must be positive")
+        self.capacity: int = capacity
+        self.ttl: float | None = ttl
+        self.on_evict: Callable[[Hashable, object], None] | None = on_evict
+        self.clock: Callable[[], float] = clock
+        self._nodes: dict[Hashable, CacheNode] = {}
+        self._recency: DoublyLinkedList = DoublyLinkedList()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def _expired(self, node: CacheNode) -> bool:
+        """check if entry of node has expired
+
+        Args:
+            node (CacheNode): node of the entry
+
+        Returns:
+            bool: True if entry has an expiry time which has passed
+        """
+        return node.expires_at is not None and self.clock() >= node.expires_at
+
+    def _discard(self, node: CacheNode) -> None:
+        """remove entry of node from dict and recency list
+
+        Args:
+            node (CacheNode): node of the entry
+        """
+        del self._nodes[node.key]
+        self._recency.remove(node)
+
+    def _expire(self, node: CacheNode) -> None:
+        """remove expired entry and report it
+
+        Args:
+            node (CacheNode): node of the expired entry
+        """
+        self._discard(node)
+        self.expirations += 1
+        if self.on_evict is not None:
+            self.on_evict(node.key, node.value)
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """get cached value and mark entry as most recently used
+
+        Args:
+            key (Hashable): key of the entry
+            default (object, optional): returned on a miss. Defaults to None.
+
+        Returns:
+            object: cached value, default if key is missing or expired
+        """
+        node: CacheNode | None = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node):
+            self._expire(node)
+            self.misses += 1
+            return default
+        self._recency.move_to_tail(node)
+        self.hits += 1
+        return node.value
+
+    def peek(self, key: Hashable, default: object = None) -> object:
+        """get cached value without changing recency or counters
+
+        Args:
+            key (Hashable): key of the entry
+            default (object, optional): returned if key is missing or expired. Defaults to None.
+
+        Returns:
+            object: cached value or default
+        """
+        node: CacheNode | None = self._nodes.get(key)
+        if node is None or self._expired(node):
+            return default
+        return node.value
+
+    def put(self, key: Hashable, value: object, ttl: float | None = None) -> None:
+        """add or replace entry and mark it as most recently used
+
+        Evicts the least recently used entry when a new key is added to a full cache.
+
+        Args:
+            key (Hashable): key of the entry
+            value (object): value to cache
+            ttl (float | None, optional): seconds this entry lives, None for the cache ttl.
+            Defaults to None.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        expires_at: float | None = None if ttl is None else self.clock() + ttl
+        node: CacheNode | None = self._nodes.get(key)
+        if node is not None:
+            node.value = value
+            node.expires_at = expires_at
+            self._recency.move_to_tail(node)
+            return
+        evicted: CacheNode | None = None
+        if len(self._nodes) >= self.capacity:
+            evicted = self._evict()
+        node = CacheNode(key, value, expires_at)
+        self._nodes[key] = node
+        self._recency.append_existing_node(node)
+        # called once the new entry is in place, so on_evict may use the cache again
+        if evicted is not None and self.on_evict is not None:
+            self.on_evict(evicted.key, evicted.value)
+
+    def _evict(self) -> CacheNode:
+        """remove least recently used entry without calling on_evict,
+        an expired one counts as expiration
+
+        Returns:
+            CacheNode: node of the removed entry
+        """
+        node: CacheNode = self._recency.get_head_node()
+        if self._expired(node):
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        self._discard(node)
+        return node
+
+    def delete(self, key: Hashable) -> bool:
+        """remove entry without calling on_evict
+
+        Args:
+            key (Hashable): key of the entry
+
+        Returns:
+            bool: True if entry was present else False
+        """
+        node: CacheNode | None = self._nodes.get(key)
+        if node is None:
+            return False
+        self._discard(node)
+        return True
+
+    def purge_expired(self) -> int:
+        """remove every expired entry
+
+        on_evict may delete or refresh other entries, an entry which is gone or no
+        longer expired by the time its turn comes is skipped.
+
+        Returns:
+            int: number of removed entries
+        """
+        expired: list[CacheNode] = [
+            node for node in self._recency.iter_nodes() if self._expired(node)
+        ]
+        removed: int = 0
+        for node in expired:
+            if self._nodes.get(node.key) is not node or not self._expired(node):
+                continue
+            self._expire(node)
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """remove every entry without calling on_evict, counters are kept
+        """
+        self._nodes.clear()
+        self._recency = DoublyLinkedList()
+
+    def keys(self) -> Iterator[Hashable]:
+        """yield keys from least to most recently used
+
+        Yields:
+            Hashable: key of next entry
+        """
+        for node in self._recency.iter_nodes():
+            yield node.key
+
+    def __contains__(self, key: object) -> bool:
+        """check if key has an entry which has not expired, recency is not changed
+
+        Args:
+            key (object): key to find
+
+        Returns:
+            bool: True if entry is present else False
+        """
+        node: CacheNode | None = self._nodes.get(key)
+        return node is not None and not self._expired(node)
+
+    def __len__(self) -> int:
+        """get number of entries, expired entries not yet removed included
+
+        Returns:
+            int: entry count
+        """
+        return len(self._nodes)
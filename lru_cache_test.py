@@ -0,0 +1,264 @@
+"""
+LRUCache class unit tests
+
+- __init__
+    - create empty cache
+    - raise ValueError for capacity below 1 or ttl not positive
+
+- get / peek / put
+    - return cached value or default
+    - replace value of existing key
+    - count hits and misses, peek counts nothing
+
+- eviction
+    - evict least recently used entry when full
+    - get and put mark entry as most recently used, peek does not
+    - call on_evict with key and value
+    - call on_evict after the new entry is added, so it may put entries itself
+
+- ttl
+    - expire entries after ttl, per entry ttl overrides cache ttl
+    - put refreshes expiry time
+    - count expirations and call on_evict, purge_expired removes all expired entries
+    - purge_expired skips entries which on_evict already deleted or refreshed
+
+- delete / clear / keys
+    - remove entry without calling on_evict
+    - yield keys from least to most recently used
+
+"""
+
+import pytest
+
+from lru_cache import LRUCache
+
+
+class FakeClock:
+    """clock which only moves when told to
+    """
+
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# __init__()
+
+def test_empty_cache() -> None:
+    """create empty cache
+    """
+    cache: LRUCache = LRUCache(2)
+    assert len(cache) == 0
+    assert 'a' not in cache
+    assert list(cache.keys()) == []
+
+def test_invalid_arguments() -> None:
+    """raise ValueError for capacity below 1 or ttl not positive
+    """
+    with pytest.raises(ValueError):
+        LRUCache(0)
+    with pytest.raises(ValueError):
+        LRUCache(1, ttl=0)
+
+
+# get() / peek() / put()
+
+def test_get_put() -> None:
+    """return cached value or default
+    """
+    cache: LRUCache = LRUCache(2)
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('b', 0) == 0
+    assert cache.peek('a') == 1
+    assert cache.peek('b', 'x') == 'x'
+
+def test_replace_value() -> None:
+    """replace value of existing key
+    """
+    cache: LRUCache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('a', 2)
+    assert cache.get('a') == 2
+    assert len(cache) == 1
+
+def test_counters() -> None:
+    """count hits and misses, peek counts nothing
+    """
+    cache: LRUCache = LRUCache(2)
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    cache.peek('a')
+    cache.peek('b')
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 0)
+
+
+# eviction
+
+def test_evict_least_recently_used() -> None:
+    """evict least recently used entry when full
+    """
+    cache: LRUCache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    assert 'a' not in cache
+    assert list(cache.keys()) == ['b', 'c']
+    assert cache.evictions == 1
+
+def test_recency() -> None:
+    """get and put mark entry as most recently used, peek does not
+    """
+    cache: LRUCache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert list(cache.keys()) == ['a', 'c']
+    cache.put('a', 4)
+    cache.peek('c')
+    cache.put('d', 5)
+    assert list(cache.keys()) == ['a', 'd']
+
+def test_on_evict() -> None:
+    """call on_evict with key and value
+    """
+    evicted: list[tuple] = []
+    cache: LRUCache = LRUCache(1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('b', 3)
+    assert evicted == [('a', 1)]
+
+def test_on_evict_reentrant() -> None:
+    """call on_evict after the new entry is added, so it may put entries itself
+    """
+
+    def on_evict(key: str, value: int) -> None:
+        if key == 'a':
+            cache.put('z', 26)
+        elif key == 'b':
+            cache.put('y', 25)
+
+    cache: LRUCache = LRUCache(2, on_evict=on_evict)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('z', 0)
+    assert list(cache.keys()) == ['b', 'z']
+    assert cache.peek('z') == 26
+    assert len(cache) == 2
+    assert cache._recency.get_length() == 2
+    cache.put('x', 24)
+    # b is evicted for x, then z is evicted for y
+    assert list(cache.keys()) == ['x', 'y']
+    assert len(cache) == 2
+    assert cache._recency.get_length() == 2
+    assert cache.evictions == 3
+    assert cache.delete('x') is True
+    assert cache.delete('y') is True
+    assert list(cache.keys()) == []
+
+
+# ttl
+
+def test_expiry() -> None:
+    """expire entries after ttl, per entry ttl overrides cache ttl
+    """
+    clock: FakeClock = FakeClock()
+    cache: LRUCache = LRUCache(4, ttl=10, clock=clock)
+    cache.put('a', 1)
+    cache.put('b', 2, ttl=20)
+    clock.now = 9.5
+    assert cache.get('a') == 1
+    clock.now = 10
+    assert 'a' not in cache
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    clock.now = 20
+    assert cache.get('b') is None
+    assert len(cache) == 0
+
+def test_put_refreshes_expiry() -> None:
+    """put refreshes expiry time
+    """
+    clock: FakeClock = FakeClock()
+    cache: LRUCache = LRUCache(2, ttl=10, clock=clock)
+    cache.put('a', 1)
+    clock.now = 8
+    cache.put('a', 2)
+    clock.now = 15
+    assert cache.get('a') == 2
+
+def test_expiration_counter() -> None:
+    """count expirations and call on_evict, purge_expired removes all expired entries
+    """
+    clock: FakeClock = FakeClock()
+    evicted: list[str] = []
+    cache: LRUCache = LRUCache(3, ttl=5, clock=clock,
+                               on_evict=lambda key, value: evicted.append(key))
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3, ttl=50)
+    clock.now = 5
+    cache.get('a')
+    assert cache.purge_expired() == 1
+    assert list(cache.keys()) == ['c']
+    assert (cache.expirations, cache.evictions, cache.misses) == (2, 0, 1)
+    assert evicted == ['a', 'b']
+
+def test_purge_cascading_delete() -> None:
+    """purge_expired skips entries which on_evict already deleted or refreshed
+    """
+    clock: FakeClock = FakeClock()
+    evicted: list[str] = []
+
+    def on_evict(key: str, value: int) -> None:
+        evicted.append(key)
+        if key == 'a':
+            cache.delete('b')
+            cache.put('c', 30, ttl=50)
+
+    cache: LRUCache = LRUCache(4, ttl=5, clock=clock, on_evict=on_evict)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    cache.put('d', 4, ttl=50)
+    clock.now = 5
+    assert cache.purge_expired() == 1
+    assert evicted == ['a']
+    assert list(cache.keys()) == ['d', 'c']
+    assert cache.get('c') == 30
+    assert cache.expirations == 1
+
+
+# delete() / clear() / keys()
+
+def test_delete_and_clear() -> None:
+    """remove entry without calling on_evict
+    """
+    evicted: list[str] = []
+    cache: LRUCache = LRUCache(3, on_evict=lambda key, value: evicted.append(key))
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.delete('a') is True
+    assert cache.delete('a') is False
+    cache.clear()
+    assert len(cache) == 0
+    cache.put('c', 3)
+    assert cache.get('c') == 3
+    assert evicted == []
+
+def test_keys_order() -> None:
+    """yield keys from least to most recently used
+    """
+    cache: LRUCache = LRUCache(3)
+    for key in 'abc':
+        cache.put(key, key)
+    cache.get('b')
+    cache.get('a')
+    assert list(cache.keys()) == ['c', 'b', 'a']
@@ -15,8 +15,11 @@ class Node:
     """Node class
     """
 
+    # no per instance __dict__, keeps large lists compact
+    __slots__ = ("value", "next_node")
+
     def __init__(self, value: int | str, next_node: Node | None = None) -> None:
-        """creates a node with immutable value and a link to next node
+        """creates a node with a value and a link to next node
 
         Args:
             value int | str: value of the node
@@ -55,3 +58,44 @@ class Node:
         """
         self.next_node = next_node
         return self.next_node
+
+
+class DoublyNode(Node):
+    """Node class with a link to previous node
+    """
+
+    __slots__ = ("prev_node",)
+
+    def __init__(self, value: int | str, next_node: DoublyNode | None = None,
+                 prev_node: DoublyNode | None = None) -> None:
+        """creates a node with value and links to next and previous node
+
+        Args:
+            value int | str: value of the node
+            next_node (DoublyNode, optional): next node that will be linked. Defaults to None
+            prev_node (DoublyNode, optional): previous node that will be linked. Defaults to None
+        """
+        super().__init__(value, next_node)
+        self.prev_node = prev_node
+
+
+    def get_prev_node(self) -> DoublyNode | None:
+        """get previous linked node
+
+        Returns:
+          DoublyNode | None: previous linked node
+        """
+        return self.prev_node
+
+
+    def set_prev_node(self, prev_node: DoublyNode | None) -> DoublyNode | None:
+        """update value of prev_node
+
+        Args:
+            prev_node (DoublyNode | None): previous node to be linked
+
+        Returns:
+            DoublyNode | None: updated prev_node
+        """
+        self.prev_node = prev_node
+        return self.prev_node
@@ -5,6 +5,7 @@ Node class unit tests
     - create node with value
     - next node is None if no value is provided
     - next node is set to given node
+    - node has no per instance __dict__
 
 - get_value
     - return the value of the node
@@ -18,9 +19,16 @@ Node class unit tests
     - set next node to given node
     - return given node
 
+- DoublyNode
+    - previous node is None if no value is provided
+    - next and previous node are set to given nodes
+    - get_prev_node returns previous node
+    - set_prev_node sets and returns given node
+    - node has no per instance __dict__
+
 """
 
-from node import Node
+from node import DoublyNode, Node
 
 # __init__()
 
@@ -44,6 +52,12 @@ def test_given_next_node():
     node_2 = Node(value=2, next_node=node_1)
     assert node_2.next_node == node_1
 
+def test_node_slots():
+    """node has no per instance __dict__
+    """
+    node = Node(value=1)
+    assert not hasattr(node, "__dict__")
+
 
 # get_value()
 
@@ -96,3 +110,47 @@ def test_set_next_node_return_node():
     node_2 = Node(value=2)
     result = node_2.set_next_node(next_node=node_1)
     assert result == node_1
+
+
+# DoublyNode
+
+def test_doubly_prev_node_none():
+    """previous node is None if no value is provided
+    """
+    node = DoublyNode(value=1)
+    assert node.prev_node is None
+    assert node.next_node is None
+
+def test_doubly_given_nodes():
+    """next and previous node are set to given nodes
+    """
+    node_1 = DoublyNode(value=1)
+    node_3 = DoublyNode(value=3)
+    node_2 = DoublyNode(value=2, next_node=node_3, prev_node=node_1)
+    assert node_2.next_node is node_3
+    assert node_2.prev_node is node_1
+
+def test_doubly_get_prev_node():
+    """get_prev_node returns previous node
+    """
+    node_1 = DoublyNode(value=1)
+    node_2 = DoublyNode(value=2, prev_node=node_1)
+    assert node_2.get_prev_node() is node_1
+    assert node_1.get_prev_node() is None
+
+def test_doubly_set_prev_node():
+    """set_prev_node sets and returns given node
+    """
+    node_1 = DoublyNode(value=1)
+    node_2 = DoublyNode(value=2)
+    result = node_2.set_prev_node(node_1)
+    assert node_2.prev_node is node_1
+    assert result is node_1
+    node_2.set_prev_node(None)
+    assert node_2.prev_node is None
+
+def test_doubly_node_slots():
+    """node has no per instance __dict__
+    """
+    node = DoublyNode(value=1)
+    assert not hasattr(node, "__dict__")
@@ -0,0 +1,368 @@
+"""
+Persistent List:
+    - Immutable linked list, every change returns a new list and leaves the old one as it was.
+    - Lists share nodes: adding a head node links the new node to the existing chain,
+      and the tail of a list is the chain after its head node.
+    - A change at index i copies only the i nodes before it, the rest of the chain is shared.
+    - prepend, tail and snapshot take O(1), so keeping many versions costs only the changed parts.
+    - Nodes reachable from a persistent list are never changed once the list is created.
+      They are FrozenNodes, which raise AttributeError on any change, so nodes handed out
+      by get_head_node or access_node_by_index cannot change other lists sharing them.
+
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from node import Node
+
+# slot setters of Node, used to link a FrozenNode which is not shared yet
+_set_value = Node.value.__set__
+_set_next_node = Node.next_node.__set__
+
+
+class FrozenNode(Node):
+    """Node which cannot be changed once it is reachable from a persistent list
+    """
+
+    __slots__ = ()
+
+    def __init__(self, value: int | str, next_node: FrozenNode | None = None) -> None:
+        """creates a node with a value and a link to next node
+
+        Args:
+            value (int | str): value of the node
+            next_node (FrozenNode | None, optional): next node. Defaults to None.
+        """
+        _set_value(self, value)
+        _set_next_node(self, next_node)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot set {name!r}, persistent list nodes cannot be changed")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete {name!r}, persistent list nodes cannot be changed")
+
+
+class PersistentList:
+    """
+    PersistentList Class
+    """
+
+    __slots__ = ("head_node", "length")
+
+    def __init__(self, values: Iterable[int | str] = ()) -> None:
+        """create persistent list holding given values
+
+        Args:
+            values (Iterable[int | str], optional): values in list order. Defaults to ().
+        """
+        head_node: FrozenNode | None = None
+        last_node: FrozenNode | None = None
+        length: int = 0
+        for value in values:
+            # nodes are not shared yet, so they can still be linked in place
+            new_node: FrozenNode = FrozenNode(value)
+            if last_node is None:
+                head_node = new_node
+            else:
+                _set_next_node(last_node, new_node)
+            last_node = new_node
+            length += 1
+        self.head_node: FrozenNode | None = head_node
+        self.length: int = length
+
+    @classmethod
+    def _from_chain(cls, head_node: FrozenNode | None, length: int) -> PersistentList:
+        """wrap an existing chain without copying it
+
+        Args:
+            head_node (FrozenNode | None): first node of the chain
+            length (int): number of nodes in the chain
+
+        Returns:
+            PersistentList: list sharing the chain
+        """
+        persistent_list: PersistentList = cls.__new__(cls)
+        persistent_list.head_node = head_node
+        persistent_list.length = length
+        return persistent_list
+
+    def _with_prefix_copied(self, count: int, rest: FrozenNode | None,
+                            values: Iterable[int | str], length: int) -> PersistentList:
+        """new list of copies of the first count nodes, then given values, then rest
+
+        Args:
+            count (int): number of nodes to copy from the start of this list
+            rest (FrozenNode | None): shared chain linked after the copies and values
+            values (Iterable[int | str]): values of new nodes between the copies and rest
+            length (int): length of the new list
+
+        Returns:
+            PersistentList: new list
+        """
+        head_node: FrozenNode | None = None
+        last_node: FrozenNode | None = None
+        current_node: FrozenNode | None = self.head_node
+
+        def link(new_node: FrozenNode) -> None:
+            nonlocal head_node, last_node
+            if last_node is None:
+                head_node = new_node
+            else:
+                _set_next_node(last_node, new_node)
+            last_node = new_node
+
+        for _ in range(count):
+            link(FrozenNode(current_node.value))
+            current_node = current_node.next_node
+        for value in values:
+            link(FrozenNode(value))
+        if last_node is None:
+            return self._from_chain(rest, length)
+        _set_next_node(last_node, rest)
+        return self._from_chain(head_node, length)
+
+    def _normalize_index(self, index: int, upper: int) -> int | None:
+        """convert negative index and check range
+
+        Args:
+            index (int): index, negative index counts from the end
+            upper (int): largest valid index
+
+        Returns:
+            int | None: index between 0 and upper, None if out of range
+        """
+        if index < 0:
+            index += self.length
+        if index < 0 or index > upper:
+            return None
+        return index
+
+    def get_head_node(self) -> FrozenNode | None:
+        """get head node of the list, it cannot be changed
+
+        Returns:
+            FrozenNode | None: returns node if present else None
+        """
+        return self.head_node
+
+    def first(self) -> int | str | None:
+        """get value of head node
+
+        Returns:
+            int | str | None: value of head node, None if list is empty
+        """
+        if self.head_node is None:
+            return None
+        return self.head_node.value
+
+    def prepend(self, value: int | str) -> PersistentList:
+        """new list with given value before this list, shares every node of this list
+
+        Args:
+            value (int | str): value of new head node
+
+        Returns:
+            PersistentList: new list
+        """
+        return self._from_chain(FrozenNode(value, self.head_node), self.length + 1)
+
+    cons = prepend
+
+    def tail(self) -> PersistentList:
+        """list of every node after the head node, shares all of them
+
+        Returns:
+            PersistentList: new list, empty if this list is empty
+        """
+        if self.head_node is None:
+            return self
+        return self._from_chain(self.head_node.next_node, self.length - 1)
+
+    def snapshot(self) -> PersistentList:
+        """get a version of the list which later changes do not affect
+
+        Returns:
+            PersistentList: this list, it can never change
+        """
+        return self
+
+    def append_node(self, new_node_value: int | str) -> PersistentList:
+        """new list with given value at the end, copies every node
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            PersistentList: new list
+        """
+        return self._with_prefix_copied(self.length, None, (new_node_value,), self.length + 1)
+
+    def insert_at_index(self, index: int, value: int | str) -> PersistentList | None:
+        """new list with given value at index, copies the nodes before index
+
+        Args:
+            index (int): index of the new node, from 0 to length. Negative index also works
+            value (int | str): value of new node
+
+        Returns:
+            PersistentList | None: new list, None if index out of range
+        """
+        position: int | None = self._normalize_index(index, self.length)
+        if position is None:
+            return None
+        rest: FrozenNode | None = self._node_at(position)
+        return self._with_prefix_copied(position, rest, (value,), self.length + 1)
+
+    def update_at_index(self, index: int, new_value: int | str) -> PersistentList | None:
+        """new list with node at index replaced, copies the nodes up to index
+
+        Args:
+            index (int): index of the node. Negative index also works
+            new_value (int | str): new value of the node
+
+        Returns:
+            PersistentList | None: new list, None if index out of range
+        """
+        position: int | None = self._normalize_index(index, self.length - 1)
+        if position is None:
+            return None
+        rest: FrozenNode | None = self._node_at(position).next_node
+        return self._with_prefix_copied(position, rest, (new_value,), self.length)
+
+    def remove_at_index(self, index: int) -> PersistentList | None:
+        """new list without node at index, copies the nodes before index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            PersistentList | None: new list, None if index out of range
+        """
+        position: int | None = self._normalize_index(index, self.length - 1)
+        if position is None:
+            return None
+        rest: FrozenNode | None = self._node_at(position).next_node
+        return self._with_prefix_copied(position, rest, (), self.length - 1)
+
+    def remove_node(self, value: int | str) -> PersistentList:
+        """new list without first node with given value, copies the nodes before it
+
+        Args:
+            value (int | str): value to remove
+
+        Returns:
+            PersistentList: new list, this list if value is not found
+        """
+        position: int = 0
+        for node_value in self:
+            if node_value == value:
+                return self.remove_at_index(position)
+            position += 1
+        return self
+
+    def _node_at(self, index: int) -> FrozenNode | None:
+        """get node at index between 0 and length, None for index length
+
+        Args:
+            index (int): index of the node
+
+        Returns:
+            FrozenNode | None: node at index
+        """
+        current_node: FrozenNode | None = self.head_node
+        for _ in range(index):
+            current_node = current_node.next_node
+        return current_node
+
+    def access_node_by_index(self, index: int) -> FrozenNode | None:
+        """get node from list by index, it cannot be changed
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            FrozenNode | None: return node if found else None
+        """
+        position: int | None = self._normalize_index(index, self.length - 1)
+        if position is None:
+            return None
+        return self._node_at(position)
+
+    def __getitem__(self, index: int) -> int | str:
+        """get value at index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Raises:
+            IndexError: if index is out of range
+
+        Returns:
+            int | str: value at index
+        """
+        node: FrozenNode | None = self.access_node_by_index(index)
+        if node is None:
+            raise IndexError("persistent list index out of range")
+        return node.value
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        current_node: FrozenNode | None = self.head_node
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_node
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        for node_value in self:
+            if node_value == value:
+                return True
+        return False
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self
+
+    def as_list(self) -> list[int | str]:
+        """return persistent list in form of list
+
+        Returns:
+            list[int | str]: list of str of list of int. Depending on dtype of value
+        """
+        return list(self)
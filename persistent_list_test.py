@@ -0,0 +1,167 @@
+"""
+PersistentList class unit tests
+
+- __init__
+    - create empty list or list with given values
+
+- prepend / cons
+    - return new list with value at head
+    - share every node of the old list
+    - leave old list unchanged
+
+- tail / first / snapshot
+    - return list after head node sharing its nodes
+    - return value of head node, None if empty
+    - snapshot is the list itself
+
+- append_node / insert_at_index / update_at_index / remove_at_index / remove_node
+    - return new list with the change, old list unchanged
+    - share the nodes after the changed node
+    - return None if index out of range
+
+- reading
+    - index, iterate, check membership and length
+    - raise AttributeError when a node handed out is changed, shared lists stay unchanged
+
+"""
+
+import pytest
+
+from persistent_list import PersistentList
+
+
+# __init__()
+
+def test_create_list() -> None:
+    """create empty list or list with given values
+    """
+    assert PersistentList().as_list() == []
+    assert PersistentList().get_head_node() is None
+    persistent_list: PersistentList = PersistentList(x for x in [1, 2, 3])
+    assert persistent_list.as_list() == [1, 2, 3]
+    assert persistent_list.get_length() == 3
+
+
+# prepend() / cons()
+
+def test_prepend() -> None:
+    """return new list with value at head
+    """
+    persistent_list: PersistentList = PersistentList([2, 3]).prepend(1)
+    assert persistent_list.as_list() == [1, 2, 3]
+    assert persistent_list.cons(0).as_list() == [0, 1, 2, 3]
+    assert PersistentList().cons('a').as_list() == ['a']
+
+def test_prepend_shares_nodes() -> None:
+    """share every node of the old list
+    """
+    old_list: PersistentList = PersistentList([2, 3])
+    new_list: PersistentList = old_list.prepend(1)
+    assert new_list.get_head_node().get_next_node() is old_list.get_head_node()
+
+def test_prepend_keeps_old_list() -> None:
+    """leave old list unchanged
+    """
+    old_list: PersistentList = PersistentList([2, 3])
+    old_list.prepend(1)
+    old_list.prepend(0)
+    assert old_list.as_list() == [2, 3]
+    assert len(old_list) == 2
+
+
+# tail() / first() / snapshot()
+
+def test_tail() -> None:
+    """return list after head node sharing its nodes
+    """
+    persistent_list: PersistentList = PersistentList([1, 2, 3])
+    tail_list: PersistentList = persistent_list.tail()
+    assert tail_list.as_list() == [2, 3]
+    assert tail_list.get_length() == 2
+    assert tail_list.get_head_node() is persistent_list.get_head_node().get_next_node()
+    assert PersistentList().tail().as_list() == []
+
+def test_first() -> None:
+    """return value of head node, None if empty
+    """
+    assert PersistentList(['a', 'b']).first() == 'a'
+    assert PersistentList().first() is None
+
+def test_snapshot() -> None:
+    """snapshot is the list itself
+    """
+    persistent_list: PersistentList = PersistentList([1])
+    assert persistent_list.snapshot() is persistent_list
+
+
+# changes
+
+def test_changes_keep_old_list() -> None:
+    """return new list with the change, old list unchanged
+    """
+    old_list: PersistentList = PersistentList([1, 2, 3, 4])
+    assert old_list.append_node(5).as_list() == [1, 2, 3, 4, 5]
+    assert old_list.insert_at_index(2, 'x').as_list() == [1, 2, 'x', 3, 4]
+    assert old_list.insert_at_index(-1, 'x').as_list() == [1, 2, 3, 'x', 4]
+    assert old_list.insert_at_index(4, 'x').as_list() == [1, 2, 3, 4, 'x']
+    assert old_list.update_at_index(-1, 'y').as_list() == [1, 2, 3, 'y']
+    assert old_list.update_at_index(0, 'y').as_list() == ['y', 2, 3, 4]
+    assert old_list.remove_at_index(1).as_list() == [1, 3, 4]
+    assert old_list.remove_node(4).as_list() == [1, 2, 3]
+    assert old_list.remove_node(9) is old_list
+    assert old_list.as_list() == [1, 2, 3, 4]
+    assert old_list.remove_at_index(0).get_length() == 3
+
+def test_changes_share_suffix() -> None:
+    """share the nodes after the changed node
+    """
+    old_list: PersistentList = PersistentList([1, 2, 3, 4])
+    shared_node = old_list.access_node_by_index(2)
+    assert old_list.update_at_index(1, 'b').access_node_by_index(2) is shared_node
+    assert old_list.remove_at_index(1).access_node_by_index(1) is shared_node
+    assert old_list.insert_at_index(2, 'c').access_node_by_index(3) is shared_node
+    assert old_list.remove_at_index(0).get_head_node() is old_list.access_node_by_index(1)
+
+def test_changes_out_of_range() -> None:
+    """return None if index out of range
+    """
+    persistent_list: PersistentList = PersistentList([1, 2])
+    assert persistent_list.insert_at_index(3, 'x') is None
+    assert persistent_list.update_at_index(2, 'x') is None
+    assert persistent_list.remove_at_index(-3) is None
+
+
+# reading
+
+def test_reading() -> None:
+    """index, iterate, check membership and length
+    """
+    persistent_list: PersistentList = PersistentList('abc')
+    assert persistent_list[0] == 'a'
+    assert persistent_list[-1] == 'c'
+    with pytest.raises(IndexError):
+        persistent_list[3]
+    assert list(persistent_list) == ['a', 'b', 'c']
+    assert 'b' in persistent_list
+    assert persistent_list.node_present('d') is False
+    assert len(persistent_list) == 3
+
+def test_nodes_cannot_change() -> None:
+    """raise AttributeError when a node handed out is changed, shared lists stay unchanged
+    """
+    old_list: PersistentList = PersistentList([1, 2, 3])
+    new_list: PersistentList = old_list.prepend(0)
+    head_node = old_list.get_head_node()
+    middle_node = new_list.access_node_by_index(2)
+    for node in (head_node, middle_node):
+        with pytest.raises(AttributeError):
+            node.value = 9
+        with pytest.raises(AttributeError):
+            node.next_node = None
+        with pytest.raises(AttributeError):
+            node.set_next_node(None)
+        with pytest.raises(AttributeError):
+            del node.next_node
+    assert old_list.as_list() == [1, 2, 3]
+    assert new_list.as_list() == [0, 1, 2, 3]
+    assert old_list.update_at_index(0, 'a').get_head_node().get_next_node() is middle_node
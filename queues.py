@@ -0,0 +1,528 @@
+"""
+Queues:
+    - First in first out, items are enqueued at the back and dequeued from the front.
+    - CircularQueue is bounded and stores items in a ring buffer allocated once when
+      it is created. Front and back indexes wrap around, so slots freed at the front
+      are reused at the back and the buffer is never reallocated.
+    - LinkedQueue grows without bound, items are nodes of a chain from front to back.
+    - ArrayDeque and LinkedDeque are double ended queues, items are added and removed
+      at both ends. ArrayDeque is a bounded ring buffer, LinkedDeque a doubly linked list.
+    - Every single item operation takes O(1).
+    - enqueue_many / dequeue_many (also named push_many / pop_many) move a batch of items,
+      the ring buffers copy them with at most two slice assignments.
+    - A refused enqueue returns False and dequeue / peek of an empty queue return None
+      instead of raising.
+
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import islice
+
+from doubly_linked_list import DoublyLinkedList
+from node import Node
+
+
+class CircularQueue:
+    """
+    CircularQueue Class
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """create empty queue with room for capacity items
+
+        Args:
+            capacity (int): largest number of items
+
+        Raises:
+            ValueError: if capacity is below 1
+        """
+        if capacity < 1:
+            raise ValueError("queue capacity must be at least 1")
+        self.capacity: int = capacity
+        self._items: list[int | str | None] = [None] * capacity
+        self._front: int = 0
+        self._size: int = 0
+
+    def _write(self, start: int, batch: list[int | str]) -> None:
+        """copy batch into slots from start on, wrapping around the end of the buffer
+
+        Args:
+            start (int): slot of first value
+            batch (list[int | str]): values to copy, at most capacity
+        """
+        first_part: int = min(len(batch), self.capacity - start)
+        self._items[start:start + first_part] = batch[:first_part]
+        self._items[:len(batch) - first_part] = batch[first_part:]
+
+    def _take(self, start: int, count: int) -> list[int | str]:
+        """read count values from start on and clear their slots
+
+        Args:
+            start (int): slot of first value
+            count (int): number of values, at most capacity
+
+        Returns:
+            list[int | str]: values in slot order
+        """
+        items: list[int | str | None] = self._items
+        first_part: int = min(count, self.capacity - start)
+        rest: int = count - first_part
+        batch: list[int | str] = items[start:start + first_part] + items[:rest]
+        items[start:start + first_part] = [None] * first_part
+        items[:rest] = [None] * rest
+        return batch
+
+    def enqueue(self, value: int | str) -> bool:
+        """add value at the back of the queue
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            bool: True if added, False if the queue is full
+        """
+        if self._size == self.capacity:
+            return False
+        self._items[(self._front + self._size) % self.capacity] = value
+        self._size += 1
+        return True
+
+    def dequeue(self) -> int | str | None:
+        """remove and return front value
+
+        Returns:
+            int | str | None: front value, None if the queue is empty
+        """
+        if self._size == 0:
+            return None
+        value: int | str | None = self._items[self._front]
+        self._items[self._front] = None
+        self._front = (self._front + 1) % self.capacity
+        self._size -= 1
+        return value
+
+    def peek(self) -> int | str | None:
+        """get front value without removing it
+
+        Returns:
+            int | str | None: front value, None if the queue is empty
+        """
+        if self._size == 0:
+            return None
+        return self._items[self._front]
+
+    def enqueue_many(self, values: Iterable[int | str]) -> int:
+        """add values at the back in given order while there is room
+
+        Values which do not fit are not consumed from an iterator.
+
+        Args:
+            values (Iterable[int | str]): values to add
+
+        Returns:
+            int: number of added values
+        """
+        batch: list[int | str] = list(islice(values, self.capacity - self._size))
+        self._write((self._front + self._size) % self.capacity, batch)
+        self._size += len(batch)
+        return len(batch)
+
+    def dequeue_many(self, count: int) -> list[int | str]:
+        """remove up to count values from the front
+
+        Args:
+            count (int): number of values to remove
+
+        Returns:
+            list[int | str]: removed values, front value first
+        """
+        count = max(0, min(count, self._size))
+        batch: list[int | str] = self._take(self._front, count)
+        self._front = (self._front + count) % self.capacity
+        self._size -= count
+        return batch
+
+    push_many = enqueue_many
+    pop_many = dequeue_many
+
+    def is_empty(self) -> bool:
+        """check if the queue is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """check if the queue is full
+
+        Returns:
+            bool: True if no more items can be added
+        """
+        return self._size == self.capacity
+
+    def __len__(self) -> int:
+        """get number of items in the queue
+
+        Returns:
+            int: item count
+        """
+        return self._size
+
+
+class LinkedQueue:
+    """
+    LinkedQueue Class
+    """
+
+    def __init__(self) -> None:
+        """create empty queue
+        """
+        self.front_node: Node | None = None
+        self.back_node: Node | None = None
+        self.length: int = 0
+
+    def enqueue(self, value: int | str) -> bool:
+        """add value at the back of the queue
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            bool: always True, the queue is unbounded
+        """
+        new_node: Node = Node(value)
+        if self.back_node is None:
+            self.front_node = new_node
+        else:
+            self.back_node.next_node = new_node
+        self.back_node = new_node
+        self.length += 1
+        return True
+
+    def dequeue(self) -> int | str | None:
+        """remove and return front value
+
+        Returns:
+            int | str | None: front value, None if the queue is empty
+        """
+        front_node: Node | None = self.front_node
+        if front_node is None:
+            return None
+        self.front_node = front_node.next_node
+        if self.front_node is None:
+            self.back_node = None
+        self.length -= 1
+        return front_node.value
+
+    def peek(self) -> int | str | None:
+        """get front value without removing it
+
+        Returns:
+            int | str | None: front value, None if the queue is empty
+        """
+        if self.front_node is None:
+            return None
+        return self.front_node.value
+
+    def enqueue_many(self, values: Iterable[int | str]) -> int:
+        """add values at the back in given order
+
+        Args:
+            values (Iterable[int | str]): values to add
+
+        Returns:
+            int: number of added values
+        """
+        count: int = 0
+        for value in values:
+            self.enqueue(value)
+            count += 1
+        return count
+
+    def dequeue_many(self, count: int) -> list[int | str]:
+        """remove up to count values from the front
+
+        Args:
+            count (int): number of values to remove
+
+        Returns:
+            list[int | str]: removed values, front value first
+        """
+        batch: list[int | str] = []
+        front_node: Node | None = self.front_node
+        while front_node is not None and len(batch) < count:
+            batch.append(front_node.value)
+            front_node = front_node.next_node
+        self.front_node = front_node
+        if front_node is None:
+            self.back_node = None
+        self.length -= len(batch)
+        return batch
+
+    push_many = enqueue_many
+    pop_many = dequeue_many
+
+    def is_empty(self) -> bool:
+        """check if the queue is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return self.front_node is None
+
+    def is_full(self) -> bool:
+        """check if the queue is full
+
+        Returns:
+            bool: always False, the queue is unbounded
+        """
+        return False
+
+    def __len__(self) -> int:
+        """get number of items in the queue
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+
+class ArrayDeque(CircularQueue):
+    """
+    ArrayDeque Class
+    """
+
+    def push_front(self, value: int | str) -> bool:
+        """add value at the front
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            bool: True if added, False if the deque is full
+        """
+        if self._size == self.capacity:
+            return False
+        self._front = (self._front - 1) % self.capacity
+        self._items[self._front] = value
+        self._size += 1
+        return True
+
+    def pop_back(self) -> int | str | None:
+        """remove and return back value
+
+        Returns:
+            int | str | None: back value, None if the deque is empty
+        """
+        if self._size == 0:
+            return None
+        self._size -= 1
+        back: int = (self._front + self._size) % self.capacity
+        value: int | str | None = self._items[back]
+        self._items[back] = None
+        return value
+
+    def peek_back(self) -> int | str | None:
+        """get back value without removing it
+
+        Returns:
+            int | str | None: back value, None if the deque is empty
+        """
+        if self._size == 0:
+            return None
+        return self._items[(self._front + self._size - 1) % self.capacity]
+
+    push_back = CircularQueue.enqueue
+    pop_front = CircularQueue.dequeue
+    peek_front = CircularQueue.peek
+
+    def push_many(self, values: Iterable[int | str], front: bool = False) -> int:
+        """add values one by one at the back, or at the front, while there is room
+
+        Pushing at the front adds every value before the previous one, so the last
+        value ends up first, same as collections.deque.extendleft.
+
+        Args:
+            values (Iterable[int | str]): values to add
+            front (bool, optional): add at the front. Defaults to False.
+
+        Returns:
+            int: number of added values
+        """
+        if not front:
+            return self.enqueue_many(values)
+        batch: list[int | str] = list(islice(values, self.capacity - self._size))
+        batch.reverse()
+        self._front = (self._front - len(batch)) % self.capacity
+        self._write(self._front, batch)
+        self._size += len(batch)
+        return len(batch)
+
+    def pop_many(self, count: int, front: bool = True) -> list[int | str]:
+        """remove up to count values from the front, or from the back
+
+        Args:
+            count (int): number of values to remove
+            front (bool, optional): remove from the front, as a queue does. Defaults to True.
+
+        Returns:
+            list[int | str]: removed values in the order they were popped
+        """
+        if front:
+            return self.dequeue_many(count)
+        count = max(0, min(count, self._size))
+        self._size -= count
+        batch: list[int | str] = self._take((self._front + self._size) % self.capacity, count)
+        batch.reverse()
+        return batch
+
+
+class LinkedDeque:
+    """
+    LinkedDeque Class
+    """
+
+    def __init__(self) -> None:
+        """create empty deque
+        """
+        self._nodes: DoublyLinkedList = DoublyLinkedList()
+
+    def push_front(self, value: int | str) -> bool:
+        """add value at the front
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            bool: always True, the deque is unbounded
+        """
+        self._nodes.add_new_head(value)
+        return True
+
+    def push_back(self, value: int | str) -> bool:
+        """add value at the back
+
+        Args:
+            value (int | str): value to add
+
+        Returns:
+            bool: always True, the deque is unbounded
+        """
+        self._nodes.append_node(value)
+        return True
+
+    def pop_front(self) -> int | str | None:
+        """remove and return front value
+
+        Returns:
+            int | str | None: front value, None if the deque is empty
+        """
+        node = self._nodes.pop_head()
+        return None if node is None else node.value
+
+    def pop_back(self) -> int | str | None:
+        """remove and return back value
+
+        Returns:
+            int | str | None: back value, None if the deque is empty
+        """
+        node = self._nodes.pop_tail()
+        return None if node is None else node.value
+
+    def peek_front(self) -> int | str | None:
+        """get front value without removing it
+
+        Returns:
+            int | str | None: front value, None if the deque is empty
+        """
+        node = self._nodes.get_head_node()
+        return None if node is None else node.value
+
+    def peek_back(self) -> int | str | None:
+        """get back value without removing it
+
+        Returns:
+            int | str | None: back value, None if the deque is empty
+        """
+        node = self._nodes.get_tail_node()
+        return None if node is None else node.value
+
+    enqueue = push_back
+    dequeue = pop_front
+    peek = peek_front
+
+    def push_many(self, values: Iterable[int | str], front: bool = False) -> int:
+        """add values one by one at the back, or at the front
+
+        Pushing at the front adds every value before the previous one, so the last
+        value ends up first, same as collections.deque.extendleft.
+
+        Args:
+            values (Iterable[int | str]): values to add
+            front (bool, optional): add at the front. Defaults to False.
+
+        Returns:
+            int: number of added values
+        """
+        if not front:
+            return self._nodes.extend(values)
+        count: int = 0
+        for value in values:
+            self._nodes.add_new_head(value)
+            count += 1
+        return count
+
+    def pop_many(self, count: int, front: bool = True) -> list[int | str]:
+        """remove up to count values from the front, or from the back
+
+        Args:
+            count (int): number of values to remove
+            front (bool, optional): remove from the front, as a queue does. Defaults to True.
+
+        Returns:
+            list[int | str]: removed values in the order they were popped
+        """
+        pop = self._nodes.pop_head if front else self._nodes.pop_tail
+        batch: list[int | str] = []
+        while len(batch) < count and self._nodes.head_node is not None:
+            batch.append(pop().value)
+        return batch
+
+    enqueue_many = push_many
+
+    def dequeue_many(self, count: int) -> list[int | str]:
+        """remove up to count values from the front
+
+        Args:
+            count (int): number of values to remove
+
+        Returns:
+            list[int | str]: removed values, front value first
+        """
+        return self.pop_many(count)
+
+    def is_empty(self) -> bool:
+        """check if the deque is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return self._nodes.head_node is None
+
+    def is_full(self) -> bool:
+        """check if the deque is full
+
+        Returns:
+            bool: always False, the deque is unbounded
+        """
+        return False
+
+    def __len__(self) -> int:
+        """get number of items in the deque
+
+        Returns:
+            int: item count
+        """
+        return len(self._nodes)
@@ -0,0 +1,155 @@
+"""
+CircularQueue, LinkedQueue, ArrayDeque and LinkedDeque class unit tests
+
+- __init__
+    - create empty queue
+    - raise ValueError for ring buffer capacity below 1
+
+- enqueue / dequeue / peek
+    - first enqueued value is dequeued first
+    - return None for dequeue / peek of an empty queue
+    - bounded queues refuse enqueue when full, linked queues are never full
+    - ring buffer reuses slots freed at the front, wrapping around
+
+- enqueue_many / dequeue_many (push_many / pop_many)
+    - move values in batches, front value first
+    - add only values which fit, leave the rest in the iterator
+
+- deque
+    - push, pop and peek at both ends
+    - push_many at the front adds values in reverse, as deque.extendleft
+    - pop_many from the back returns back value first
+
+"""
+
+import pytest
+
+from queues import ArrayDeque, CircularQueue, LinkedDeque, LinkedQueue
+
+QUEUES = [lambda: CircularQueue(4), LinkedQueue, lambda: ArrayDeque(4), LinkedDeque]
+DEQUES = [lambda: ArrayDeque(4), LinkedDeque]
+
+
+# __init__()
+
+@pytest.mark.parametrize("make_queue", QUEUES)
+def test_empty_queue(make_queue) -> None:
+    """create empty queue
+    """
+    queue = make_queue()
+    assert queue.is_empty() is True
+    assert len(queue) == 0
+
+def test_invalid_capacity() -> None:
+    """raise ValueError for ring buffer capacity below 1
+    """
+    with pytest.raises(ValueError):
+        CircularQueue(0)
+    with pytest.raises(ValueError):
+        ArrayDeque(-1)
+
+
+# enqueue() / dequeue() / peek()
+
+@pytest.mark.parametrize("make_queue", QUEUES)
+def test_fifo(make_queue) -> None:
+    """first enqueued value is dequeued first
+    """
+    queue = make_queue()
+    assert queue.enqueue(1) is True
+    queue.enqueue('a')
+    assert queue.peek() == 1
+    assert queue.dequeue() == 1
+    assert queue.dequeue() == 'a'
+    assert queue.is_empty() is True
+
+@pytest.mark.parametrize("make_queue", QUEUES)
+def test_dequeue_empty(make_queue) -> None:
+    """return None for dequeue / peek of an empty queue
+    """
+    queue = make_queue()
+    assert queue.dequeue() is None
+    assert queue.peek() is None
+
+def test_full() -> None:
+    """bounded queues refuse enqueue when full, linked queues are never full
+    """
+    queue: CircularQueue = CircularQueue(2)
+    queue.enqueue_many([1, 2])
+    assert queue.is_full() is True
+    assert queue.enqueue(3) is False
+    assert LinkedQueue().is_full() is False
+    assert LinkedDeque().is_full() is False
+
+def test_wrap_around() -> None:
+    """ring buffer reuses slots freed at the front, wrapping around
+    """
+    queue: CircularQueue = CircularQueue(3)
+    for value in range(10):
+        queue.enqueue(value)
+        if len(queue) == 3:
+            assert queue.dequeue() == value - 2
+    assert queue.dequeue_many(3) == [8, 9]
+    assert len(queue._items) == 3
+
+
+# enqueue_many() / dequeue_many()
+
+@pytest.mark.parametrize("make_queue", QUEUES)
+def test_batch(make_queue) -> None:
+    """move values in batches, front value first
+    """
+    queue = make_queue()
+    queue.enqueue(0)
+    queue.dequeue()
+    assert queue.enqueue_many([1, 2, 3]) == 3
+    assert queue.dequeue_many(2) == [1, 2]
+    assert queue.push_many([4]) == 1
+    assert queue.pop_many(5) == [3, 4]
+    assert queue.dequeue_many(1) == []
+
+def test_enqueue_many_full() -> None:
+    """add only values which fit, leave the rest in the iterator
+    """
+    queue: CircularQueue = CircularQueue(3)
+    queue.enqueue(0)
+    values = iter(range(1, 6))
+    assert queue.enqueue_many(values) == 2
+    assert next(values) == 3
+    assert queue.dequeue_many(3) == [0, 1, 2]
+
+
+# deque
+
+@pytest.mark.parametrize("make_deque", DEQUES)
+def test_both_ends(make_deque) -> None:
+    """push, pop and peek at both ends
+    """
+    deque = make_deque()
+    deque.push_back(2)
+    deque.push_front(1)
+    deque.push_back(3)
+    assert (deque.peek_front(), deque.peek_back()) == (1, 3)
+    assert deque.pop_back() == 3
+    assert deque.pop_front() == 1
+    assert deque.pop_back() == 2
+    assert deque.pop_back() is None
+    assert deque.peek_back() is None
+
+@pytest.mark.parametrize("make_deque", DEQUES)
+def test_push_many_front(make_deque) -> None:
+    """push_many at the front adds values in reverse, as deque.extendleft
+    """
+    deque = make_deque()
+    deque.push_back('x')
+    assert deque.push_many('abc', front=True) == 3
+    assert deque.pop_many(4) == ['c', 'b', 'a', 'x']
+
+@pytest.mark.parametrize("make_deque", DEQUES)
+def test_pop_many_back(make_deque) -> None:
+    """pop_many from the back returns back value first
+    """
+    deque = make_deque()
+    deque.push_many([1, 2, 3])
+    assert deque.pop_many(2, front=False) == [3, 2]
+    assert deque.pop_many(2, front=False) == [1]
@@ -0,0 +1,331 @@
+"""
+Serialization:
+    - Binary file format for the values of a linked list.
+    - Header: magic b"DSAL", format version, kind of records and number of values.
+    - Kind INT64: every value is an int which fits in 64 bits, values are stored as
+      fixed-width little endian int64, 8 bytes per value.
+    - Kind TAGGED: every value is a record starting with a one byte tag,
+        - TAG_INT64, an int64 value
+        - TAG_STR, uint32 byte length followed by utf-8 bytes
+        - TAG_BIG_INT, uint32 byte length followed by little endian signed bytes
+    - dump writes the values in chunks, the list is never copied into a python list.
+      Lists are read twice, to pick the record kind and then to write. One-shot
+      iterators such as generators are read once and written as tagged records,
+      the header is written last by seeking back to the start.
+    - iter_values memory-maps the file and yields values one by one, so only the
+      pages being read have to be in memory. load builds a LinkedList from them in O(n).
+
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import BinaryIO
+
+from linked_list import LinkedList
+
+MAGIC: bytes = b"DSAL"
+VERSION: int = 1
+
+KIND_INT64: int = 0
+KIND_TAGGED: int = 1
+
+TAG_INT64: int = 0
+TAG_STR: int = 1
+TAG_BIG_INT: int = 2
+
+INT64_MIN: int = -(1 << 63)
+INT64_MAX: int = (1 << 63) - 1
+
+# values written per chunk / bytes buffered before a write
+CHUNK_SIZE: int = 1 << 16
+
+HEADER = struct.Struct("<4sBBxxQ")
+INT64 = struct.Struct("<q")
+TAGGED_INT64 = struct.Struct("<Bq")
+TAGGED_LENGTH = struct.Struct("<BI")
+LENGTH = struct.Struct("<I")
+
+
+def _check_value(value: object) -> None:
+    """check that a value can be serialized
+
+    Args:
+        value (object): value to write
+
+    Raises:
+        TypeError: if value is not an int or str
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise TypeError(f"cannot serialize value of type {type(value).__name__}")
+
+
+def _scan(values: Iterable[int | str]) -> tuple[int, int]:
+    """find kind of records and number of values
+
+    Args:
+        values (Iterable[int | str]): values to write
+
+    Raises:
+        TypeError: if a value is not an int or str
+
+    Returns:
+        tuple[int, int]: kind and value count
+    """
+    kind: int = KIND_INT64
+    count: int = 0
+    for value in values:
+        _check_value(value)
+        if isinstance(value, str) or not INT64_MIN <= value <= INT64_MAX:
+            kind = KIND_TAGGED
+        count += 1
+    return kind, count
+
+
+def _write_int64(values: Iterable[int], file: BinaryIO) -> None:
+    """write values as fixed-width int64 in chunks
+
+    Args:
+        values (Iterable[int]): int64 values
+        file (BinaryIO): binary file open for writing
+    """
+    iterator: Iterator[int] = iter(values)
+    while True:
+        chunk: array = array("q", islice(iterator, CHUNK_SIZE))
+        if not chunk:
+            return
+        if sys.byteorder == "big":
+            chunk.byteswap()
+        file.write(chunk.tobytes())
+
+
+def _write_tagged(values: Iterable[int | str], file: BinaryIO) -> int:
+    """write values as tagged records, buffering CHUNK_SIZE bytes per write
+
+    Args:
+        values (Iterable[int | str]): int and str values
+        file (BinaryIO): binary file open for writing
+
+    Raises:
+        TypeError: if a value is not an int or str
+
+    Returns:
+        int: number of values written
+    """
+    buffer: bytearray = bytearray()
+    count: int = 0
+    for value in values:
+        if isinstance(value, str):
+            encoded: bytes = value.encode("utf-8")
+            buffer += TAGGED_LENGTH.pack(TAG_STR, len(encoded))
+            buffer += encoded
+        else:
+            _check_value(value)
+            if INT64_MIN <= value <= INT64_MAX:
+                buffer += TAGGED_INT64.pack(TAG_INT64, value)
+            else:
+                encoded = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+                buffer += TAGGED_LENGTH.pack(TAG_BIG_INT, len(encoded))
+                buffer += encoded
+        count += 1
+        if len(buffer) >= CHUNK_SIZE:
+            file.write(buffer)
+            buffer.clear()
+    file.write(buffer)
+    return count
+
+
+def dump(linked_list: Iterable[int | str], file: str | os.PathLike | BinaryIO) -> int:
+    """write values of a linked list to a file
+
+    Lists are read twice, once to pick the record kind and once to write them.
+    A one-shot iterator, e.g. a generator, is read once and written as tagged records,
+    its header is written after the records, so the file must be seekable.
+    If a value of a one-shot iterator cannot be serialized, the partly written file
+    has no valid header and load refuses it.
+
+    Args:
+        linked_list (Iterable[int | str]): list or iterator of values to write
+        file (str | os.PathLike | BinaryIO): path or binary file open for writing
+
+    Raises:
+        TypeError: if a value is not an int or str, or if a one-shot iterator
+        is written to a file which is not seekable
+
+    Returns:
+        int: number of values written
+    """
+    if iter(linked_list) is linked_list:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as opened_file:
+                return _dump_once(linked_list, opened_file)
+        if not file.seekable():
+            raise TypeError("cannot write a one-shot iterator to a file which is not seekable")
+        return _dump_once(linked_list, file)
+    kind, count = _scan(linked_list)
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as opened_file:
+            return _dump(linked_list, opened_file, kind, count)
+    return _dump(linked_list, file, kind, count)
+
+
+def _dump(values: Iterable[int | str], file: BinaryIO, kind: int, count: int) -> int:
+    """write header and records
+
+    Args:
+        values (Iterable[int | str]): values to write
+        file (BinaryIO): binary file open for writing
+        kind (int): KIND_INT64 or KIND_TAGGED
+        count (int): number of values
+
+    Returns:
+        int: number of values written
+    """
+    file.write(HEADER.pack(MAGIC, VERSION, kind, count))
+    if kind == KIND_INT64:
+        _write_int64(values, file)
+    else:
+        _write_tagged(values, file)
+    return count
+
+
+def _dump_once(values: Iterator[int | str], file: BinaryIO) -> int:
+    """write tagged records in one pass, then seek back and write the header
+
+    Until the header is written, its magic is zeroed, so an interrupted dump
+    does not leave a file which looks valid.
+
+    Args:
+        values (Iterator[int | str]): values to write
+        file (BinaryIO): seekable binary file open for writing
+
+    Raises:
+        TypeError: if a value is not an int or str
+
+    Returns:
+        int: number of values written
+    """
+    start: int = file.tell()
+    file.write(HEADER.pack(bytes(len(MAGIC)), VERSION, KIND_TAGGED, 0))
+    count: int = _write_tagged(values, file)
+    end: int = file.tell()
+    file.seek(start)
+    file.write(HEADER.pack(MAGIC, VERSION, KIND_TAGGED, count))
+    file.seek(end)
+    return count
+
+
+def _read_header(buffer: bytes | mmap.mmap) -> tuple[int, int]:
+    """check header of a serialized list
+
+    Args:
+        buffer (bytes | mmap.mmap): file contents
+
+    Raises:
+        ValueError: if the file is not a serialized list of a known version
+
+    Returns:
+        tuple[int, int]: kind and value count
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("file is too short for a serialized list")
+    magic, version, kind, count = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("file is not a serialized list")
+    if version != VERSION:
+        raise ValueError(f"unsupported serialized list version {version}")
+    if kind not in (KIND_INT64, KIND_TAGGED):
+        raise ValueError(f"unknown record kind {kind}")
+    if kind == KIND_INT64 and len(buffer) < HEADER.size + count * INT64.size:
+        raise ValueError("serialized list is truncated")
+    return kind, count
+
+
+def _iter_tagged(buffer: mmap.mmap, count: int) -> Iterator[int | str]:
+    """yield values of tagged records after the header
+
+    Args:
+        buffer (mmap.mmap): file contents
+        count (int): number of records
+
+    Raises:
+        ValueError: if a record is truncated or has an unknown tag
+
+    Yields:
+        int | str: next value
+    """
+    offset: int = HEADER.size
+    end: int = len(buffer)
+    try:
+        for _ in range(count):
+            tag: int = buffer[offset]
+            if tag == TAG_INT64:
+                yield TAGGED_INT64.unpack_from(buffer, offset)[1]
+                offset += TAGGED_INT64.size
+                continue
+            if tag not in (TAG_STR, TAG_BIG_INT):
+                raise ValueError(f"unknown record tag {tag}")
+            length: int = LENGTH.unpack_from(buffer, offset + 1)[0]
+            offset += TAGGED_LENGTH.size
+            if offset + length > end:
+                raise ValueError("serialized list is truncated")
+            data: bytes = buffer[offset:offset + length]
+            offset += length
+            if tag == TAG_STR:
+                yield data.decode("utf-8")
+            else:
+                yield int.from_bytes(data, "little", signed=True)
+    except (IndexError, struct.error) as error:
+        raise ValueError("serialized list is truncated") from error
+
+
+def iter_values(path: str | os.PathLike) -> Iterator[int | str]:
+    """memory-map a serialized list and yield its values lazily
+
+    The file stays mapped until the generator is exhausted or closed.
+
+    Args:
+        path (str | os.PathLike): path of the file
+
+    Raises:
+        ValueError: if the file is not a valid serialized list
+
+    Yields:
+        int | str: values in list order
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError("file is too short for a serialized list")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            kind, count = _read_header(buffer)
+            if kind == KIND_TAGGED:
+                yield from _iter_tagged(buffer, count)
+                return
+            end: int = HEADER.size + count * INT64.size
+            if sys.byteorder == "big":
+                for offset in range(HEADER.size, end, INT64.size):
+                    yield INT64.unpack_from(buffer, offset)[0]
+                return
+            with memoryview(buffer) as view, view[HEADER.size:end] as body, \
+                    body.cast("q") as values:
+                yield from values
+
+
+def load(path: str | os.PathLike) -> LinkedList:
+    """build a linked list from a serialized list in a single pass
+
+    Args:
+        path (str | os.PathLike): path of the file
+
+    Raises:
+        ValueError: if the file is not a valid serialized list
+
+    Returns:
+        LinkedList: new list holding the values of the file
+    """
+    return LinkedList.from_iterable(iter_values(path))
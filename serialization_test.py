@@ -0,0 +1,145 @@
+"""
+serialization module unit tests
+
+- dump
+    - write header and fixed-width int64 records for int lists
+    - write tagged records for str and big int values
+    - write to an open binary file
+    - return number of written values
+    - raise TypeError for values which are not int or str
+    - read a generator once, write it as tagged records with the count patched in
+
+- load / iter_values
+    - load same values as dumped, empty list included
+    - yield values lazily without building a list
+    - raise ValueError for invalid or truncated files
+
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from linked_list import LinkedList
+from array_linked_list import ArrayLinkedList
+from serialization import (HEADER, KIND_INT64, KIND_TAGGED, MAGIC, VERSION,
+                           dump, iter_values, load)
+
+
+# dump()
+
+def test_dump_int64(tmp_path: Path) -> None:
+    """write header and fixed-width int64 records for int lists
+    """
+    path: Path = tmp_path / "ints.bin"
+    dump(LinkedList.from_iterable([1, -2, 2 ** 63 - 1]), path)
+    data: bytes = path.read_bytes()
+    assert HEADER.unpack_from(data) == (MAGIC, VERSION, KIND_INT64, 3)
+    assert len(data) == HEADER.size + 3 * 8
+
+def test_dump_tagged(tmp_path: Path) -> None:
+    """write tagged records for str and big int values
+    """
+    path: Path = tmp_path / "mixed.bin"
+    dump(LinkedList.from_iterable([1, 'a']), path)
+    assert HEADER.unpack_from(path.read_bytes())[2] == KIND_TAGGED
+    dump(LinkedList.from_iterable([1, 2 ** 63]), path)
+    assert HEADER.unpack_from(path.read_bytes())[2] == KIND_TAGGED
+
+def test_dump_file_object() -> None:
+    """write to an open binary file
+    """
+    file: io.BytesIO = io.BytesIO()
+    dump(LinkedList.from_iterable(['x']), file)
+    assert file.getvalue().startswith(MAGIC)
+
+def test_dump_count(tmp_path: Path) -> None:
+    """return number of written values
+    """
+    assert dump(ArrayLinkedList.from_iterable(range(5)), tmp_path / "a.bin") == 5
+    assert dump(LinkedList(), tmp_path / "b.bin") == 0
+
+def test_dump_invalid_value(tmp_path: Path) -> None:
+    """raise TypeError for values which are not int or str
+    """
+    with pytest.raises(TypeError):
+        dump([1, 2.5], tmp_path / "c.bin")
+    with pytest.raises(TypeError):
+        dump([True], tmp_path / "c.bin")
+
+def test_dump_generator(tmp_path: Path) -> None:
+    """read a generator once, write it as tagged records with the count patched in
+    """
+    path: Path = tmp_path / "generator.bin"
+    assert dump((value for value in [1, 2, 3]), path) == 3
+    assert HEADER.unpack_from(path.read_bytes()) == (MAGIC, VERSION, KIND_TAGGED, 3)
+    assert load(path).as_list() == [1, 2, 3]
+    assert dump(iter(['a', 2 ** 70, -1]), path) == 3
+    assert list(iter_values(path)) == ['a', 2 ** 70, -1]
+    assert dump(iter([]), path) == 0
+    assert load(path).as_list() == []
+    file: io.BytesIO = io.BytesIO(b"prefix")
+    file.seek(6)
+    assert dump((value for value in ['x', 'y']), file) == 2
+    assert file.getvalue()[6:].startswith(MAGIC)
+    with pytest.raises(TypeError):
+        dump((value for value in [1, 2.5]), path)
+    with pytest.raises(ValueError):
+        load(path)
+
+    class Pipe(io.BytesIO):
+        """binary file which cannot seek"""
+
+        def seekable(self) -> bool:
+            return False
+
+    with pytest.raises(TypeError):
+        dump(iter([1]), Pipe())
+
+
+# load() / iter_values()
+
+@pytest.mark.parametrize("values", [
+    [],
+    list(range(-5, 200_000)),
+    [-(2 ** 63), 2 ** 63 - 1, 0],
+    ['', 'abc', 'ünïcødé', 42, -(2 ** 63)],
+    [2 ** 100, -(2 ** 100), 2 ** 63, -(2 ** 63) - 1, -128, 'z' * 70_000],
+])
+def test_round_trip(tmp_path: Path, values: list) -> None:
+    """load same values as dumped, empty list included
+    """
+    path: Path = tmp_path / "list.bin"
+    dump(LinkedList.from_iterable(values), path)
+    loaded: LinkedList = load(path)
+    assert loaded.as_list() == values
+    assert loaded.get_length() == len(values)
+    assert list(iter_values(path)) == values
+
+def test_iter_values_lazy(tmp_path: Path) -> None:
+    """yield values lazily without building a list
+    """
+    path: Path = tmp_path / "list.bin"
+    dump(LinkedList.from_iterable(range(10)), path)
+    values = iter_values(path)
+    assert next(values) == 0
+    assert next(values) == 1
+    values.close()
+
+def test_invalid_file(tmp_path: Path) -> None:
+    """raise ValueError for invalid or truncated files
+    """
+    path: Path = tmp_path / "list.bin"
+    for data in (b"", b"DSAL", b"NOPE" + bytes(12)):
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            load(path)
+    dump(LinkedList.from_iterable(range(3)), path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        load(path)
+    dump(LinkedList.from_iterable(['abc', 'def']), path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        load(path)
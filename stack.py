@@ -0,0 +1,243 @@
+"""
+Stack:
+    - First in last out, items are pushed on and popped from the top.
+    - ArrayStack is bounded, its slots are allocated once when it is created and
+      never reallocated, push on a full stack is refused.
+    - LinkedStack grows without bound, the top item is the head node of a chain of nodes.
+    - push, pop, peek, is_empty and is_full take O(1).
+    - push_many / pop_many move a batch of items, ArrayStack copies them with slice assignment.
+    - Like the linked lists, a refused push returns False and pop / peek of an
+      empty stack return None instead of raising.
+
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import islice
+
+from node import Node
+
+
+class ArrayStack:
+    """
+    ArrayStack Class
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """create empty stack with room for capacity items
+
+        Args:
+            capacity (int): largest number of items
+
+        Raises:
+            ValueError: if capacity is below 1
+        """
+        if capacity < 1:
+            raise ValueError("stack capacity must be at least 1")
+        self.capacity: int = capacity
+        self._items: list[int | str | None] = [None] * capacity
+        self._size: int = 0
+
+    def push(self, value: int | str) -> bool:
+        """put value on top of the stack
+
+        Args:
+            value (int | str): value to push
+
+        Returns:
+            bool: True if pushed, False if the stack is full
+        """
+        if self._size == self.capacity:
+            return False
+        self._items[self._size] = value
+        self._size += 1
+        return True
+
+    def pop(self) -> int | str | None:
+        """remove and return top value
+
+        Returns:
+            int | str | None: top value, None if the stack is empty
+        """
+        if self._size == 0:
+            return None
+        self._size -= 1
+        value: int | str | None = self._items[self._size]
+        self._items[self._size] = None
+        return value
+
+    def peek(self) -> int | str | None:
+        """get top value without removing it
+
+        Returns:
+            int | str | None: top value, None if the stack is empty
+        """
+        if self._size == 0:
+            return None
+        return self._items[self._size - 1]
+
+    def push_many(self, values: Iterable[int | str]) -> int:
+        """push values in given order while there is room, last value ends up on top
+
+        Values which do not fit are not consumed from an iterator.
+
+        Args:
+            values (Iterable[int | str]): values to push
+
+        Returns:
+            int: number of pushed values
+        """
+        size: int = self._size
+        batch: list[int | str] = list(islice(values, self.capacity - size))
+        self._items[size:size + len(batch)] = batch
+        self._size = size + len(batch)
+        return len(batch)
+
+    def pop_many(self, count: int) -> list[int | str]:
+        """pop up to count values
+
+        Args:
+            count (int): number of values to pop
+
+        Returns:
+            list[int | str]: popped values, top value first
+        """
+        count = max(0, min(count, self._size))
+        start: int = self._size - count
+        batch: list[int | str] = self._items[start:self._size]
+        batch.reverse()
+        self._items[start:self._size] = [None] * count
+        self._size = start
+        return batch
+
+    def is_empty(self) -> bool:
+        """check if the stack is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """check if the stack is full
+
+        Returns:
+            bool: True if no more items can be pushed
+        """
+        return self._size == self.capacity
+
+    def __len__(self) -> int:
+        """get number of items in the stack
+
+        Returns:
+            int: item count
+        """
+        return self._size
+
+
+class LinkedStack:
+    """
+    LinkedStack Class
+    """
+
+    def __init__(self) -> None:
+        """create empty stack
+        """
+        self.top_node: Node | None = None
+        self.length: int = 0
+
+    def push(self, value: int | str) -> bool:
+        """put value on top of the stack
+
+        Args:
+            value (int | str): value to push
+
+        Returns:
+            bool: always True, the stack is unbounded
+        """
+        self.top_node = Node(value, self.top_node)
+        self.length += 1
+        return True
+
+    def pop(self) -> int | str | None:
+        """remove and return top value
+
+        Returns:
+            int | str | None: top value, None if the stack is empty
+        """
+        top_node: Node | None = self.top_node
+        if top_node is None:
+            return None
+        self.top_node = top_node.next_node
+        self.length -= 1
+        return top_node.value
+
+    def peek(self) -> int | str | None:
+        """get top value without removing it
+
+        Returns:
+            int | str | None: top value, None if the stack is empty
+        """
+        if self.top_node is None:
+            return None
+        return self.top_node.value
+
+    def push_many(self, values: Iterable[int | str]) -> int:
+        """push values in given order, last value ends up on top
+
+        Args:
+            values (Iterable[int | str]): values to push
+
+        Returns:
+            int: number of pushed values
+        """
+        top_node: Node | None = self.top_node
+        count: int = 0
+        for value in values:
+            top_node = Node(value, top_node)
+            count += 1
+        self.top_node = top_node
+        self.length += count
+        return count
+
+    def pop_many(self, count: int) -> list[int | str]:
+        """pop up to count values
+
+        Args:
+            count (int): number of values to pop
+
+        Returns:
+            list[int | str]: popped values, top value first
+        """
+        batch: list[int | str] = []
+        top_node: Node | None = self.top_node
+        while top_node is not None and len(batch) < count:
+            batch.append(top_node.value)
+            top_node = top_node.next_node
+        self.top_node = top_node
+        self.length -= len(batch)
+        return batch
+
+    def is_empty(self) -> bool:
+        """check if the stack is empty
+
+        Returns:
+            bool: True if there are no items
+        """
+        return self.top_node is None
+
+    def is_full(self) -> bool:
+        """check if the stack is full
+
+        Returns:
+            bool: always False, the stack is unbounded
+        """
+        return False
+
+    def __len__(self) -> int:
+        """get number of items in the stack
+
+        Returns:
+            int: item count
+        """
+        return self.length
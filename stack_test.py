@@ -0,0 +1,118 @@
+"""
+ArrayStack and LinkedStack class unit tests
+
+- __init__
+    - create empty stack
+    - raise ValueError for ArrayStack capacity below 1
+
+- push / pop / peek
+    - last pushed value is popped first
+    - return None for pop / peek of an empty stack
+
+- is_empty / is_full
+    - ArrayStack refuses push when full, LinkedStack is never full
+
+- push_many / pop_many
+    - push values in given order, pop them top value first
+    - push only values which fit, leave the rest in the iterator
+    - pop at most the number of items
+
+"""
+
+import pytest
+
+from stack import ArrayStack, LinkedStack
+
+STACKS = [lambda: ArrayStack(4), LinkedStack]
+
+
+# __init__()
+
+@pytest.mark.parametrize("make_stack", STACKS)
+def test_empty_stack(make_stack) -> None:
+    """create empty stack
+    """
+    stack = make_stack()
+    assert stack.is_empty() is True
+    assert len(stack) == 0
+
+def test_invalid_capacity() -> None:
+    """raise ValueError for ArrayStack capacity below 1
+    """
+    with pytest.raises(ValueError):
+        ArrayStack(0)
+
+
+# push() / pop() / peek()
+
+@pytest.mark.parametrize("make_stack", STACKS)
+def test_push_pop(make_stack) -> None:
+    """last pushed value is popped first
+    """
+    stack = make_stack()
+    assert stack.push(1) is True
+    stack.push('a')
+    assert stack.peek() == 'a'
+    assert stack.pop() == 'a'
+    assert stack.pop() == 1
+    assert stack.is_empty() is True
+
+@pytest.mark.parametrize("make_stack", STACKS)
+def test_pop_empty(make_stack) -> None:
+    """return None for pop / peek of an empty stack
+    """
+    stack = make_stack()
+    assert stack.pop() is None
+    assert stack.peek() is None
+
+
+# is_empty() / is_full()
+
+def test_full() -> None:
+    """ArrayStack refuses push when full, LinkedStack is never full
+    """
+    stack: ArrayStack = ArrayStack(2)
+    stack.push(1)
+    stack.push(2)
+    assert stack.is_full() is True
+    assert stack.push(3) is False
+    assert stack.pop() == 2
+    assert stack.is_full() is False
+    linked_stack: LinkedStack = LinkedStack()
+    linked_stack.push_many(range(1000))
+    assert linked_stack.is_full() is False
+
+
+# push_many() / pop_many()
+
+@pytest.mark.parametrize("make_stack", STACKS)
+def test_batch(make_stack) -> None:
+    """push values in given order, pop them top value first
+    """
+    stack = make_stack()
+    assert stack.push_many([1, 2, 3]) == 3
+    assert stack.peek() == 3
+    assert stack.pop_many(2) == [3, 2]
+    assert len(stack) == 1
+
+def test_push_many_full() -> None:
+    """push only values which fit, leave the rest in the iterator
+    """
+    stack: ArrayStack = ArrayStack(3)
+    stack.push(0)
+    values = iter(range(1, 6))
+    assert stack.push_many(values) == 2
+    assert next(values) == 3
+    assert stack.pop_many(5) == [2, 1, 0]
+
+@pytest.mark.parametrize("make_stack", STACKS)
+def test_pop_many_limit(make_stack) -> None:
+    """pop at most the number of items
+    """
+    stack = make_stack()
+    stack.push_many('ab')
+    assert stack.pop_many(0) == []
+    assert stack.pop_many(-1) == []
+    assert stack.pop_many(5) == ['b', 'a']
+    assert stack.pop_many(1) == []
+    assert stack.is_empty() is True
@@ -0,0 +1,775 @@
+"""
+Unrolled Linked List:
+    - Linked list whose nodes are blocks holding up to capacity values each.
+    - A traversal follows one link per block instead of one link per value, and the
+      values of a block sit next to each other in a python list.
+    - Searching a block is done by the list itself, in C.
+    - A full block is split in two halves when a value is inserted into it.
+    - A block which drops below half of its capacity takes values from the next block,
+      or is merged with it when both fit in one block.
+    - Has the same public methods as LinkedList. Methods which return a Node return
+      a detached copy holding the value, values are not stored in nodes.
+    - Bulk removals filter every block once and then merge neighbouring blocks which
+      fit in one. sort and apply_permutation repack the values into full blocks.
+    - Blocks are searched in C, so no value index is built, the index methods of
+      LinkedList only keep a flag.
+
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from operator import itemgetter
+
+from node import Node
+
+DEFAULT_CAPACITY: int = 64
+
+
+class Block:
+    """Block of values with a link to the next block
+    """
+
+    __slots__ = ("values", "next_block")
+
+    def __init__(self, values: list[int | str], next_block: Block | None = None) -> None:
+        """creates a block holding given values
+
+        Args:
+            values (list[int | str]): values of the block, the list is used as is
+            next_block (Block | None, optional): next block. Defaults to None.
+        """
+        self.values: list[int | str] = values
+        self.next_block: Block | None = next_block
+
+
+class UnrolledLinkedList:
+    """
+    UnrolledLinkedList Class
+    """
+
+    def __init__(self, head_node_value: int | str | None = None,
+                 capacity: int = DEFAULT_CAPACITY, indexed: bool = False) -> None:
+        """create unrolled linked list with given value as head node
+
+        Args:
+            head_node_value (int | str | None, optional): value for head node of the list.
+            Defaults to None.
+            capacity (int, optional): largest number of values in a block. Defaults to 64.
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+        """
+        if capacity < 2:
+            raise ValueError("block capacity must be at least 2")
+        self.capacity: int = capacity
+        self._head_block: Block | None = None
+        self._tail_block: Block | None = None
+        self.length: int = 0
+        self._indexed: bool = indexed
+        if head_node_value is not None:
+            self.append_node(head_node_value)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int | str], capacity: int = DEFAULT_CAPACITY,
+                      indexed: bool = False) -> UnrolledLinkedList:
+        """create unrolled linked list from given values in a single pass
+
+        Args:
+            values (Iterable[int | str]): values in list order. Generators are consumed lazily
+            capacity (int, optional): largest number of values in a block. Defaults to 64.
+            indexed (bool, optional): keep value index, see enable_index. Defaults to False.
+
+        Returns:
+            UnrolledLinkedList: new list holding given values
+        """
+        linked_list: UnrolledLinkedList = cls(capacity=capacity, indexed=indexed)
+        linked_list.extend(values)
+        return linked_list
+
+    def enable_index(self) -> None:
+        """start keeping the value index
+
+        Values are searched block by block in C, so there is no index to build,
+        only the flag is kept for code written against LinkedList.
+        """
+        self._indexed = True
+
+    def disable_index(self) -> None:
+        """stop keeping the value index
+        """
+        self._indexed = False
+
+    def is_indexed(self) -> bool:
+        """check if value index is kept
+
+        Returns:
+            bool: True if value index is kept else False
+        """
+        return self._indexed
+
+    def _build_blocks(self, values: Iterable[int | str]) -> tuple[Block | None, Block | None, int]:
+        """pack given values into a detached chain of full blocks
+
+        Args:
+            values (Iterable[int | str]): values in chain order
+
+        Returns:
+            tuple[Block | None, Block | None, int]: first block, last block and value count
+        """
+        iterator: Iterator[int | str] = iter(values)
+        first_block: Block | None = None
+        last_block: Block | None = None
+        count: int = 0
+        while True:
+            chunk: list[int | str] = list(islice(iterator, self.capacity))
+            if not chunk:
+                return first_block, last_block, count
+            block: Block = Block(chunk)
+            if last_block is None:
+                first_block = block
+            else:
+                last_block.next_block = block
+            last_block = block
+            count += len(chunk)
+
+    def _iter_blocks(self) -> Iterator[tuple[Block | None, Block]]:
+        """yield every block with the block before it
+
+        Yields:
+            tuple[Block | None, Block]: previous block, None for head block, and block
+        """
+        previous_block: Block | None = None
+        block: Block | None = self._head_block
+        while block is not None:
+            yield previous_block, block
+            previous_block = block
+            block = block.next_block
+
+    def _locate(self, index: int) -> tuple[Block | None, Block | None, int]:
+        """find block holding value at index
+
+        Args:
+            index (int): index of the value. Negative index also works
+
+        Returns:
+            tuple[Block | None, Block | None, int]: previous block, block and offset in
+            block. Block is None if index is out of range
+        """
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            return None, None, 0
+        for previous_block, block in self._iter_blocks():
+            if index < len(block.values):
+                return previous_block, block, index
+            index -= len(block.values)
+        return None, None, 0
+
+    def _split(self, block: Block) -> None:
+        """move second half of a block into a new block after it
+
+        Args:
+            block (Block): block to split
+        """
+        middle: int = len(block.values) // 2
+        new_block: Block = Block(block.values[middle:], block.next_block)
+        del block.values[middle:]
+        block.next_block = new_block
+        if block is self._tail_block:
+            self._tail_block = new_block
+
+    def _rebalance(self, previous_block: Block | None, block: Block) -> None:
+        """fix a block which lost a value
+
+        Args:
+            previous_block (Block | None): block before block, None for head block
+            block (Block): block which lost a value
+        """
+        if not block.values:
+            if previous_block is None:
+                self._head_block = block.next_block
+            else:
+                previous_block.next_block = block.next_block
+            if block is self._tail_block:
+                self._tail_block = previous_block
+            return
+        next_block: Block | None = block.next_block
+        if next_block is None or len(block.values) >= self.capacity // 2:
+            return
+        if len(block.values) + len(next_block.values) <= self.capacity:
+            block.values.extend(next_block.values)
+            block.next_block = next_block.next_block
+            if next_block is self._tail_block:
+                self._tail_block = block
+        else:
+            moved: int = (len(next_block.values) - len(block.values)) // 2
+            block.values.extend(next_block.values[:moved])
+            del next_block.values[:moved]
+
+    def _compact(self) -> None:
+        """drop empty blocks and merge neighbouring blocks which fit in one block
+
+        Afterwards every two neighbouring blocks hold more than capacity values together,
+        so blocks are more than half full on average.
+        """
+        previous_block: Block | None = None
+        block: Block | None = self._head_block
+        while block is not None:
+            next_block: Block | None = block.next_block
+            if not block.values:
+                if previous_block is None:
+                    self._head_block = next_block
+                else:
+                    previous_block.next_block = next_block
+                block = next_block
+                continue
+            if next_block is not None and \
+                    len(block.values) + len(next_block.values) <= self.capacity:
+                block.values.extend(next_block.values)
+                block.next_block = next_block.next_block
+                continue
+            previous_block = block
+            block = next_block
+        self._tail_block = previous_block
+
+    def _replace_values(self, values: Iterable[int | str]) -> None:
+        """replace every value of the list, packed into full blocks
+
+        Args:
+            values (Iterable[int | str]): new values in list order
+        """
+        first_block, last_block, count = self._build_blocks(values)
+        self._head_block = first_block
+        self._tail_block = last_block
+        self.length = count
+
+    def extend(self, values: Iterable[int | str]) -> int:
+        """append given values at the end of the list, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to append
+
+        Returns:
+            int: number of appended nodes
+        """
+        iterator: Iterator[int | str] = iter(values)
+        count: int = 0
+        tail_block: Block | None = self._tail_block
+        if tail_block is not None and len(tail_block.values) < self.capacity:
+            room: int = self.capacity - len(tail_block.values)
+            before: int = len(tail_block.values)
+            tail_block.values.extend(islice(iterator, room))
+            count = len(tail_block.values) - before
+        first_block, last_block, added = self._build_blocks(iterator)
+        if first_block is not None:
+            if tail_block is None:
+                self._head_block = first_block
+            else:
+                tail_block.next_block = first_block
+            self._tail_block = last_block
+        count += added
+        self.length += count
+        return count
+
+    def extend_left(self, values: Iterable[int | str]) -> int:
+        """add given values before the head node, keeping their order
+
+        Args:
+            values (Iterable[int | str]): values to add. First value becomes new head node
+
+        Returns:
+            int: number of added nodes
+        """
+        first_block, last_block, count = self._build_blocks(values)
+        if first_block is None:
+            return 0
+        last_block.next_block = self._head_block
+        if self._head_block is None:
+            self._tail_block = last_block
+        self._head_block = first_block
+        self.length += count
+        return count
+
+    def get_head_node(self) -> Node | None:
+        """get head node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        if self._head_block is None:
+            return None
+        return Node(self._head_block.values[0])
+
+    def get_tail_node(self) -> Node | None:
+        """get tail node of linked list
+
+        Returns:
+            Node | None: returns node if present else None
+        """
+        if self._tail_block is None:
+            return None
+        return Node(self._tail_block.values[-1])
+
+    def add_new_head(self, head_node_value: int | str) -> Node:
+        """adds new head node to the list
+
+        Args:
+            head_node_value (int | str): value of new head node
+
+        Returns:
+            Node: new head node
+        """
+        head_block: Block | None = self._head_block
+        if head_block is None or len(head_block.values) >= self.capacity:
+            self._head_block = Block([head_node_value], head_block)
+            if head_block is None:
+                self._tail_block = self._head_block
+        else:
+            head_block.values.insert(0, head_node_value)
+        self.length += 1
+        return Node(head_node_value)
+
+    def append_node(self, new_node_value: int | str) -> Node:
+        """append node with given value at the end of the list
+
+        Args:
+            new_node_value (int | str): value of new node
+
+        Returns:
+            Node: newly appended node
+        """
+        tail_block: Block | None = self._tail_block
+        if tail_block is None:
+            self._head_block = self._tail_block = Block([new_node_value])
+        elif len(tail_block.values) >= self.capacity:
+            tail_block.next_block = self._tail_block = Block([new_node_value])
+        else:
+            tail_block.values.append(new_node_value)
+        self.length += 1
+        return Node(new_node_value)
+
+    def insert_at_index(self, index: int, value: int | str) -> Node | None:
+        """insert node with given value so that it ends up at index
+
+        Args:
+            index (int): index of the new node, from 0 to length. Negative index also works
+            value (int | str): value of new node
+
+        Returns:
+            Node | None: new node, None if index out of range
+        """
+        if index < 0:
+            index += self.length
+        if index < 0 or index > self.length:
+            return None
+        if index == self.length:
+            return self.append_node(value)
+        _, block, offset = self._locate(index)
+        if block is None:
+            return None
+        if len(block.values) >= self.capacity:
+            self._split(block)
+            if offset > len(block.values):
+                offset -= len(block.values)
+                block = block.next_block
+        block.values.insert(offset, value)
+        self.length += 1
+        return Node(value)
+
+    def remove_at_index(self, index: int) -> Node | None:
+        """remove node at index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            Node | None: removed node, None if index out of range
+        """
+        previous_block, block, offset = self._locate(index)
+        if block is None:
+            return None
+        removed_node: Node = Node(block.values.pop(offset))
+        self.length -= 1
+        self._rebalance(previous_block, block)
+        return removed_node
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """yield detached nodes of the list from head to tail
+
+        Yields:
+            Node: node holding the next value
+        """
+        for value in self:
+            yield Node(value)
+
+    def __iter__(self) -> Iterator[int | str]:
+        """yield values of the list from head to tail
+
+        Yields:
+            int | str: value of next node
+        """
+        block: Block | None = self._head_block
+        while block is not None:
+            yield from block.values
+            block = block.next_block
+
+    def __len__(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def __contains__(self, value: object) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (object): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        block: Block | None = self._head_block
+        while block is not None:
+            if value in block.values:
+                return True
+            block = block.next_block
+        return False
+
+    def __getitem__(self, index: int | slice) -> int | str | UnrolledLinkedList:
+        """get value at index, or a new linked list for a slice
+
+        Args:
+            index (int | slice): index of the node or slice of the list. Negative index also works
+
+        Raises:
+            TypeError: if index is not an int or slice
+            IndexError: if index is out of range
+
+        Returns:
+            int | str | UnrolledLinkedList: value at index or new list with sliced values
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step > 0:
+                return type(self).from_iterable(islice(self, start, stop, step), self.capacity)
+            indexes: range = range(start, stop, step)
+            if not indexes:
+                return type(self)(capacity=self.capacity)
+            first: int = indexes[-1]
+            window: list[int | str] = list(islice(self, first, indexes[0] + 1))
+            return type(self).from_iterable((window[i - first] for i in indexes), self.capacity)
+        if not isinstance(index, int):
+            raise TypeError("linked list indices must be integers or slices")
+        _, block, offset = self._locate(index)
+        if block is None:
+            raise IndexError("linked list index out of range")
+        return block.values[offset]
+
+    def as_list(self) -> list[str | int]:
+        """return linked list in form of list
+
+        Returns:
+            list[str | int]: list of str of list of int. Depending on dtype of value
+        """
+        item_list: list[str | int] = []
+        block: Block | None = self._head_block
+        while block is not None:
+            item_list.extend(block.values)
+            block = block.next_block
+        return item_list
+
+    def remove_node(self, value: str | int) -> Node | None:
+        """remove first node with given value from the list
+
+        Args:
+            value (str | int): value to remove
+
+        Returns:
+            Node | None: returns removed node or None if not found
+        """
+        for previous_block, block in self._iter_blocks():
+            if value in block.values:
+                removed_node: Node = Node(block.values.pop(block.values.index(value)))
+                self.length -= 1
+                self._rebalance(previous_block, block)
+                return removed_node
+        return None
+
+    def get_length(self) -> int:
+        """get number of items in the list
+
+        Returns:
+            int: item count
+        """
+        return self.length
+
+    def node_present(self, value: int | str) -> bool:
+        """check if node with given value is present in the list
+
+        Args:
+            value (int | str): value of node to find
+
+        Returns:
+            bool: True if node is present else False
+        """
+        return value in self
+
+    def access_node_by_index(self, index: int) -> Node | None:
+        """get node from list by index
+
+        Args:
+            index (int): index of the node. Negative index also works
+
+        Returns:
+            Node | None: return node if found else None
+        """
+        _, block, offset = self._locate(index)
+        if block is None:
+            return None
+        return Node(block.values[offset])
+
+    def update_at_index(self, index: int, new_value: int | str) -> Node | None:
+        """update value at index in place
+
+        Args:
+            index (int): index of the node. Negative index also works
+            new_value (int | str): new value of the node
+
+        Returns:
+            Node | None: return updated node if found else None
+        """
+        _, block, offset = self._locate(index)
+        if block is None:
+            return None
+        block.values[offset] = new_value
+        return Node(new_value)
+
+    def swap_nodes(self, value_1: str | int, value_2: str | int) -> bool:
+        """swap first nodes with given values, values are swapped in their blocks
+
+        Args:
+            value_1 (str | int): value of node 1
+            value_2 (str | int): value of node 2
+
+        Returns:
+            bool: returns True on successful swap else False
+        """
+        if value_1 == value_2:
+            return False
+        found_1: tuple[Block, int] | None = None
+        found_2: tuple[Block, int] | None = None
+        block: Block | None = self._head_block
+        while block is not None and (found_1 is None or found_2 is None):
+            if found_1 is None and value_1 in block.values:
+                found_1 = (block, block.values.index(value_1))
+            if found_2 is None and value_2 in block.values:
+                found_2 = (block, block.values.index(value_2))
+            block = block.next_block
+        if found_1 is None or found_2 is None:
+            return False
+        block_1, offset_1 = found_1
+        block_2, offset_2 = found_2
+        block_1.values[offset_1], block_2.values[offset_2] = (
+            block_2.values[offset_2], block_1.values[offset_1]
+        )
+        return True
+
+    def remove_all(self, values: Iterable[int | str]) -> int:
+        """remove every node whose value is one of the given values, in one pass
+
+        Args:
+            values (Iterable[int | str]): values to remove
+
+        Returns:
+            int: number of removed nodes
+        """
+        targets: set[int | str] = set(values)
+        if not targets:
+            return 0
+        return self._remove_where(targets.__contains__)
+
+    def remove_if(self, predicate: Callable[[int | str], bool]) -> int:
+        """remove every node whose value matches predicate, in one pass
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with value of every node
+
+        Returns:
+            int: number of removed nodes
+        """
+        return self._remove_where(predicate)
+
+    def remove_duplicates(self) -> int:
+        """remove every node whose value already appeared before it, in one pass
+
+        Returns:
+            int: number of removed nodes
+        """
+        seen: set[int | str] = set()
+
+        def is_duplicate(value: int | str) -> bool:
+            if value in seen:
+                return True
+            seen.add(value)
+            return False
+
+        return self._remove_where(is_duplicate)
+
+    def _remove_where(self, predicate: Callable[[int | str], bool]) -> int:
+        """rebuild every block without the values matching predicate, then compact blocks
+
+        If predicate raises, values checked before are still removed and the
+        rest are kept, same as LinkedList.
+
+        Args:
+            predicate (Callable[[int | str], bool]): called with every value
+
+        Returns:
+            int: number of removed values
+        """
+        removed: int = 0
+        block: Block | None = self._head_block
+        try:
+            while block is not None:
+                values: list[int | str] = block.values
+                kept: list[int | str] = []
+                position: int = 0
+                try:
+                    for value in values:
+                        if not predicate(value):
+                            kept.append(value)
+                        position += 1
+                finally:
+                    kept.extend(values[position:])
+                    removed += len(values) - len(kept)
+                    block.values = kept
+                block = block.next_block
+        finally:
+            if removed:
+                self.length -= removed
+                self._compact()
+        return removed
+
+    def update_many(self, updates: Mapping[int, int | str] | Iterable[tuple[int, int | str]]) -> int:
+        """update values of many nodes in place with a single traversal of the blocks
+
+        Out of range indexes are skipped, for repeated indexes the last value wins.
+
+        Args:
+            updates (Mapping[int, int | str] | Iterable[tuple[int, int | str]]): index to new
+            value mapping or (index, new value) pairs. Negative index also works
+
+        Returns:
+            int: number of applied updates
+        """
+        pairs: Iterable[tuple[int, int | str]] = (
+            updates.items() if isinstance(updates, Mapping) else updates
+        )
+        length: int = self.length
+        targets: list[tuple[int, int | str]] = []
+        for index, new_value in pairs:
+            if index < 0:
+                index += length
+            if 0 <= index < length:
+                targets.append((index, new_value))
+        if not targets:
+            return 0
+        # stable sort keeps repeated indexes in given order
+        targets.sort(key=itemgetter(0))
+        block: Block = self._head_block
+        block_start: int = 0
+        for index, new_value in targets:
+            while index >= block_start + len(block.values):
+                block_start += len(block.values)
+                block = block.next_block
+            block.values[index - block_start] = new_value
+        return len(targets)
+
+    def move_to_front(self, value: str | int) -> bool:
+        """move first node with given value to the head of the list
+
+        Args:
+            value (str | int): value of node to move
+
+        Returns:
+            bool: True if node was found else False
+        """
+        for previous_block, block in self._iter_blocks():
+            if value in block.values:
+                offset: int = block.values.index(value)
+                if previous_block is None and offset == 0:
+                    return True
+                moved: int | str = block.values.pop(offset)
+                self.length -= 1
+                self._rebalance(previous_block, block)
+                self.add_new_head(moved)
+                return True
+        return False
+
+    def rotate(self, steps: int = 1) -> Node | None:
+        """rotate the list to the right, last steps nodes move to the front
+
+        Negative steps rotate to the left. Only the block at the cut point is split.
+
+        Args:
+            steps (int, optional): number of steps to rotate. Defaults to 1.
+
+        Returns:
+            Node | None: new head node
+        """
+        if self.length < 2:
+            return self.get_head_node()
+        steps %= self.length
+        if steps == 0:
+            return self.get_head_node()
+        previous_block, block, offset = self._locate(self.length - steps)
+        if offset:
+            new_head_block: Block = Block(block.values[offset:], block.next_block)
+            del block.values[offset:]
+            new_tail_block: Block = block
+            if block is self._tail_block:
+                self._tail_block = new_head_block
+        else:
+            new_head_block = block
+            new_tail_block = previous_block
+        self._tail_block.next_block = self._head_block
+        new_tail_block.next_block = None
+        self._head_block = new_head_block
+        self._tail_block = new_tail_block
+        self._rebalance(None, new_head_block)
+        return self.get_head_node()
+
+    def sort(self, key: Callable[[int | str], object] | None = None, reverse: bool = False) -> None:
+        """sort the list in place, stable, and repack values into full blocks
+
+        Values are sorted as one python list first, so the list is unchanged
+        if key or a comparison raises.
+
+        Args:
+            key (Callable[[int | str], object] | None, optional): computes the value to
+            compare from node value. Defaults to None.
+            reverse (bool, optional): sort in descending order. Defaults to False.
+        """
+        self._replace_values(sorted(self, key=key, reverse=reverse))
+
+    def apply_permutation(self, order: Sequence[int]) -> bool:
+        """reorder values so that new index i holds the value which was at index order[i]
+
+        Args:
+            order (Sequence[int]): permutation of range(length)
+
+        Returns:
+            bool: True if values were reordered, False if order is not a permutation
+        """
+        length: int = self.length
+        if len(order) != length:
+            return False
+        seen: bytearray = bytearray(length)
+        for index in order:
+            if not 0 <= index < length or seen[index]:
+                return False
+            seen[index] = 1
+        values: list[int | str] = self.as_list()
+        self._replace_values(values[index] for index in order)
+        return True
@@ -0,0 +1,363 @@
+"""
+UnrolledLinkedList class unit tests
+
+- __init__
+    - create empty list if no value is provided
+    - create list with provided value as head node
+    - raise ValueError if capacity is below 2
+
+- from_iterable / extend / extend_left
+    - link values in given order
+    - return number of added nodes
+    - fill blocks up to capacity
+
+- add_new_head / append_node
+    - add node at the start / end of the list
+    - return node holding the given value
+
+- insert_at_index / remove_at_index
+    - insert / remove value at index, negative index also works
+    - split full blocks and merge blocks below half of capacity
+    - return None if index out of range
+
+- remove_node
+    - return None if node with given value not found
+    - remove first node with given value
+
+- access_node_by_index / __getitem__
+    - return node or value at index, negative index also works
+    - return None / raise IndexError if index out of range
+    - return new list for a slice
+
+- update_at_index / swap_nodes
+    - update value in place, return None if index out of range
+    - swap first values, return False if same values or value not present
+
+- remove_all / remove_if / remove_duplicates
+    - remove matching values in one pass, merge blocks which fit in one
+    - keep checked and unchecked values consistent when predicate raises
+
+- update_many / move_to_front / rotate / sort / apply_permutation
+    - same results as LinkedList, blocks stay within capacity
+
+- enable_index / disable_index / is_indexed
+    - keep the index flag
+
+- same results as LinkedList for the same operations
+
+"""
+
+import random
+
+import pytest
+
+from node import Node
+from linked_list import LinkedList
+from unrolled_linked_list import UnrolledLinkedList
+
+
+def block_sizes(linked_list: UnrolledLinkedList) -> list[int]:
+    """number of values in every block of the list
+    """
+    return [len(block.values) for _, block in linked_list._iter_blocks()]
+
+
+# __init__()
+
+def test_empty_list() -> None:
+    """create empty list if no value is provided
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList()
+    assert linked_list.get_head_node() is None
+    assert linked_list.get_tail_node() is None
+    assert linked_list.get_length() == 0
+    assert linked_list.as_list() == []
+
+def test_head_node_value() -> None:
+    """create list with provided value as head node
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList(123)
+    head_node = linked_list.get_head_node()
+    assert isinstance(head_node, Node)
+    assert head_node.get_value() == 123
+    assert linked_list.as_list() == [123]
+
+def test_invalid_capacity() -> None:
+    """raise ValueError if capacity is below 2
+    """
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(capacity=1)
+
+
+# from_iterable() / extend() / extend_left()
+
+def test_bulk_order() -> None:
+    """link values in given order
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(x for x in [3, 4])
+    linked_list.extend([5, 6])
+    linked_list.extend_left([1, 2])
+    assert linked_list.as_list() == [1, 2, 3, 4, 5, 6]
+    assert linked_list.get_tail_node().get_value() == 6
+    empty: UnrolledLinkedList = UnrolledLinkedList()
+    empty.extend_left(['a', 'b'])
+    empty.append_node('c')
+    assert empty.as_list() == ['a', 'b', 'c']
+
+def test_bulk_count() -> None:
+    """return number of added nodes
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList()
+    assert linked_list.extend(range(4)) == 4
+    assert linked_list.extend_left([]) == 0
+    assert linked_list.extend_left('ab') == 2
+    assert len(linked_list) == 6
+
+def test_bulk_fills_blocks() -> None:
+    """fill blocks up to capacity
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(range(10), capacity=4)
+    assert block_sizes(linked_list) == [4, 4, 2]
+
+
+# add_new_head() / append_node()
+
+def test_add_nodes() -> None:
+    """add node at the start / end of the list
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList(capacity=2)
+    linked_list.append_node(2)
+    linked_list.add_new_head(1)
+    linked_list.append_node(3)
+    linked_list.add_new_head(0)
+    assert linked_list.as_list() == [0, 1, 2, 3]
+    assert linked_list.get_head_node().get_value() == 0
+    assert linked_list.get_tail_node().get_value() == 3
+
+def test_return_added_node() -> None:
+    """return node holding the given value
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList()
+    assert linked_list.append_node('a').get_value() == 'a'
+    assert linked_list.add_new_head('b').get_value() == 'b'
+
+
+# insert_at_index() / remove_at_index()
+
+def test_insert_remove_at_index() -> None:
+    """insert / remove value at index, negative index also works
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable([1, 3])
+    assert linked_list.insert_at_index(1, 2).get_value() == 2
+    assert linked_list.insert_at_index(3, 4).get_value() == 4
+    assert linked_list.insert_at_index(-4, 0).get_value() == 0
+    assert linked_list.as_list() == [0, 1, 2, 3, 4]
+    assert linked_list.remove_at_index(-1).get_value() == 4
+    assert linked_list.remove_at_index(0).get_value() == 0
+    assert linked_list.as_list() == [1, 2, 3]
+    assert linked_list.get_length() == 3
+
+def test_split_and_merge_blocks() -> None:
+    """split full blocks and merge blocks below half of capacity
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(range(4), capacity=4)
+    linked_list.insert_at_index(1, 'x')
+    assert block_sizes(linked_list) == [3, 2]
+    assert linked_list.as_list() == [0, 'x', 1, 2, 3]
+    linked_list.remove_at_index(0)
+    linked_list.remove_at_index(0)
+    assert block_sizes(linked_list) == [3]
+    assert linked_list.as_list() == [1, 2, 3]
+
+def test_index_out_of_range() -> None:
+    """return None if index out of range
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable([1, 2])
+    assert linked_list.insert_at_index(3, 'x') is None
+    assert linked_list.insert_at_index(-3, 'x') is None
+    assert linked_list.remove_at_index(2) is None
+    assert UnrolledLinkedList().remove_at_index(0) is None
+    assert linked_list.as_list() == [1, 2]
+
+
+# remove_node()
+
+def test_remove_not_found() -> None:
+    """return None if node with given value not found
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable([1, 2])
+    assert linked_list.remove_node(3) is None
+    assert UnrolledLinkedList().remove_node(3) is None
+
+def test_remove_node() -> None:
+    """remove first node with given value
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(
+        [1, 2, 3, 2, 4], capacity=2)
+    assert linked_list.remove_node(2).get_value() == 2
+    assert linked_list.as_list() == [1, 3, 2, 4]
+    for value in (1, 4, 3, 2):
+        linked_list.remove_node(value)
+    assert linked_list.as_list() == []
+    assert linked_list.get_tail_node() is None
+
+
+# access_node_by_index() / __getitem__()
+
+def test_access_by_index() -> None:
+    """return node or value at index, negative index also works
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable('abcde', capacity=2)
+    assert linked_list.access_node_by_index(3).get_value() == 'd'
+    assert linked_list.access_node_by_index(-1).get_value() == 'e'
+    assert linked_list[0] == 'a'
+    assert linked_list[-5] == 'a'
+
+def test_access_out_of_range() -> None:
+    """return None / raise IndexError if index out of range
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(['a', 'b'])
+    assert linked_list.access_node_by_index(2) is None
+    assert linked_list.access_node_by_index(-3) is None
+    with pytest.raises(IndexError):
+        linked_list[2]
+
+def test_slice() -> None:
+    """return new list for a slice
+    """
+    values: list[int] = list(range(8))
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(values, capacity=3)
+    for index in (slice(1, 6, 2), slice(None, None, -1), slice(6, 1, -3)):
+        result = linked_list[index]
+        assert isinstance(result, UnrolledLinkedList)
+        assert result.as_list() == values[index]
+
+
+# update_at_index() / swap_nodes()
+
+def test_update_at_index() -> None:
+    """update value in place, return None if index out of range
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(['a', 'b'])
+    assert linked_list.update_at_index(1, 'B').get_value() == 'B'
+    assert linked_list.update_at_index(-2, 'A').get_value() == 'A'
+    assert linked_list.update_at_index(2, 'c') is None
+    assert linked_list.as_list() == ['A', 'B']
+
+def test_swap_nodes() -> None:
+    """swap first values, return False if same values or value not present
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(
+        [0, 1, 2, 1, 3], capacity=2)
+    assert linked_list.swap_nodes(2, 2) is False
+    assert linked_list.swap_nodes(2, 7) is False
+    assert linked_list.swap_nodes(3, 1) is True
+    assert linked_list.as_list() == [0, 3, 2, 1, 1]
+
+
+# remove_all() / remove_if() / remove_duplicates()
+
+def test_bulk_remove() -> None:
+    """remove matching values in one pass, merge blocks which fit in one
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(range(32), capacity=4)
+    assert linked_list.remove_if(lambda value: value % 4 != 0) == 24
+    assert linked_list.as_list() == [0, 4, 8, 12, 16, 20, 24, 28]
+    assert block_sizes(linked_list) == [4, 4]
+    assert linked_list.get_tail_node().get_value() == 28
+    assert linked_list.remove_all([0, 28, 99]) == 2
+    assert linked_list.remove_all([]) == 0
+    assert linked_list.get_tail_node().get_value() == 24
+    duplicates: UnrolledLinkedList = UnrolledLinkedList.from_iterable([1, 2, 1, 3, 2, 1],
+                                                                      capacity=2)
+    assert duplicates.remove_duplicates() == 3
+    assert duplicates.as_list() == [1, 2, 3]
+    assert block_sizes(duplicates) == [2, 1]
+    assert duplicates.remove_if(lambda value: True) == 3
+    assert duplicates.get_head_node() is None
+    assert duplicates.get_tail_node() is None
+
+def test_remove_if_predicate_raises() -> None:
+    """keep checked and unchecked values consistent when predicate raises
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(range(10), capacity=3)
+
+    def predicate(value: int | str) -> bool:
+        if value == 7:
+            raise ValueError(value)
+        return value == 6
+
+    with pytest.raises(ValueError):
+        linked_list.remove_if(predicate)
+    assert linked_list.as_list() == [0, 1, 2, 3, 4, 5, 7, 8, 9]
+    assert linked_list.get_length() == 9
+    assert sum(block_sizes(linked_list)) == 9
+
+
+# update_many() / move_to_front() / rotate() / sort() / apply_permutation()
+
+def test_reorder_same_as_linked_list() -> None:
+    """same results as LinkedList, blocks stay within capacity
+    """
+    rng: random.Random = random.Random(17)
+    values: list[int] = [rng.randrange(10) for _ in range(30)]
+    linked_list: LinkedList = LinkedList.from_iterable(values)
+    unrolled_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable(values, capacity=4)
+    for _ in range(300):
+        name, args = rng.choice([
+            ("update_many", ([(rng.randrange(-35, 35), rng.randrange(10))],)),
+            ("update_many", ({0: rng.randrange(10), -1: rng.randrange(10)},)),
+            ("move_to_front", (rng.randrange(11),)), ("rotate", (rng.randrange(-40, 40),)),
+            ("sort", (rng.choice([None, lambda value: value % 3]), rng.random() < 0.5)),
+            ("apply_permutation", (rng.sample(range(30), 30),)),
+            ("apply_permutation", ([0] * 30,)),
+        ])
+        result = getattr(linked_list, name)(*args)
+        unrolled_result = getattr(unrolled_list, name)(*args)
+        if isinstance(result, Node):
+            assert unrolled_result.get_value() == result.get_value()
+        else:
+            assert unrolled_result == result
+        assert unrolled_list.as_list() == linked_list.as_list()
+        assert unrolled_list.get_tail_node().get_value() == linked_list.get_tail_node().get_value()
+        assert all(0 < size <= 4 for size in block_sizes(unrolled_list))
+
+
+# enable_index() / disable_index() / is_indexed()
+
+def test_index_flag() -> None:
+    """keep the index flag
+    """
+    linked_list: UnrolledLinkedList = UnrolledLinkedList.from_iterable([1, 2], indexed=True)
+    assert linked_list.is_indexed() is True
+    linked_list.disable_index()
+    assert linked_list.is_indexed() is False
+    linked_list.enable_index()
+    assert linked_list.is_indexed() is True
+    assert UnrolledLinkedList().is_indexed() is False
+
+
+# parity with LinkedList
+
+def test_same_as_linked_list() -> None:
+    """same results as LinkedList for the same operations
+    """
+    rng: random.Random = random.Random(15)
+    linked_list: LinkedList = LinkedList()
+    unrolled_list: UnrolledLinkedList = UnrolledLinkedList(capacity=4)
+    for _ in range(500):
+        value: int = rng.randrange(20)
+        name, args = rng.choice([
+            ("append_node", (value,)), ("add_new_head", (value,)), ("remove_node", (value,)),
+            ("extend", ([value, value + 1],)), ("extend_left", ([value],)),
+            ("update_at_index", (rng.randrange(-5, 5), value)),
+            ("swap_nodes", (value, rng.randrange(20))),
+        ])
+        result = getattr(linked_list, name)(*args)
+        unrolled_result = getattr(unrolled_list, name)(*args)
+        if isinstance(result, Node):
+            assert unrolled_result.get_value() == result.get_value()
+        else:
+            assert unrolled_result == result
+        assert unrolled_list.as_list() == linked_list.as_list()
+        assert unrolled_list.get_length() == linked_list.get_length()